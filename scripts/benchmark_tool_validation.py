@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark of tool argument validation.
+
+Compares the ways a tool's arguments can be validated: the MCP SDK's
+`jsonschema.validate`, which checks the schema itself and builds a new validator
+on every call; the compiled validator FastMCP caches per tool; and the pydantic
+validators that function tools use to call their function, in lax and strict
+mode. It then measures end-to-end tool calls through an in-memory client with
+strict input validation on and off.
+
+Run with `uv run python scripts/benchmark_tool_validation.py`.
+"""
+
+import asyncio
+import time
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+import jsonschema
+from pydantic import TypeAdapter
+
+from fastmcp import Client, FastMCP
+from fastmcp.tools.tool import Tool
+from fastmcp.utilities.call_plan import CallPlan
+
+ARGUMENTS = {"a": 1, "b": "text", "c": 2.5}
+
+
+def add(a: int, b: str = "", c: float = 1.0) -> str:
+    return f"{a}{b}{c}"
+
+
+def report(name: str, seconds: float, number: int) -> None:
+    print(f"{name:<42} {seconds / number * 1e6:>10.2f} µs/call")
+
+
+def bench(name: str, fn: Callable[[], Any], number: int) -> None:
+    report(name, timeit.timeit(fn, number=number), number)
+
+
+async def bench_calls(strict: bool, number: int) -> None:
+    mcp = FastMCP(strict_input_validation=strict)
+    mcp.tool(add)
+    async with Client(mcp) as client:
+        await client.call_tool("add", ARGUMENTS)
+        start = time.perf_counter()
+        for _ in range(number):
+            await client.call_tool("add", ARGUMENTS)
+        elapsed = time.perf_counter() - start
+    report(f"call_tool, strict_input_validation={strict}", elapsed, number)
+
+
+def main() -> None:
+    tool = Tool.from_function(add)
+    schema = tool.parameters
+    adapter = TypeAdapter(add)
+    validator = adapter.validator
+
+    bench(
+        "jsonschema.validate (MCP SDK)",
+        lambda: jsonschema.validate(ARGUMENTS, schema),
+        2_000,
+    )
+    bench(
+        "compiled JSON schema validator", lambda: tool.validate_input(ARGUMENTS), 20_000
+    )
+    bench(
+        "TypeAdapter.validate_python",
+        lambda: adapter.validate_python(ARGUMENTS),
+        200_000,
+    )
+    bench(
+        "compiled pydantic-core validator",
+        lambda: validator.validate_python(ARGUMENTS),
+        200_000,
+    )
+    plan = CallPlan.from_function(add)
+    bench(
+        "strict pydantic-core arguments validator",
+        lambda: plan.validate_arguments(ARGUMENTS, strict=True),
+        200_000,
+    )
+    asyncio.run(bench_calls(strict=True, number=1_000))
+    asyncio.run(bench_calls(strict=False, number=1_000))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ import asyncio
 import copy
 import datetime
 import secrets
+from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import AsyncExitStack, asynccontextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -74,6 +75,7 @@ __all__ = [
 logger = get_logger(__name__)
 
 T = TypeVar("T", bound="ClientTransport")
+PageT = TypeVar("PageT", bound=mcp.types.PaginatedResult)
 
 
 @dataclass
@@ -532,11 +534,40 @@ class Client(Generic[ClientTransportT]):
         """Send a roots/list_changed notification."""
         await self.session.send_roots_list_changed()
 
+    async def _iter_pages(
+        self, list_page: Callable[..., Awaitable[PageT]]
+    ) -> AsyncIterator[PageT]:
+        """Request the pages of a paginated listing, following `nextCursor` until
+        the server reports no further pages. Stops early if the server hands out a
+        cursor it has already returned, which would otherwise loop forever.
+        """
+        seen_cursors: set[str] = set()
+        cursor: str | None = None
+        while True:
+            page = await list_page(cursor=cursor)
+            yield page
+            cursor = page.nextCursor
+            if not cursor:
+                break
+            if cursor in seen_cursors:
+                logger.warning(
+                    f"[{self.name}] Server repeated pagination cursor {cursor!r}; "
+                    "stopping the listing"
+                )
+                break
+            seen_cursors.add(cursor)
+
     # --- Resources ---
 
-    async def list_resources_mcp(self) -> mcp.types.ListResourcesResult:
+    async def list_resources_mcp(
+        self, cursor: str | None = None
+    ) -> mcp.types.ListResourcesResult:
         """Send a resources/list request and return the complete MCP protocol result.
 
+        Args:
+            cursor (str | None, optional): The cursor returned as `nextCursor` by the
+                previous page. Defaults to None, which requests the first page.
+
         Returns:
             mcp.types.ListResourcesResult: The complete response object from the protocol,
                 containing the list of resources and any additional metadata.
@@ -546,11 +577,12 @@ class Client(Generic[ClientTransportT]):
         """
         logger.debug(f"[{self.name}] called list_resources")
 
-        result = await self.session.list_resources()
+        result = await self.session.list_resources(cursor=cursor)
         return result
 
     async def list_resources(self) -> list[mcp.types.Resource]:
-        """Retrieve a list of resources available on the server.
+        """Retrieve a list of resources available on the server, following the
+        server's pagination cursors until every page has been fetched.
 
         Returns:
             list[mcp.types.Resource]: A list of Resource objects.
@@ -558,14 +590,31 @@ class Client(Generic[ClientTransportT]):
         Raises:
             RuntimeError: If called while the client is not connected.
         """
-        result = await self.list_resources_mcp()
-        return result.resources
+        return [item async for item in self.iter_resources()]
+
+    async def iter_resources(self) -> AsyncIterator[mcp.types.Resource]:
+        """Iterate over the resources available on the server, requesting further
+        pages from the server as they are needed.
+
+        Yields:
+            mcp.types.Resource: Resource objects, in the order the server lists them.
+
+        Raises:
+            RuntimeError: If called while the client is not connected.
+        """
+        async for page in self._iter_pages(self.list_resources_mcp):
+            for item in page.resources:
+                yield item
 
     async def list_resource_templates_mcp(
-        self,
+        self, cursor: str | None = None
     ) -> mcp.types.ListResourceTemplatesResult:
         """Send a resources/listResourceTemplates request and return the complete MCP protocol result.
 
+        Args:
+            cursor (str | None, optional): The cursor returned as `nextCursor` by the
+                previous page. Defaults to None, which requests the first page.
+
         Returns:
             mcp.types.ListResourceTemplatesResult: The complete response object from the protocol,
                 containing the list of resource templates and any additional metadata.
@@ -575,13 +624,14 @@ class Client(Generic[ClientTransportT]):
         """
         logger.debug(f"[{self.name}] called list_resource_templates")
 
-        result = await self.session.list_resource_templates()
+        result = await self.session.list_resource_templates(cursor=cursor)
         return result
 
     async def list_resource_templates(
         self,
     ) -> list[mcp.types.ResourceTemplate]:
-        """Retrieve a list of resource templates available on the server.
+        """Retrieve a list of resource templates available on the server, following the
+        server's pagination cursors until every page has been fetched.
 
         Returns:
             list[mcp.types.ResourceTemplate]: A list of ResourceTemplate objects.
@@ -589,8 +639,23 @@ class Client(Generic[ClientTransportT]):
         Raises:
             RuntimeError: If called while the client is not connected.
         """
-        result = await self.list_resource_templates_mcp()
-        return result.resourceTemplates
+        return [item async for item in self.iter_resource_templates()]
+
+    async def iter_resource_templates(
+        self,
+    ) -> AsyncIterator[mcp.types.ResourceTemplate]:
+        """Iterate over the resource templates available on the server, requesting further
+        pages from the server as they are needed.
+
+        Yields:
+            mcp.types.ResourceTemplate: ResourceTemplate objects, in the order the server lists them.
+
+        Raises:
+            RuntimeError: If called while the client is not connected.
+        """
+        async for page in self._iter_pages(self.list_resource_templates_mcp):
+            for item in page.resourceTemplates:
+                yield item
 
     async def read_resource_mcp(
         self, uri: AnyUrl | str
@@ -653,9 +718,15 @@ class Client(Generic[ClientTransportT]):
 
     # --- Prompts ---
 
-    async def list_prompts_mcp(self) -> mcp.types.ListPromptsResult:
+    async def list_prompts_mcp(
+        self, cursor: str | None = None
+    ) -> mcp.types.ListPromptsResult:
         """Send a prompts/list request and return the complete MCP protocol result.
 
+        Args:
+            cursor (str | None, optional): The cursor returned as `nextCursor` by the
+                previous page. Defaults to None, which requests the first page.
+
         Returns:
             mcp.types.ListPromptsResult: The complete response object from the protocol,
                 containing the list of prompts and any additional metadata.
@@ -665,11 +736,12 @@ class Client(Generic[ClientTransportT]):
         """
         logger.debug(f"[{self.name}] called list_prompts")
 
-        result = await self.session.list_prompts()
+        result = await self.session.list_prompts(cursor=cursor)
         return result
 
     async def list_prompts(self) -> list[mcp.types.Prompt]:
-        """Retrieve a list of prompts available on the server.
+        """Retrieve a list of prompts available on the server, following the
+        server's pagination cursors until every page has been fetched.
 
         Returns:
             list[mcp.types.Prompt]: A list of Prompt objects.
@@ -677,8 +749,21 @@ class Client(Generic[ClientTransportT]):
         Raises:
             RuntimeError: If called while the client is not connected.
         """
-        result = await self.list_prompts_mcp()
-        return result.prompts
+        return [item async for item in self.iter_prompts()]
+
+    async def iter_prompts(self) -> AsyncIterator[mcp.types.Prompt]:
+        """Iterate over the prompts available on the server, requesting further
+        pages from the server as they are needed.
+
+        Yields:
+            mcp.types.Prompt: Prompt objects, in the order the server lists them.
+
+        Raises:
+            RuntimeError: If called while the client is not connected.
+        """
+        async for page in self._iter_pages(self.list_prompts_mcp):
+            for item in page.prompts:
+                yield item
 
     # --- Prompt ---
     async def get_prompt_mcp(
@@ -783,9 +868,15 @@ class Client(Generic[ClientTransportT]):
 
     # --- Tools ---
 
-    async def list_tools_mcp(self) -> mcp.types.ListToolsResult:
+    async def list_tools_mcp(
+        self, cursor: str | None = None
+    ) -> mcp.types.ListToolsResult:
         """Send a tools/list request and return the complete MCP protocol result.
 
+        Args:
+            cursor (str | None, optional): The cursor returned as `nextCursor` by the
+                previous page. Defaults to None, which requests the first page.
+
         Returns:
             mcp.types.ListToolsResult: The complete response object from the protocol,
                 containing the list of tools and any additional metadata.
@@ -795,11 +886,12 @@ class Client(Generic[ClientTransportT]):
         """
         logger.debug(f"[{self.name}] called list_tools")
 
-        result = await self.session.list_tools()
+        result = await self.session.list_tools(cursor=cursor)
         return result
 
     async def list_tools(self) -> list[mcp.types.Tool]:
-        """Retrieve a list of tools available on the server.
+        """Retrieve a list of tools available on the server, following the
+        server's pagination cursors until every page has been fetched.
 
         Returns:
             list[mcp.types.Tool]: A list of Tool objects.
@@ -807,8 +899,21 @@ class Client(Generic[ClientTransportT]):
         Raises:
             RuntimeError: If called while the client is not connected.
         """
-        result = await self.list_tools_mcp()
-        return result.tools
+        return [item async for item in self.iter_tools()]
+
+    async def iter_tools(self) -> AsyncIterator[mcp.types.Tool]:
+        """Iterate over the tools available on the server, requesting further
+        pages from the server as they are needed.
+
+        Yields:
+            mcp.types.Tool: Tool objects, in the order the server lists them.
+
+        Raises:
+            RuntimeError: If called while the client is not connected.
+        """
+        async for page in self._iter_pages(self.list_tools_mcp):
+            for item in page.tools:
+                yield item
 
     # --- Call Tool ---
 
@@ -919,6 +1024,55 @@ class Client(Generic[ClientTransportT]):
             is_error=result.isError,
         )
 
+    async def call_tool_batch(
+        self,
+        name: str,
+        arguments: list[dict[str, Any]],
+        timeout: datetime.timedelta | float | int | None = None,
+        progress_handler: ProgressHandler | None = None,
+    ) -> list[CallToolResult]:
+        """Call a tool once for each set of arguments.
+
+        The calls are sent concurrently over the client's session, so a server
+        tool with a batch function runs them in as few batches as possible.
+        Unlike call_tool, a call that results in an error doesn't raise; its
+        result has `is_error` set instead.
+
+        Args:
+            name (str): The name of the tool to call.
+            arguments (list[dict[str, Any]]): The arguments of each call.
+            timeout (datetime.timedelta | float | int | None, optional): The timeout for each call. Defaults to None.
+            progress_handler (ProgressHandler | None, optional): The progress handler to use for the calls. Defaults to None.
+
+        Returns:
+            list[CallToolResult]: The result of each call, in the order of `arguments`.
+
+        Raises:
+            RuntimeError: If called while the client is not connected.
+        """
+        results: list[CallToolResult | None] = [None] * len(arguments)
+        errors: list[Exception] = []
+
+        async def call(index: int, tool_arguments: dict[str, Any]) -> None:
+            try:
+                results[index] = await self.call_tool(
+                    name,
+                    tool_arguments,
+                    timeout=timeout,
+                    progress_handler=progress_handler,
+                    raise_on_error=False,
+                )
+            except Exception as e:
+                errors.append(e)
+
+        async with anyio.create_task_group() as tg:
+            for index, tool_arguments in enumerate(arguments):
+                tg.start_soon(call, index, tool_arguments)
+
+        if errors:
+            raise errors[0]
+        return cast(list[CallToolResult], results)
+
     @classmethod
     def generate_name(cls, name: str | None = None) -> str:
         class_name = cls.__name__
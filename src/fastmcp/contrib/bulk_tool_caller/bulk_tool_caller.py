@@ -77,13 +77,16 @@ class BulkToolCaller(MCPMixin):
         """
         results = []
 
-        for tool_call in tool_calls:
-            result = await self._call_tool(tool_call.tool, tool_call.arguments)
+        async with Client(self.connection) as client:
+            for tool_call in tool_calls:
+                result = await self._call_tool(
+                    client, tool_call.tool, tool_call.arguments
+                )
 
-            results.append(result)
+                results.append(result)
 
-            if result.isError and not continue_on_error:
-                return results
+                if result.isError and not continue_on_error:
+                    return results
 
         return results
 
@@ -103,31 +106,53 @@ class BulkToolCaller(MCPMixin):
             tool: The name of the tool to call.
             tool_arguments: A list of dictionaries, where each dictionary contains the arguments for an individual run of the tool.
         """
-        results = []
+        async with Client(self.connection) as client:
+            if continue_on_error and await self._is_batchable(client, tool):
+                # a batchable tool runs calls that arrive together as one batch
+                batch_results = await client.call_tool_batch(tool, tool_arguments)
+                return [
+                    CallToolRequestResult(
+                        tool=tool,
+                        arguments=arguments,
+                        isError=result.is_error,
+                        content=result.content,
+                    )
+                    for arguments, result in zip(tool_arguments, batch_results)
+                ]
 
-        for tool_call_arguments in tool_arguments:
-            result = await self._call_tool(tool, tool_call_arguments)
+            results = []
 
-            results.append(result)
+            for tool_call_arguments in tool_arguments:
+                result = await self._call_tool(client, tool, tool_call_arguments)
 
-            if result.isError and not continue_on_error:
-                return results
+                results.append(result)
 
-        return results
+                if result.isError and not continue_on_error:
+                    return results
+
+            return results
+
+    async def _is_batchable(self, client: Client, tool: str) -> bool:
+        """
+        Whether the tool has a batch function, which the server advertises in
+        its FastMCP meta.
+        """
+        for listed_tool in await client.list_tools():
+            if listed_tool.name == tool:
+                return bool((listed_tool.meta or {}).get("_fastmcp", {}).get("batch"))
+        return False
 
     async def _call_tool(
-        self, tool: str, arguments: dict[str, Any]
+        self, client: Client, tool: str, arguments: dict[str, Any]
     ) -> CallToolRequestResult:
         """
         Helper method to call a tool with the provided arguments.
         """
+        result = await client.call_tool_mcp(name=tool, arguments=arguments)
 
-        async with Client(self.connection) as client:
-            result = await client.call_tool_mcp(name=tool, arguments=arguments)
-
-            return CallToolRequestResult(
-                tool=tool,
-                arguments=arguments,
-                isError=result.isError,
-                content=result.content,
-            )
+        return CallToolRequestResult(
+            tool=tool,
+            arguments=arguments,
+            isError=result.isError,
+            content=result.content,
+        )
@@ -314,6 +314,7 @@ class FastMCPOpenAPI(FastMCP):
 
         # Register the tool by directly assigning to the tools dictionary
         self._tool_manager._tools[final_tool_name] = tool
+        self._tool_manager._invalidate()
 
     def _create_openapi_resource(
         self,
@@ -364,6 +365,7 @@ class FastMCPOpenAPI(FastMCP):
 
         # Register the resource by directly assigning to the resources dictionary
         self._resource_manager._resources[final_resource_uri] = resource
+        self._resource_manager._invalidate()
 
     def _create_openapi_template(
         self,
@@ -443,6 +445,7 @@ class FastMCPOpenAPI(FastMCP):
 
         # Register the template by directly assigning to the templates dictionary
         self._resource_manager._templates[final_template_uri] = template
+        self._resource_manager._invalidate()
 
 
 # Export public symbols
@@ -6,17 +6,19 @@ import inspect
 import json
 from abc import ABC, abstractmethod
 from collections.abc import Awaitable, Callable, Sequence
-from typing import Any
+from typing import Any, ClassVar
 
 import pydantic_core
 from mcp.types import ContentBlock, PromptMessage, Role, TextContent
 from mcp.types import Prompt as MCPPrompt
 from mcp.types import PromptArgument as MCPPromptArgument
-from pydantic import Field, TypeAdapter
+from pydantic import Field, PrivateAttr, TypeAdapter
 
 from fastmcp.exceptions import PromptError
 from fastmcp.server.dependencies import get_context
+from fastmcp.utilities.call_plan import CallPlan
 from fastmcp.utilities.components import FastMCPComponent
+from fastmcp.utilities.executors import Executor
 from fastmcp.utilities.json_schema import compress_schema
 from fastmcp.utilities.logging import get_logger
 from fastmcp.utilities.types import (
@@ -65,6 +67,10 @@ class PromptArgument(FastMCPBaseModel):
 class Prompt(FastMCPComponent, ABC):
     """A prompt template that can be rendered with parameters."""
 
+    _listing_fields: ClassVar[frozenset[str]] = FastMCPComponent._listing_fields | {
+        "arguments"
+    }
+
     arguments: list[PromptArgument] | None = Field(
         default=None, description="Arguments that can be passed to the prompt"
     )
@@ -117,6 +123,7 @@ class Prompt(FastMCPComponent, ABC):
         description: str | None = None,
         tags: set[str] | None = None,
         enabled: bool | None = None,
+        executor: Executor | None = None,
         meta: dict[str, Any] | None = None,
     ) -> FunctionPrompt:
         """Create a Prompt from a function.
@@ -134,6 +141,7 @@ class Prompt(FastMCPComponent, ABC):
             description=description,
             tags=tags,
             enabled=enabled,
+            executor=executor,
             meta=meta,
         )
 
@@ -151,6 +159,25 @@ class FunctionPrompt(Prompt):
 
     fn: Callable[..., PromptResult | Awaitable[PromptResult]]
 
+    executor: Executor | None = Field(
+        default=None,
+        description="Where the prompt runs if it is synchronous. If None, the server's executor is used.",
+    )
+
+    _call_plan: CallPlan | None = PrivateAttr(default=None)
+
+    def _get_call_plan(self) -> CallPlan:
+        """
+        Returns the call plan of `fn`, rebuilding it if `fn` or `executor` has
+        been replaced.
+        """
+        plan = self._call_plan
+        if plan is None or plan.fn is not self.fn or plan.executor != self.executor:
+            plan = self._call_plan = CallPlan.from_function(
+                self.fn, validate=False, executor=self.executor
+            )
+        return plan
+
     @classmethod
     def from_function(
         cls,
@@ -160,6 +187,7 @@ class FunctionPrompt(Prompt):
         description: str | None = None,
         tags: set[str] | None = None,
         enabled: bool | None = None,
+        executor: Executor | None = None,
         meta: dict[str, Any] | None = None,
     ) -> FunctionPrompt:
         """Create a Prompt from a function.
@@ -247,30 +275,31 @@ class FunctionPrompt(Prompt):
                     )
                 )
 
-        return cls(
+        prompt = cls(
             name=func_name,
             title=title,
             description=description,
             arguments=arguments,
             tags=tags or set(),
             enabled=enabled if enabled is not None else True,
+            executor=executor,
             fn=fn,
             meta=meta,
         )
+        prompt._get_call_plan()
+        return prompt
 
     def _convert_string_arguments(self, kwargs: dict[str, Any]) -> dict[str, Any]:
         """Convert string arguments to expected types based on function signature."""
-        from fastmcp.server.context import Context
-
-        sig = inspect.signature(self.fn)
+        plan = self._get_call_plan()
         converted_kwargs = {}
 
         # Find context parameter name if any
-        context_param_name = find_kwarg_by_type(self.fn, kwarg_type=Context)
+        context_param_name = plan.context_kwarg
 
         for param_name, param_value in kwargs.items():
-            if param_name in sig.parameters:
-                param = sig.parameters[param_name]
+            if param_name in plan.parameters:
+                param = plan.parameters[param_name]
 
                 # Skip Context parameters - they're handled separately
                 if param_name == context_param_name:
@@ -317,8 +346,6 @@ class FunctionPrompt(Prompt):
         arguments: dict[str, Any] | None = None,
     ) -> list[PromptMessage]:
         """Render the prompt with arguments."""
-        from fastmcp.server.context import Context
-
         # Validate required arguments
         if self.arguments:
             required = {arg.name for arg in self.arguments if arg.required}
@@ -328,19 +355,11 @@ class FunctionPrompt(Prompt):
                 raise ValueError(f"Missing required arguments: {missing}")
 
         try:
-            # Prepare arguments with context
-            kwargs = arguments.copy() if arguments else {}
-            context_kwarg = find_kwarg_by_type(self.fn, kwarg_type=Context)
-            if context_kwarg and context_kwarg not in kwargs:
-                kwargs[context_kwarg] = get_context()
-
             # Convert string arguments to expected types when needed
-            kwargs = self._convert_string_arguments(kwargs)
+            kwargs = self._convert_string_arguments(arguments or {})
 
-            # Call function and check if result is a coroutine
-            result = self.fn(**kwargs)
-            if inspect.isawaitable(result):
-                result = await result
+            # Call function with context injected, awaiting it if needed
+            result = await self._get_call_plan().call(kwargs)
 
             # Validate messages
             if not isinstance(result, list | tuple):
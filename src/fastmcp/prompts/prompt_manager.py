@@ -10,7 +10,9 @@ from fastmcp import settings
 from fastmcp.exceptions import NotFoundError, PromptError
 from fastmcp.prompts.prompt import FunctionPrompt, Prompt, PromptResult
 from fastmcp.settings import DuplicateBehavior
+from fastmcp.utilities.components import next_generation
 from fastmcp.utilities.logging import get_logger
+from fastmcp.utilities.mounts import load_from_mounted_servers
 
 if TYPE_CHECKING:
     from fastmcp.server.server import MountedServer
@@ -30,6 +32,15 @@ class PromptManager:
         self._mounted_servers: list[MountedServer] = []
         self.mask_error_details = mask_error_details or settings.mask_error_details
 
+        # The merged inventory is cached and reused until this manager, or any
+        # manager in its mount tree, takes a new generation.
+        self._generation = next_generation()
+        self._inventory_cache: tuple[Any, dict[str, Prompt]] | None = None
+
+        # Called whenever the inventory of this manager, or of a server mounted
+        # on it, changes
+        self._change_listeners: list[Callable[[], None]] = []
+
         # Default to "warn" if None is provided
         if duplicate_behavior is None:
             duplicate_behavior = "warn"
@@ -45,6 +56,52 @@ class PromptManager:
     def mount(self, server: MountedServer) -> None:
         """Adds a mounted server as a source for prompts."""
         self._mounted_servers.append(server)
+        server.server._prompt_manager._add_change_listener(self._notify_change)
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        """Mark anything cached from this manager, or from any manager it is mounted on, as stale."""
+        self._generation = next_generation()
+        self._notify_change()
+
+    def _add_change_listener(self, listener: Callable[[], None]) -> None:
+        """Call `listener` whenever the inventory of this manager, or of a server mounted on it, changes."""
+        self._change_listeners.append(listener)
+
+    def _notify_change(self) -> None:
+        for listener in self._change_listeners:
+            listener()
+
+    def _inventory_version(self) -> tuple[Any, ...] | None:
+        """
+        Returns a value that changes whenever the unfiltered inventory of this
+        manager could have changed, or None if the inventory cannot be cached
+        (e.g. because it depends on a remote server).
+        """
+        versions: list[Any] = [self._generation]
+        for mounted in self._mounted_servers:
+            child_version = mounted.server._prompt_manager._inventory_version()
+            if child_version is None:
+                return None
+            versions.append(child_version)
+        return tuple(versions)
+
+    async def _get_inventory(self) -> dict[str, Prompt]:
+        """
+        Returns the unfiltered inventory, rebuilding it only if something in the
+        mount tree has changed. The returned dict is shared and must not be mutated.
+        """
+        version = self._inventory_version()
+        if version is not None:
+            if self._inventory_cache and self._inventory_cache[0] == version:
+                return self._inventory_cache[1]
+
+        prompts = await self._load_prompts(via_server=False)
+        if version is not None:
+            for prompt in prompts.values():
+                prompt._add_owner(self)
+            self._inventory_cache = (version, prompts)
+        return prompts
 
     async def _load_prompts(self, *, via_server: bool = False) -> dict[str, Prompt]:
         """
@@ -54,35 +111,34 @@ class PromptManager:
         - via_server=False: Manager-to-manager path for complete, unfiltered inventory
         - via_server=True: Server-to-server path for filtered MCP requests
         """
-        all_prompts: dict[str, Prompt] = {}
 
-        for mounted in self._mounted_servers:
-            try:
-                if via_server:
-                    # Use the server-to-server filtered path
-                    child_results = await mounted.server._list_prompts()
-                else:
-                    # Use the manager-to-manager unfiltered path
-                    child_results = await mounted.server._prompt_manager.list_prompts()
-
-                # The combination logic is the same for both paths
-                child_dict = {p.key: p for p in child_results}
-                if mounted.prefix:
-                    for prompt in child_dict.values():
-                        prefixed_prompt = prompt.model_copy(
-                            key=f"{mounted.prefix}_{prompt.key}"
-                        )
-                        all_prompts[prefixed_prompt.key] = prefixed_prompt
-                else:
-                    all_prompts.update(child_dict)
-            except Exception as e:
-                # Skip failed mounts silently, matches existing behavior
-                logger.warning(
-                    f"Failed to get prompts from server: {mounted.server.name!r}, mounted at: {mounted.prefix!r}: {e}"
-                )
-                if settings.mounted_components_raise_on_load_error:
-                    raise
-                continue
+        async def load_mounted(mounted: MountedServer) -> dict[str, Prompt]:
+            if via_server:
+                # Use the server-to-server filtered path
+                child_results = await mounted.server._list_prompts()
+            else:
+                # Use the manager-to-manager unfiltered path
+                child_results = (
+                    await mounted.server._prompt_manager._get_inventory()
+                ).values()
+
+            # The combination logic is the same for both paths
+            child_dict = {p.key: p for p in child_results}
+            if mounted.prefix:
+                return {
+                    f"{mounted.prefix}_{prompt.key}": prompt.model_copy(
+                        key=f"{mounted.prefix}_{prompt.key}"
+                    )
+                    for prompt in child_dict.values()
+                }
+            return child_dict
+
+        # Mounted servers are queried concurrently but merged in mount order
+        all_prompts: dict[str, Prompt] = {}
+        for child_prompts in await load_from_mounted_servers(
+            self._mounted_servers, load_mounted, "prompts"
+        ):
+            all_prompts.update(child_prompts)
 
         # Finally, add local prompts, which always take precedence
         all_prompts.update(self._prompts)
@@ -90,12 +146,12 @@ class PromptManager:
 
     async def has_prompt(self, key: str) -> bool:
         """Check if a prompt exists."""
-        prompts = await self.get_prompts()
+        prompts = await self._get_inventory()
         return key in prompts
 
     async def get_prompt(self, key: str) -> Prompt:
         """Get prompt by key."""
-        prompts = await self.get_prompts()
+        prompts = await self._get_inventory()
         if key in prompts:
             return prompts[key]
         raise NotFoundError(f"Unknown prompt: {key}")
@@ -104,7 +160,7 @@ class PromptManager:
         """
         Gets the complete, unfiltered inventory of all prompts.
         """
-        return await self._load_prompts(via_server=False)
+        return dict(await self._get_inventory())
 
     async def list_prompts(self) -> list[Prompt]:
         """
@@ -135,6 +191,8 @@ class PromptManager:
 
     def add_prompt(self, prompt: Prompt) -> Prompt:
         """Add a prompt to the manager."""
+        prompt._add_owner(self)
+        self._invalidate()
         # Check for duplicates
         existing = self._prompts.get(prompt.key)
         if existing:
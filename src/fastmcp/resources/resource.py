@@ -5,7 +5,7 @@ from __future__ import annotations
 import abc
 import inspect
 from collections.abc import Callable
-from typing import TYPE_CHECKING, Annotated, Any
+from typing import TYPE_CHECKING, Annotated, Any, ClassVar
 
 import pydantic_core
 from mcp.types import Annotations
@@ -14,6 +14,7 @@ from pydantic import (
     AnyUrl,
     ConfigDict,
     Field,
+    PrivateAttr,
     UrlConstraints,
     field_validator,
     model_validator,
@@ -21,10 +22,9 @@ from pydantic import (
 from typing_extensions import Self
 
 from fastmcp.server.dependencies import get_context
+from fastmcp.utilities.call_plan import CallPlan
 from fastmcp.utilities.components import FastMCPComponent
-from fastmcp.utilities.types import (
-    find_kwarg_by_type,
-)
+from fastmcp.utilities.executors import Executor
 
 if TYPE_CHECKING:
     pass
@@ -35,6 +35,12 @@ class Resource(FastMCPComponent, abc.ABC):
 
     model_config = ConfigDict(validate_default=True)
 
+    _listing_fields: ClassVar[frozenset[str]] = FastMCPComponent._listing_fields | {
+        "uri",
+        "mime_type",
+        "annotations",
+    }
+
     uri: Annotated[AnyUrl, UrlConstraints(host_required=False)] = Field(
         default=..., description="URI of the resource"
     )
@@ -75,6 +81,7 @@ class Resource(FastMCPComponent, abc.ABC):
         mime_type: str | None = None,
         tags: set[str] | None = None,
         enabled: bool | None = None,
+        executor: Executor | None = None,
         annotations: Annotations | None = None,
         meta: dict[str, Any] | None = None,
     ) -> FunctionResource:
@@ -87,6 +94,7 @@ class Resource(FastMCPComponent, abc.ABC):
             mime_type=mime_type,
             tags=tags,
             enabled=enabled,
+            executor=executor,
             annotations=annotations,
             meta=meta,
         )
@@ -162,6 +170,25 @@ class FunctionResource(Resource):
 
     fn: Callable[..., Any]
 
+    executor: Executor | None = Field(
+        default=None,
+        description="Where the resource runs if it is synchronous. If None, the server's executor is used.",
+    )
+
+    _call_plan: CallPlan | None = PrivateAttr(default=None)
+
+    def _get_call_plan(self) -> CallPlan:
+        """
+        Returns the call plan of `fn`, rebuilding it if `fn` or `executor` has
+        been replaced.
+        """
+        plan = self._call_plan
+        if plan is None or plan.fn is not self.fn or plan.executor != self.executor:
+            plan = self._call_plan = CallPlan.from_function(
+                self.fn, validate=False, executor=self.executor
+            )
+        return plan
+
     @classmethod
     def from_function(
         cls,
@@ -173,13 +200,14 @@ class FunctionResource(Resource):
         mime_type: str | None = None,
         tags: set[str] | None = None,
         enabled: bool | None = None,
+        executor: Executor | None = None,
         annotations: Annotations | None = None,
         meta: dict[str, Any] | None = None,
     ) -> FunctionResource:
         """Create a FunctionResource from a function."""
         if isinstance(uri, str):
             uri = AnyUrl(uri)
-        return cls(
+        resource = cls(
             fn=fn,
             uri=uri,
             name=name or fn.__name__,
@@ -188,22 +216,16 @@ class FunctionResource(Resource):
             mime_type=mime_type or "text/plain",
             tags=tags or set(),
             enabled=enabled if enabled is not None else True,
+            executor=executor,
             annotations=annotations,
             meta=meta,
         )
+        resource._get_call_plan()
+        return resource
 
     async def read(self) -> str | bytes:
         """Read the resource by calling the wrapped function."""
-        from fastmcp.server.context import Context
-
-        kwargs = {}
-        context_kwarg = find_kwarg_by_type(self.fn, kwarg_type=Context)
-        if context_kwarg is not None:
-            kwargs[context_kwarg] = get_context()
-
-        result = self.fn(**kwargs)
-        if inspect.isawaitable(result):
-            result = await result
+        result = await self._get_call_plan().call({})
 
         if isinstance(result, Resource):
             return await result.read()
@@ -14,10 +14,12 @@ from fastmcp.exceptions import NotFoundError, ResourceError
 from fastmcp.resources.resource import Resource
 from fastmcp.resources.template import (
     ResourceTemplate,
-    match_uri_template,
+    URITemplateRouter,
 )
 from fastmcp.settings import DuplicateBehavior
+from fastmcp.utilities.components import next_generation
 from fastmcp.utilities.logging import get_logger
+from fastmcp.utilities.mounts import load_from_mounted_servers
 
 if TYPE_CHECKING:
     from fastmcp.server.server import MountedServer
@@ -46,6 +48,19 @@ class ResourceManager:
         self._mounted_servers: list[MountedServer] = []
         self.mask_error_details = mask_error_details or settings.mask_error_details
 
+        # Merged inventories (and the router for templates) are cached and reused
+        # until this manager, or any manager in its mount tree, takes a new generation.
+        self._generation = next_generation()
+        self._resource_cache: tuple[Any, dict[str, Resource]] | None = None
+        self._template_cache: (
+            tuple[Any, dict[str, ResourceTemplate], URITemplateRouter] | None
+        ) = None
+        self._local_template_router: tuple[int, URITemplateRouter] | None = None
+
+        # Called whenever the inventory of this manager, or of a server mounted
+        # on it, changes
+        self._change_listeners: list[Callable[[], None]] = []
+
         # Default to "warn" if None is provided
         if duplicate_behavior is None:
             duplicate_behavior = "warn"
@@ -60,14 +75,108 @@ class ResourceManager:
     def mount(self, server: MountedServer) -> None:
         """Adds a mounted server as a source for resources and templates."""
         self._mounted_servers.append(server)
+        server.server._resource_manager._add_change_listener(self._notify_change)
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        """Mark the cached inventories of this manager, and of any manager it is mounted on, as stale."""
+        self._generation = next_generation()
+        self._notify_change()
+
+    def _add_change_listener(self, listener: Callable[[], None]) -> None:
+        """Call `listener` whenever the inventory of this manager, or of a server mounted on it, changes."""
+        self._change_listeners.append(listener)
+
+    def _notify_change(self) -> None:
+        for listener in self._change_listeners:
+            listener()
+
+    def _inventory_version(self) -> tuple[Any, ...] | None:
+        """
+        Returns a value that changes whenever the unfiltered inventory of this
+        manager could have changed, or None if the inventory cannot be cached
+        (e.g. because it depends on a remote server).
+        """
+        versions: list[Any] = [self._generation]
+        for mounted in self._mounted_servers:
+            child_version = mounted.server._resource_manager._inventory_version()
+            if child_version is None:
+                return None
+            versions.append(child_version)
+        return tuple(versions)
+
+    async def _get_resource_inventory(self) -> dict[str, Resource]:
+        """
+        Returns the unfiltered resource inventory, rebuilding it only if something
+        in the mount tree has changed. The returned dict is shared and must not be
+        mutated.
+        """
+        version = self._inventory_version()
+        if (
+            version is not None
+            and self._resource_cache
+            and self._resource_cache[0] == version
+        ):
+            return self._resource_cache[1]
+
+        resources = await self._load_resources(via_server=False)
+        if version is not None:
+            for resource in resources.values():
+                resource._add_owner(self)
+            self._resource_cache = (version, resources)
+        return resources
+
+    async def _get_template_inventory(self) -> dict[str, ResourceTemplate]:
+        """
+        Returns the unfiltered template inventory, rebuilding it only if something
+        in the mount tree has changed. The returned dict is shared and must not be
+        mutated.
+        """
+        templates, _ = await self._get_templates_and_router()
+        return templates
+
+    async def _get_templates_and_router(
+        self,
+    ) -> tuple[dict[str, ResourceTemplate], URITemplateRouter]:
+        version = self._inventory_version()
+        if (
+            version is not None
+            and self._template_cache
+            and self._template_cache[0] == version
+        ):
+            return self._template_cache[1], self._template_cache[2]
+
+        templates = await self._build_template_inventory()
+        router = URITemplateRouter(templates)
+        if version is not None:
+            for template in templates.values():
+                template._add_owner(self)
+            self._template_cache = (version, templates, router)
+        return templates, router
+
+    async def _build_template_inventory(self) -> dict[str, ResourceTemplate]:
+        """Builds the unfiltered template inventory from scratch."""
+        return await self._load_resource_templates(via_server=False)
+
+    def _get_local_template_router(self) -> URITemplateRouter:
+        """Returns a router over this manager's own templates."""
+        if (
+            self._local_template_router is None
+            or self._local_template_router[0] != self._generation
+        ):
+            self._local_template_router = (
+                self._generation,
+                URITemplateRouter(self._templates),
+            )
+        return self._local_template_router[1]
 
     async def get_resources(self) -> dict[str, Resource]:
         """Get all registered resources, keyed by URI."""
-        return await self._load_resources(via_server=False)
+        return dict(await self._get_resource_inventory())
 
     async def get_resource_templates(self) -> dict[str, ResourceTemplate]:
         """Get all registered templates, keyed by URI template."""
-        return await self._load_resource_templates(via_server=False)
+        return dict(await self._get_template_inventory())
 
     async def _load_resources(self, *, via_server: bool = False) -> dict[str, Resource]:
         """
@@ -77,46 +186,44 @@ class ResourceManager:
         - via_server=False: Manager-to-manager path for complete, unfiltered inventory
         - via_server=True: Server-to-server path for filtered MCP requests
         """
-        all_resources: dict[str, Resource] = {}
 
-        for mounted in self._mounted_servers:
-            try:
-                if via_server:
-                    # Use the server-to-server filtered path
-                    child_resources_list = await mounted.server._list_resources()
-                    child_resources = {
-                        resource.key: resource for resource in child_resources_list
-                    }
-                else:
-                    # Use the manager-to-manager unfiltered path
-                    child_resources = (
-                        await mounted.server._resource_manager.get_resources()
-                    )
+        async def load_mounted(mounted: MountedServer) -> dict[str, Resource]:
+            if via_server:
+                # Use the server-to-server filtered path
+                child_resources_list = await mounted.server._list_resources()
+                child_resources = {
+                    resource.key: resource for resource in child_resources_list
+                }
+            else:
+                # Use the manager-to-manager unfiltered path
+                child_resources = (
+                    await mounted.server._resource_manager._get_resource_inventory()
+                )
 
-                # Apply prefix if needed
-                if mounted.prefix:
-                    from fastmcp.server.server import add_resource_prefix
+            # Apply prefix if needed
+            if not mounted.prefix:
+                return child_resources
 
-                    for uri, resource in child_resources.items():
-                        prefixed_uri = add_resource_prefix(
-                            uri, mounted.prefix, mounted.resource_prefix_format
-                        )
-                        # Create a copy of the resource with the prefixed key and name
-                        prefixed_resource = resource.model_copy(
-                            update={"name": f"{mounted.prefix}_{resource.name}"},
-                            key=prefixed_uri,
-                        )
-                        all_resources[prefixed_uri] = prefixed_resource
-                else:
-                    all_resources.update(child_resources)
-            except Exception as e:
-                # Skip failed mounts silently, matches existing behavior
-                logger.warning(
-                    f"Failed to get resources from server: {mounted.server.name!r}, mounted at: {mounted.prefix!r}: {e}"
+            from fastmcp.server.server import add_resource_prefix
+
+            prefixed_resources: dict[str, Resource] = {}
+            for uri, resource in child_resources.items():
+                prefixed_uri = add_resource_prefix(
+                    uri, mounted.prefix, mounted.resource_prefix_format
                 )
-                if settings.mounted_components_raise_on_load_error:
-                    raise
-                continue
+                # Create a copy of the resource with the prefixed key and name
+                prefixed_resources[prefixed_uri] = resource.model_copy(
+                    update={"name": f"{mounted.prefix}_{resource.name}"},
+                    key=prefixed_uri,
+                )
+            return prefixed_resources
+
+        # Mounted servers are queried concurrently but merged in mount order
+        all_resources: dict[str, Resource] = {}
+        for child_resources in await load_from_mounted_servers(
+            self._mounted_servers, load_mounted, "resources"
+        ):
+            all_resources.update(child_resources)
 
         # Finally, add local resources, which always take precedence
         all_resources.update(self._resources)
@@ -132,44 +239,42 @@ class ResourceManager:
         - via_server=False: Manager-to-manager path for complete, unfiltered inventory
         - via_server=True: Server-to-server path for filtered MCP requests
         """
-        all_templates: dict[str, ResourceTemplate] = {}
-
-        for mounted in self._mounted_servers:
-            try:
-                if via_server:
-                    # Use the server-to-server filtered path
-                    child_templates = await mounted.server._list_resource_templates()
-                else:
-                    # Use the manager-to-manager unfiltered path
-                    child_templates = (
-                        await mounted.server._resource_manager.list_resource_templates()
-                    )
-                child_dict = {template.key: template for template in child_templates}
-
-                # Apply prefix if needed
-                if mounted.prefix:
-                    from fastmcp.server.server import add_resource_prefix
 
-                    for uri_template, template in child_dict.items():
-                        prefixed_uri_template = add_resource_prefix(
-                            uri_template, mounted.prefix, mounted.resource_prefix_format
-                        )
-                        # Create a copy of the template with the prefixed key and name
-                        prefixed_template = template.model_copy(
-                            update={"name": f"{mounted.prefix}_{template.name}"},
-                            key=prefixed_uri_template,
-                        )
-                        all_templates[prefixed_uri_template] = prefixed_template
-                else:
-                    all_templates.update(child_dict)
-            except Exception as e:
-                # Skip failed mounts silently, matches existing behavior
-                logger.warning(
-                    f"Failed to get templates from server: {mounted.server.name!r}, mounted at: {mounted.prefix!r}: {e}"
+        async def load_mounted(mounted: MountedServer) -> dict[str, ResourceTemplate]:
+            if via_server:
+                # Use the server-to-server filtered path
+                child_templates = await mounted.server._list_resource_templates()
+            else:
+                # Use the manager-to-manager unfiltered path
+                child_templates = (
+                    await mounted.server._resource_manager._get_template_inventory()
+                ).values()
+            child_dict = {template.key: template for template in child_templates}
+
+            # Apply prefix if needed
+            if not mounted.prefix:
+                return child_dict
+
+            from fastmcp.server.server import add_resource_prefix
+
+            prefixed_templates: dict[str, ResourceTemplate] = {}
+            for uri_template, template in child_dict.items():
+                prefixed_uri_template = add_resource_prefix(
+                    uri_template, mounted.prefix, mounted.resource_prefix_format
                 )
-                if settings.mounted_components_raise_on_load_error:
-                    raise
-                continue
+                # Create a copy of the template with the prefixed key and name
+                prefixed_templates[prefixed_uri_template] = template.model_copy(
+                    update={"name": f"{mounted.prefix}_{template.name}"},
+                    key=prefixed_uri_template,
+                )
+            return prefixed_templates
+
+        # Mounted servers are queried concurrently but merged in mount order
+        all_templates: dict[str, ResourceTemplate] = {}
+        for child_templates in await load_from_mounted_servers(
+            self._mounted_servers, load_mounted, "templates"
+        ):
+            all_templates.update(child_templates)
 
         # Finally, add local templates, which always take precedence
         all_templates.update(self._templates)
@@ -285,6 +390,8 @@ class ResourceManager:
                 will be used as the storage key. To overwrite it, call
                 Resource.model_copy(key=new_key) before calling this method.
         """
+        resource._add_owner(self)
+        self._invalidate()
         existing = self._resources.get(resource.key)
         if existing:
             if self.duplicate_behavior == "warn":
@@ -338,6 +445,8 @@ class ResourceManager:
             The added template. If a template with the same URI already exists,
             returns the existing template.
         """
+        template._add_owner(self)
+        self._invalidate()
         existing = self._templates.get(template.key)
         if existing:
             if self.duplicate_behavior == "warn":
@@ -357,17 +466,13 @@ class ResourceManager:
         uri_str = str(uri)
 
         # First check concrete resources (local and mounted)
-        resources = await self.get_resources()
+        resources = await self._get_resource_inventory()
         if uri_str in resources:
             return True
 
         # Then check templates (local and mounted) only if not found in concrete resources
-        templates = await self.get_resource_templates()
-        for template_key in templates.keys():
-            if match_uri_template(uri_str, template_key):
-                return True
-
-        return False
+        _, router = await self._get_templates_and_router()
+        return router.match(uri_str) is not None
 
     async def get_resource(self, uri: AnyUrl | str) -> Resource:
         """Get resource by URI, checking concrete resources first, then templates.
@@ -382,35 +487,36 @@ class ResourceManager:
         logger.debug("Getting resource", extra={"uri": uri_str})
 
         # First check concrete resources (local and mounted)
-        resources = await self.get_resources()
+        resources = await self._get_resource_inventory()
         if resource := resources.get(uri_str):
             return resource
 
-        # Then check templates (local and mounted) - use the utility function to match against storage keys
-        templates = await self.get_resource_templates()
-        for storage_key, template in templates.items():
-            # Try to match against the storage key (which might be a custom key)
-            if params := match_uri_template(uri_str, storage_key):
-                try:
-                    return await template.create_resource(
-                        uri_str,
-                        params=params,
-                    )
-                # Pass through ResourceErrors as-is
-                except ResourceError as e:
-                    logger.error(f"Error creating resource from template: {e}")
-                    raise e
-                # Handle other exceptions
-                except Exception as e:
-                    logger.error(f"Error creating resource from template: {e}")
-                    if self.mask_error_details:
-                        # Mask internal details
-                        raise ValueError("Error creating resource from template") from e
-                    else:
-                        # Include original error details
-                        raise ValueError(
-                            f"Error creating resource from template: {e}"
-                        ) from e
+        # Then check templates (local and mounted), matching against storage keys
+        # (which might be custom keys)
+        templates, router = await self._get_templates_and_router()
+        if match := router.match(uri_str):
+            storage_key, params = match
+            template = templates[storage_key]
+            try:
+                return await template.create_resource(
+                    uri_str,
+                    params=params,
+                )
+            # Pass through ResourceErrors as-is
+            except ResourceError as e:
+                logger.error(f"Error creating resource from template: {e}")
+                raise e
+            # Handle other exceptions
+            except Exception as e:
+                logger.error(f"Error creating resource from template: {e}")
+                if self.mask_error_details:
+                    # Mask internal details
+                    raise ValueError("Error creating resource from template") from e
+                else:
+                    # Include original error details
+                    raise ValueError(
+                        f"Error creating resource from template: {e}"
+                    ) from e
 
         raise NotFoundError(f"Unknown resource: {uri_str}")
 
@@ -448,28 +554,25 @@ class ResourceManager:
                     ) from e
 
         # 1b. Check local templates if not found in concrete resources
-        for key, template in self._templates.items():
-            if params := match_uri_template(uri_str, key):
-                try:
-                    resource = await template.create_resource(uri_str, params=params)
-                    return await resource.read()
-                except ResourceError as e:
-                    logger.exception(
-                        f"Error reading resource from template {uri_str!r}"
-                    )
-                    raise e
-                except Exception as e:
-                    logger.exception(
+        if match := self._get_local_template_router().match(uri_str):
+            key, params = match
+            template = self._templates[key]
+            try:
+                resource = await template.create_resource(uri_str, params=params)
+                return await resource.read()
+            except ResourceError as e:
+                logger.exception(f"Error reading resource from template {uri_str!r}")
+                raise e
+            except Exception as e:
+                logger.exception(f"Error reading resource from template {uri_str!r}")
+                if self.mask_error_details:
+                    raise ResourceError(
                         f"Error reading resource from template {uri_str!r}"
-                    )
-                    if self.mask_error_details:
-                        raise ResourceError(
-                            f"Error reading resource from template {uri_str!r}"
-                        ) from e
-                    else:
-                        raise ResourceError(
-                            f"Error reading resource from template {uri_str!r}: {e}"
-                        ) from e
+                    ) from e
+                else:
+                    raise ResourceError(
+                        f"Error reading resource from template {uri_str!r}: {e}"
+                    ) from e
 
         # 2. Check mounted servers using the filtered protocol path.
         from fastmcp.server.server import has_resource_prefix, remove_resource_prefix
@@ -4,21 +4,25 @@ from __future__ import annotations
 
 import inspect
 import re
-from collections.abc import Callable
-from typing import Any
+from collections.abc import Callable, Iterable
+from functools import lru_cache
+from typing import Any, ClassVar
 from urllib.parse import unquote
 
 from mcp.types import Annotations
 from mcp.types import ResourceTemplate as MCPResourceTemplate
 from pydantic import (
     Field,
+    PrivateAttr,
     field_validator,
     validate_call,
 )
 
 from fastmcp.resources.resource import Resource
 from fastmcp.server.dependencies import get_context
+from fastmcp.utilities.call_plan import CallPlan
 from fastmcp.utilities.components import FastMCPComponent
+from fastmcp.utilities.executors import Executor
 from fastmcp.utilities.json_schema import compress_schema
 from fastmcp.utilities.types import (
     find_kwarg_by_type,
@@ -26,6 +30,7 @@ from fastmcp.utilities.types import (
 )
 
 
+@lru_cache(maxsize=5000)
 def build_regex(template: str) -> re.Pattern:
     parts = re.split(r"(\{[^}]+\})", template)
     pattern = ""
@@ -50,9 +55,74 @@ def match_uri_template(uri: str, uri_template: str) -> dict[str, str] | None:
     return None
 
 
+class _RouterNode:
+    __slots__ = ("children", "entries")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _RouterNode] = {}
+        self.entries: list[tuple[int, str, re.Pattern]] = []
+
+
+class URITemplateRouter:
+    """
+    Matches URIs against an ordered collection of URI templates.
+
+    Templates are indexed in a trie keyed on the literal path segments that
+    precede their first parameter, so a lookup walks the URI's segments once and
+    only tries the regexes of templates whose literal prefix matches. When several
+    templates match, the one that came first wins, exactly as if each template
+    had been tried in order with `match_uri_template`.
+    """
+
+    def __init__(self, uri_templates: Iterable[str]):
+        self._root = _RouterNode()
+        for index, uri_template in enumerate(uri_templates):
+            literal_prefix = uri_template.split("{", 1)[0]
+            node = self._root
+            # the last segment of the literal prefix may be followed by a
+            # parameter, so only complete segments are used as trie keys
+            for segment in literal_prefix.split("/")[:-1]:
+                node = node.children.setdefault(segment, _RouterNode())
+            node.entries.append((index, uri_template, build_regex(uri_template)))
+
+    def match(self, uri: str) -> tuple[str, dict[str, str]] | None:
+        """
+        Find the first template that matches the URI.
+
+        Returns:
+            A tuple of the matching template and the extracted parameters, or
+            None if no template matches.
+        """
+        candidates: list[tuple[int, str, re.Pattern]] = []
+        node = self._root
+        candidates.extend(node.entries)
+        for segment in uri.split("/"):
+            node = node.children.get(segment)
+            if node is None:
+                break
+            candidates.extend(node.entries)
+
+        if len(candidates) > 1:
+            candidates.sort(key=lambda candidate: candidate[0])
+
+        for _, uri_template, regex in candidates:
+            if match := regex.match(uri):
+                return uri_template, {
+                    k: unquote(v) for k, v in match.groupdict().items()
+                }
+        return None
+
+
 class ResourceTemplate(FastMCPComponent):
     """A template for dynamically creating resources."""
 
+    _listing_fields: ClassVar[frozenset[str]] = FastMCPComponent._listing_fields | {
+        "uri_template",
+        "mime_type",
+        "parameters",
+        "annotations",
+    }
+
     uri_template: str = Field(
         description="URI template with parameters (e.g. weather://{city}/current)"
     )
@@ -95,6 +165,7 @@ class ResourceTemplate(FastMCPComponent):
         mime_type: str | None = None,
         tags: set[str] | None = None,
         enabled: bool | None = None,
+        executor: Executor | None = None,
         annotations: Annotations | None = None,
         meta: dict[str, Any] | None = None,
     ) -> FunctionResourceTemplate:
@@ -107,6 +178,7 @@ class ResourceTemplate(FastMCPComponent):
             mime_type=mime_type,
             tags=tags,
             enabled=enabled,
+            executor=executor,
             annotations=annotations,
             meta=meta,
         )
@@ -194,20 +266,29 @@ class FunctionResourceTemplate(ResourceTemplate):
 
     fn: Callable[..., Any]
 
-    async def read(self, arguments: dict[str, Any]) -> str | bytes:
-        """Read the resource content."""
-        from fastmcp.server.context import Context
+    executor: Executor | None = Field(
+        default=None,
+        description="Where the template runs if it is synchronous. If None, the server's executor is used.",
+    )
 
-        # Add context to parameters if needed
-        kwargs = arguments.copy()
-        context_kwarg = find_kwarg_by_type(self.fn, kwarg_type=Context)
-        if context_kwarg and context_kwarg not in kwargs:
-            kwargs[context_kwarg] = get_context()
+    _call_plan: CallPlan | None = PrivateAttr(default=None)
 
-        result = self.fn(**kwargs)
-        if inspect.isawaitable(result):
-            result = await result
-        return result
+    def _get_call_plan(self) -> CallPlan:
+        """
+        Returns the call plan of `fn`, rebuilding it if `fn` or `executor` has
+        been replaced.
+        """
+        plan = self._call_plan
+        if plan is None or plan.fn is not self.fn or plan.executor != self.executor:
+            # `fn` is wrapped with validate_call, which validates the arguments
+            plan = self._call_plan = CallPlan.from_function(
+                self.fn, validate=False, executor=self.executor
+            )
+        return plan
+
+    async def read(self, arguments: dict[str, Any]) -> str | bytes:
+        """Read the resource content."""
+        return await self._get_call_plan().call(arguments)
 
     @classmethod
     def from_function(
@@ -220,6 +301,7 @@ class FunctionResourceTemplate(ResourceTemplate):
         mime_type: str | None = None,
         tags: set[str] | None = None,
         enabled: bool | None = None,
+        executor: Executor | None = None,
         annotations: Annotations | None = None,
         meta: dict[str, Any] | None = None,
     ) -> FunctionResourceTemplate:
@@ -296,7 +378,7 @@ class FunctionResourceTemplate(ResourceTemplate):
         # ensure the arguments are properly cast
         fn = validate_call(fn)
 
-        return cls(
+        template = cls(
             uri_template=uri_template,
             name=func_name,
             title=title,
@@ -306,6 +388,9 @@ class FunctionResourceTemplate(ResourceTemplate):
             parameters=parameters,
             tags=tags or set(),
             enabled=enabled if enabled is not None else True,
+            executor=executor,
             annotations=annotations,
             meta=meta,
         )
+        template._get_call_plan()
+        return template
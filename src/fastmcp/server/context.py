@@ -124,6 +124,7 @@ class Context:
         self._tokens: list[Token] = []
         self._notification_queue: set[str] = set()  # Dedupe notifications
         self._state: dict[str, Any] = {}
+        self._cancelled = False
 
     @property
     def fastmcp(self) -> FastMCP:
@@ -587,6 +588,32 @@ class Context:
         """Get a value from the context state. Returns None if the key is not found."""
         return self._state.get(key)
 
+    def is_cancelled(self) -> bool:
+        """
+        Whether the function handling the request was cancelled, because the
+        client cancelled the request or disconnected, or the tool timed out.
+
+        Async functions are interrupted when they are cancelled, but synchronous
+        functions running in worker threads can't be, so long-running sync tools
+        should check this periodically and return early once it is True.
+        """
+        return self._cancelled
+
+    def _cancel(self) -> None:
+        """Mark the request as cancelled."""
+        self._cancelled = True
+
+    def invalidate_tool_cache(self, key: str | None = None) -> None:
+        """
+        Remove the cached results of the tool with this key, or of all tools, so
+        their next calls run again. Only tools with a `cache_ttl` are cached.
+
+        Args:
+            key: The key of the tool, as the client sees it. If None, the results
+                of all tools are removed.
+        """
+        self.fastmcp._tool_manager.invalidate_cache(key)
+
     def _queue_tool_list_changed(self) -> None:
         """Queue a tool list changed notification."""
         self._notification_queue.add("notifications/tools/list_changed")
@@ -0,0 +1,573 @@
+"""Response caching middleware for reducing repeated work in FastMCP servers."""
+
+from __future__ import annotations
+
+import base64
+import json
+import sqlite3
+import threading
+import time
+import weakref
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Collection
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+import anyio.to_thread
+import mcp.types as mt
+from mcp.server.lowlevel.helper_types import ReadResourceContents
+
+from fastmcp.tools.tool import ToolResult
+from fastmcp.tools.tool_cache import canonicalize_arguments
+
+from .middleware import CallNext, Middleware, MiddlewareContext
+
+if TYPE_CHECKING:
+    from fastmcp.server.server import FastMCP
+
+V = TypeVar("V")
+
+# The methods whose responses depend on each kind of component, so that a change
+# to one kind only invalidates its own responses
+_METHODS_BY_KIND: dict[str, tuple[str, ...]] = {
+    "tools": ("tools/list", "tools/call"),
+    "resources": ("resources/list", "resources/templates/list", "resources/read"),
+    "prompts": ("prompts/list", "prompts/get"),
+}
+
+
+@dataclass(frozen=True)
+class CacheBackendStats:
+    """
+    A point-in-time view of a cache backend.
+
+    Attributes:
+        entries: The number of cached responses
+        bytes: The total size of the cached responses
+        evictions: The number of responses this process evicted to stay within
+            the backend's bounds
+    """
+
+    entries: int
+    bytes: int
+    evictions: int
+
+
+@dataclass(frozen=True)
+class ResponseCacheStats:
+    """
+    A point-in-time view of a response cache.
+
+    Attributes:
+        entries: The number of cached responses, including listings
+        bytes: The total size of the cached responses, excluding listings
+        evictions: The number of responses evicted to stay within the bounds
+        hits: The number of requests answered from the cache
+        misses: The number of cacheable requests that had to be handled
+    """
+
+    entries: int
+    bytes: int
+    evictions: int
+    hits: int
+    misses: int
+
+
+class CacheBackend(ABC):
+    """
+    Storage for cached responses. Responses are stored as bytes, so that
+    backends can keep them outside of the process.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """Returns the response stored under `key`, or None if there is none or it expired."""
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store a response under `key` for `ttl` seconds."""
+
+    @abstractmethod
+    async def delete(self, prefix: str = "") -> None:
+        """Remove every response whose key starts with `prefix`."""
+
+    @abstractmethod
+    async def stats(self) -> CacheBackendStats:
+        """Returns the backend's current size."""
+
+
+class _LRUCache(Generic[V]):
+    """An in-process cache that expires entries and evicts the least recently used."""
+
+    def __init__(self, max_entries: int | None, max_bytes: int | None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Any, tuple[V, int, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Any) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[2] <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def set(self, key: Any, value: V, ttl: float, size: int = 0) -> None:
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (value, size, time.monotonic() + ttl)
+        self.bytes += size
+        while (
+            self.max_entries is not None and len(self._entries) > self.max_entries
+        ) or (self.max_bytes is not None and self.bytes > self.max_bytes):
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def delete(self, predicate: Callable[[Any], bool] | None = None) -> None:
+        for key in [k for k in self._entries if predicate is None or predicate(k)]:
+            self._remove(key)
+
+    def _remove(self, key: Any) -> None:
+        _, size, _ = self._entries.pop(key)
+        self.bytes -= size
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Keeps cached responses in this process, evicting the least recently used
+    ones to stay within `max_entries` and `max_bytes`.
+
+    Args:
+        max_entries: The maximum number of cached responses, or None for no limit
+        max_bytes: The maximum total size of the cached responses, or None for
+            no limit
+    """
+
+    def __init__(
+        self, max_entries: int | None = 1000, max_bytes: int | None = 50_000_000
+    ):
+        self._cache: _LRUCache[bytes] = _LRUCache(max_entries, max_bytes)
+
+    async def get(self, key: str) -> bytes | None:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._cache.set(key, value, ttl, size=len(value))
+
+    async def delete(self, prefix: str = "") -> None:
+        self._cache.delete(lambda key: key.startswith(prefix))
+
+    async def stats(self) -> CacheBackendStats:
+        return CacheBackendStats(
+            entries=len(self._cache),
+            bytes=self._cache.bytes,
+            evictions=self._cache.evictions,
+        )
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    Keeps cached responses in a SQLite database, so that the worker processes
+    of a server on one host share them. The database uses write-ahead logging,
+    which lets processes read while another one writes, and the least recently
+    used responses are evicted to stay within `max_entries` and `max_bytes`.
+
+    Args:
+        path: The database file, which is created if it doesn't exist
+        max_entries: The maximum number of cached responses, or None for no limit
+        max_bytes: The maximum total size of the cached responses, or None for
+            no limit
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_entries: int | None = 10_000,
+        max_bytes: int | None = 500_000_000,
+    ):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._evictions = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None, timeout=10
+        )
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, "
+                "expires_at REAL NOT NULL, used_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_used_at ON responses (used_at)"
+            )
+
+    async def get(self, key: str) -> bytes | None:
+        return await anyio.to_thread.run_sync(self._get, key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await anyio.to_thread.run_sync(self._set, key, value, ttl)
+
+    async def delete(self, prefix: str = "") -> None:
+        await anyio.to_thread.run_sync(self._delete, prefix)
+
+    async def stats(self) -> CacheBackendStats:
+        return await anyio.to_thread.run_sync(self._stats)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _get(self, key: str) -> bytes | None:
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._connection.execute(
+                "UPDATE responses SET used_at = ? WHERE key = ?", (now, key)
+            )
+            return row[0]
+
+    def _set(self, key: str, value: bytes, ttl: float) -> None:
+        if self.max_bytes is not None and len(value) > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            connection = self._connection
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                    (key, value, len(value), now + ttl, now),
+                )
+                connection.execute(
+                    "DELETE FROM responses WHERE expires_at <= ?", (now,)
+                )
+                entries, size = connection.execute(
+                    "SELECT count(*), coalesce(sum(size), 0) FROM responses"
+                ).fetchone()
+                while (self.max_entries is not None and entries > self.max_entries) or (
+                    self.max_bytes is not None and size > self.max_bytes
+                ):
+                    evicted_key, evicted_size = connection.execute(
+                        "SELECT key, size FROM responses ORDER BY used_at LIMIT 1"
+                    ).fetchone()
+                    connection.execute(
+                        "DELETE FROM responses WHERE key = ?", (evicted_key,)
+                    )
+                    entries -= 1
+                    size -= evicted_size
+                    self._evictions += 1
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+    def _delete(self, prefix: str) -> None:
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM responses WHERE substr(key, 1, ?) = ?",
+                (len(prefix), prefix),
+            )
+
+    def _stats(self) -> CacheBackendStats:
+        with self._lock:
+            entries, size = self._connection.execute(
+                "SELECT count(*), coalesce(sum(size), 0) FROM responses"
+            ).fetchone()
+        return CacheBackendStats(entries=entries, bytes=size, evictions=self._evictions)
+
+
+def _encode_resource_contents(contents: list[ReadResourceContents]) -> bytes:
+    return json.dumps(
+        [
+            {"mime_type": item.mime_type, "text": item.content}
+            if isinstance(item.content, str)
+            else {
+                "mime_type": item.mime_type,
+                "blob": base64.b64encode(item.content).decode(),
+            }
+            for item in contents
+        ]
+    ).encode()
+
+
+def _decode_resource_contents(value: bytes) -> list[ReadResourceContents]:
+    return [
+        ReadResourceContents(
+            content=item["text"] if "text" in item else base64.b64decode(item["blob"]),
+            mime_type=item["mime_type"],
+        )
+        for item in json.loads(value)
+    ]
+
+
+def _encode_tool_result(result: ToolResult) -> bytes:
+    return (
+        mt.CallToolResult(
+            content=result.content, structuredContent=result.structured_content
+        )
+        .model_dump_json(by_alias=True, exclude_none=True)
+        .encode()
+    )
+
+
+def _decode_tool_result(value: bytes) -> ToolResult:
+    result = mt.CallToolResult.model_validate_json(value)
+    return ToolResult(
+        content=result.content, structured_content=result.structuredContent
+    )
+
+
+def _call_params(name: str, arguments: dict[str, Any] | None) -> str:
+    return f"{name}\n{canonicalize_arguments(arguments or {})}"
+
+
+class ResponseCachingMiddleware(Middleware):
+    """Middleware that caches responses to repeated requests.
+
+    Caches the responses of list requests, `resources/read` and `prompts/get`,
+    and optionally `tools/call` for the tools named in `cached_tools`. Responses
+    are keyed by method, parameters and, if `get_client_id` is given, client,
+    and expire after `ttl` seconds. Whenever a tool, resource or prompt is
+    added, removed or changed, which is when the server sends a list_changed
+    notification, the cached responses for that kind of component are dropped.
+
+    Read, prompt and tool responses are stored in `backend`, which can be shared
+    by several worker processes. Listings are live components, so they are
+    always cached in this process.
+
+    Example:
+        ```python
+        from fastmcp.server.middleware.caching import (
+            ResponseCachingMiddleware,
+            SQLiteCacheBackend,
+        )
+
+        # Cache responses for 5 minutes, shared by all workers on this host,
+        # including the results of an idempotent tool
+        cache = ResponseCachingMiddleware(
+            ttl=300,
+            backend=SQLiteCacheBackend("/tmp/mcp-cache.db"),
+            cached_tools={"get_weather"},
+        )
+
+        mcp = FastMCP("MyServer")
+        mcp.add_middleware(cache)
+        ```
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        backend: CacheBackend | None = None,
+        cached_tools: Collection[str] = (),
+        get_client_id: Callable[[MiddlewareContext], str] | None = None,
+        max_listings: int = 1000,
+    ):
+        """Initialize response caching middleware.
+
+        Args:
+            ttl: How long, in seconds, a response is cached
+            backend: Where responses are stored. Defaults to a MemoryCacheBackend.
+            cached_tools: Keys of the tools whose calls are cached. Only list
+                idempotent tools whose results don't depend on the caller, unless
+                `get_client_id` is given.
+            get_client_id: Function to extract a client ID from context. If
+                given, each client has its own cached responses.
+            max_listings: The maximum number of listings cached in this process
+        """
+        self.ttl = ttl
+        self.backend = backend or MemoryCacheBackend()
+        self.cached_tools = frozenset(cached_tools)
+        self.get_client_id = get_client_id
+        self.hits = 0
+        self.misses = 0
+        self._listings: _LRUCache[list[Any]] = _LRUCache(max_listings, None)
+        # The kinds of components that changed since their responses were last
+        # dropped, for each server this middleware has handled requests for
+        self._changed: weakref.WeakKeyDictionary[FastMCP, set[str]] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    async def invalidate(self, method: str | None = None) -> None:
+        """
+        Drop cached responses.
+
+        Args:
+            method: Only drop the responses to this method, e.g. "resources/read".
+                If None, all responses are dropped.
+        """
+        if method is None:
+            self._listings.delete()
+            await self.backend.delete()
+        else:
+            self._listings.delete(lambda key: key[0] == method)
+            await self.backend.delete(f"{method}\n")
+
+    async def get_stats(self) -> ResponseCacheStats:
+        """Returns the cache's current size and hit rate."""
+        backend_stats = await self.backend.stats()
+        return ResponseCacheStats(
+            entries=backend_stats.entries + len(self._listings),
+            bytes=backend_stats.bytes,
+            evictions=backend_stats.evictions + self._listings.evictions,
+            hits=self.hits,
+            misses=self.misses,
+        )
+
+    async def on_list_tools(
+        self, context: MiddlewareContext, call_next: CallNext
+    ) -> Any:
+        return await self._cached_listing("tools", context, call_next)
+
+    async def on_list_resources(
+        self, context: MiddlewareContext, call_next: CallNext
+    ) -> Any:
+        return await self._cached_listing("resources", context, call_next)
+
+    async def on_list_resource_templates(
+        self, context: MiddlewareContext, call_next: CallNext
+    ) -> Any:
+        return await self._cached_listing("resources", context, call_next)
+
+    async def on_list_prompts(
+        self, context: MiddlewareContext, call_next: CallNext
+    ) -> Any:
+        return await self._cached_listing("prompts", context, call_next)
+
+    async def on_read_resource(
+        self, context: MiddlewareContext, call_next: CallNext
+    ) -> Any:
+        return await self._cached_response(
+            "resources",
+            str(context.message.uri),
+            context,
+            call_next,
+            _encode_resource_contents,
+            _decode_resource_contents,
+        )
+
+    async def on_get_prompt(
+        self, context: MiddlewareContext, call_next: CallNext
+    ) -> Any:
+        return await self._cached_response(
+            "prompts",
+            _call_params(context.message.name, context.message.arguments),
+            context,
+            call_next,
+            lambda result: result.model_dump_json(by_alias=True).encode(),
+            mt.GetPromptResult.model_validate_json,
+        )
+
+    async def on_call_tool(
+        self, context: MiddlewareContext, call_next: CallNext
+    ) -> Any:
+        if context.message.name not in self.cached_tools:
+            return await call_next(context)
+        return await self._cached_response(
+            "tools",
+            _call_params(context.message.name, context.message.arguments),
+            context,
+            call_next,
+            _encode_tool_result,
+            _decode_tool_result,
+        )
+
+    def _get_client_identifier(self, context: MiddlewareContext) -> str:
+        """Get client identifier for keying responses."""
+        if self.get_client_id:
+            return self.get_client_id(context)
+        return ""
+
+    def _watch(self, server: FastMCP) -> set[str]:
+        """
+        Returns the kinds of components of a server that changed since their
+        responses were last dropped, watching the server for changes from its
+        first request on. Its managers report every change that makes the
+        server send a list_changed notification, including changes in mounted
+        servers.
+        """
+        changed = self._changed.get(server)
+        if changed is None:
+            changed = self._changed[server] = set()
+            for kind, manager in (
+                ("tools", server._tool_manager),
+                ("resources", server._resource_manager),
+                ("prompts", server._prompt_manager),
+            ):
+                manager._add_change_listener(partial(changed.add, kind))
+        return changed
+
+    async def _drop_changed(self, kind: str, context: MiddlewareContext) -> None:
+        """
+        Drop the cached responses for a kind of component if any component of
+        that kind changed since the last request. Servers with remote components,
+        such as proxies, can't tell when those change, so their responses only
+        expire.
+        """
+        if context.fastmcp_context is None:
+            return
+        changed = self._watch(context.fastmcp_context.fastmcp)
+        if kind in changed:
+            changed.discard(kind)
+            for method in _METHODS_BY_KIND[kind]:
+                await self.invalidate(method)
+
+    async def _cached_listing(
+        self, kind: str, context: MiddlewareContext, call_next: CallNext
+    ) -> Any:
+        await self._drop_changed(kind, context)
+        key = (context.method, self._get_client_identifier(context))
+        listing = self._listings.get(key)
+        if listing is not None:
+            self.hits += 1
+            return list(listing)
+
+        self.misses += 1
+        listing = await call_next(context)
+        self._listings.set(key, list(listing), self.ttl)
+        return listing
+
+    async def _cached_response(
+        self,
+        kind: str,
+        params: str,
+        context: MiddlewareContext,
+        call_next: CallNext,
+        encode: Callable[[Any], bytes],
+        decode: Callable[[bytes], Any],
+    ) -> Any:
+        await self._drop_changed(kind, context)
+        key = f"{context.method}\n{self._get_client_identifier(context)}\n{params}"
+        value = await self.backend.get(key)
+        if value is not None:
+            self.hits += 1
+            return decode(value)
+
+        self.misses += 1
+        result = await call_next(context)
+        await self.backend.set(key, encode(result), self.ttl)
+        return result
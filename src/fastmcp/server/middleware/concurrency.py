@@ -0,0 +1,293 @@
+"""Concurrency limiting middleware for shedding load in overloaded FastMCP servers."""
+
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+import anyio
+from mcp import McpError
+from mcp.types import ErrorData
+
+from .middleware import CallNext, Middleware, MiddlewareContext
+from .rate_limiting import LimiterTable
+
+
+class OverloadedError(McpError):
+    """Error raised when a request is shed because the server is overloaded.
+
+    The error's data marks it as retryable, since the same request is likely to
+    succeed once the load has dropped.
+    """
+
+    def __init__(self, message: str = "Server overloaded, retry later"):
+        super().__init__(
+            ErrorData(code=-32000, message=message, data={"retryable": True})
+        )
+
+
+class AIMDLimit:
+    """Adaptive concurrency limit using additive increase, multiplicative decrease.
+
+    While requests complete faster than `latency_threshold` and the limit is
+    in use, it grows by one per request. When a request is slower, the server
+    is taken to be overloaded and the limit shrinks by `backoff_ratio`. The limit
+    converges just below the concurrency at which latency starts to suffer, in
+    the same way as Netflix's concurrency-limits.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 1000,
+        latency_threshold: float = 1.0,
+        backoff_ratio: float = 0.9,
+    ):
+        """Initialize AIMD limit.
+
+        Args:
+            initial_limit: The limit before any requests complete
+            min_limit: The limit never drops below this
+            max_limit: The limit never grows above this
+            latency_threshold: Seconds above which a request counts as a sign of
+                overload
+            backoff_ratio: What the limit is multiplied by on overload
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_threshold = latency_threshold
+        self.backoff_ratio = backoff_ratio
+        self._limit = float(initial_limit)
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def on_sample(self, latency: float, in_flight: int) -> None:
+        """Update the limit after a request completes.
+
+        Args:
+            latency: How long the request took, in seconds
+            in_flight: The number of requests in flight when it completed,
+                including itself
+        """
+        if latency > self.latency_threshold:
+            self._limit = max(self.min_limit, self._limit * self.backoff_ratio)
+        elif in_flight * 2 >= self._limit:
+            # only grow a limit that is actually being used
+            self._limit = min(self.max_limit, self._limit + 1)
+
+
+class ConcurrencyLimiter:
+    """Limits the number of requests in flight, queueing the rest in FIFO order.
+
+    Requests beyond the limit wait in a queue of at most `max_queue` requests,
+    for at most `queue_timeout` seconds. A request that finds the queue full, or
+    times out in it, is rejected with an `OverloadedError`.
+    """
+
+    def __init__(
+        self,
+        limit: int | AIMDLimit,
+        max_queue: int | None = 0,
+        queue_timeout: float | None = None,
+    ):
+        """Initialize concurrency limiter.
+
+        Args:
+            limit: The maximum number of requests in flight, or an adaptive limit
+            max_queue: The maximum number of requests waiting for a slot, or None
+                for no limit. With 0, requests beyond the limit are rejected
+                immediately.
+            queue_timeout: Seconds a request waits for a slot before it is
+                rejected, or None to wait indefinitely
+        """
+        self._limit = limit
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self.rejected = 0
+        self._waiters: deque[anyio.Event] = deque()
+
+    @property
+    def limit(self) -> int:
+        """The current maximum number of requests in flight."""
+        if isinstance(self._limit, AIMDLimit):
+            return self._limit.limit
+        return self._limit
+
+    @property
+    def queued(self) -> int:
+        """The number of requests waiting for a slot."""
+        return len(self._waiters)
+
+    async def acquire(self, description: str = "Server") -> None:
+        """Wait for a slot, or raise OverloadedError if none becomes available."""
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            return
+
+        if self.max_queue is not None and len(self._waiters) >= self.max_queue:
+            self.rejected += 1
+            raise OverloadedError(f"{description} overloaded, retry later")
+
+        granted = anyio.Event()
+        self._waiters.append(granted)
+        try:
+            with anyio.fail_after(self.queue_timeout):
+                await granted.wait()
+        except TimeoutError:
+            if granted.is_set():
+                # the slot was handed over just as the wait timed out
+                self.release()
+            else:
+                self._waiters.remove(granted)
+            self.rejected += 1
+            raise OverloadedError(f"{description} overloaded, retry later") from None
+        except BaseException:
+            if granted.is_set():
+                # the slot was handed over just as this request was cancelled
+                self.release()
+            else:
+                self._waiters.remove(granted)
+            raise
+
+    def release(self, latency: float | None = None) -> None:
+        """Free a slot, handing it to the next queued request.
+
+        Args:
+            latency: How long the request that held the slot took, which updates
+                an adaptive limit
+        """
+        if latency is not None and isinstance(self._limit, AIMDLimit):
+            self._limit.on_sample(latency, self.in_flight)
+        self.in_flight -= 1
+        while self._waiters and self.in_flight < self.limit:
+            self.in_flight += 1
+            self._waiters.popleft().set()
+
+
+class ConcurrencyLimitingMiddleware(Middleware):
+    """Middleware that limits how many requests are handled at once.
+
+    Unlike rate limiting, which counts requests as they arrive, this counts
+    requests in flight, so a burst of slow requests can't pile up without
+    bound. Limits apply globally, per method and per client; requests beyond a
+    limit wait in a bounded queue, and are rejected with a retryable
+    `OverloadedError` when the queue is full. The global limit can adapt to
+    observed latency with an `AIMDLimit`, which keeps latency stable under
+    overload by shedding the excess.
+
+    Example:
+        ```python
+        from fastmcp.server.middleware.concurrency import (
+            AIMDLimit,
+            ConcurrencyLimitingMiddleware,
+        )
+
+        # At most 50 requests at once, 10 of them tool calls, with up to 100
+        # requests waiting for at most 5 seconds
+        limiter = ConcurrencyLimitingMiddleware(
+            max_concurrent=50,
+            per_method={"tools/call": 10},
+            max_queue=100,
+            queue_timeout=5.0,
+        )
+
+        # Or let the global limit adapt to keep requests under 500ms
+        limiter = ConcurrencyLimitingMiddleware(
+            max_concurrent=AIMDLimit(initial_limit=20, latency_threshold=0.5),
+        )
+
+        mcp = FastMCP("MyServer")
+        mcp.add_middleware(limiter)
+        ```
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int | AIMDLimit | None = 100,
+        per_method: dict[str, int] | None = None,
+        per_client: int | None = None,
+        get_client_id: Callable[[MiddlewareContext], str] | None = None,
+        max_queue: int | None = 100,
+        queue_timeout: float | None = 10.0,
+        max_clients: int | None = 10_000,
+    ):
+        """Initialize concurrency limiting middleware.
+
+        Args:
+            max_concurrent: Maximum requests in flight across the server, an
+                adaptive limit, or None for no global limit
+            per_method: Maximum requests in flight for each method, e.g.
+                {"tools/call": 10}
+            per_client: Maximum requests in flight for each client
+            get_client_id: Function to extract client ID from context. If None,
+                all requests come from the same client.
+            max_queue: Maximum requests waiting for each limit, or None for no
+                limit. With 0, requests beyond a limit are rejected immediately.
+            queue_timeout: Seconds a request waits for each limit before it is
+                rejected, or None to wait indefinitely
+            max_clients: Maximum number of clients whose requests are tracked at
+                once. The least recently seen clients are forgotten beyond it.
+        """
+        self.max_concurrent = max_concurrent
+        self.per_method = per_method or {}
+        self.per_client = per_client
+        self.get_client_id = get_client_id
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+
+        self.global_limiter = (
+            None if max_concurrent is None else self._create_limiter(max_concurrent)
+        )
+        self.method_limiters = {
+            method: self._create_limiter(limit)
+            for method, limit in self.per_method.items()
+        }
+        self.client_limiters: LimiterTable[ConcurrencyLimiter] | None = None
+        if per_client is not None:
+            self.client_limiters = LimiterTable(
+                lambda: self._create_limiter(per_client), max_clients=max_clients
+            )
+
+    def _create_limiter(self, limit: int | AIMDLimit) -> ConcurrencyLimiter:
+        return ConcurrencyLimiter(limit, self.max_queue, self.queue_timeout)
+
+    def _get_client_identifier(self, context: MiddlewareContext) -> str:
+        """Get client identifier for concurrency limiting."""
+        if self.get_client_id:
+            return self.get_client_id(context)
+        return "global"
+
+    async def on_request(self, context: MiddlewareContext, call_next: CallNext) -> Any:
+        """Hold a slot of each applicable limit while the request is handled."""
+        # the most specific limits come first, so requests waiting on their
+        # client's or method's limit don't hold slots of the global limit
+        limiters: list[tuple[ConcurrencyLimiter, str]] = []
+        if self.client_limiters is not None:
+            client_id = self._get_client_identifier(context)
+            limiters.append((self.client_limiters[client_id], f"Client {client_id}"))
+        if method_limiter := self.method_limiters.get(context.method or ""):
+            limiters.append((method_limiter, f"Method {context.method}"))
+        if self.global_limiter is not None:
+            limiters.append((self.global_limiter, "Server"))
+
+        acquired: list[ConcurrencyLimiter] = []
+        try:
+            for limiter, description in limiters:
+                await limiter.acquire(description)
+                acquired.append(limiter)
+        except BaseException:
+            for limiter in acquired:
+                limiter.release()
+            raise
+
+        start = time.perf_counter()
+        try:
+            return await call_next(context)
+        finally:
+            latency = time.perf_counter() - start
+            for limiter in acquired:
+                limiter.release(latency)
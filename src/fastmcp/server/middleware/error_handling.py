@@ -2,13 +2,20 @@
 
 import asyncio
 import logging
+import time
 import traceback
+from collections import OrderedDict, deque
 from collections.abc import Callable
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, Literal
 
+import mcp.types
+import pydantic
 from mcp import McpError
 from mcp.types import ErrorData
 
+from fastmcp.exceptions import DisabledError, NotFoundError, ToolError, ValidationError
+
 from .middleware import CallNext, Middleware, MiddlewareContext
 
 
@@ -204,3 +211,365 @@ class RetryMiddleware(Middleware):
         # Re-raise the last error if all retries failed
         if last_error:
             raise last_error
+
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+class CircuitOpenError(McpError):
+    """Error raised when a call is rejected because its circuit is open.
+
+    The error's data marks it as retryable and says how many seconds remain
+    until the circuit lets a trial call through.
+    """
+
+    def __init__(self, key: str, retry_after: float):
+        super().__init__(
+            ErrorData(
+                code=-32000,
+                message=f"Circuit open for {key}, retry in {retry_after:.1f}s",
+                data={"retryable": True, "retry_after": retry_after},
+            )
+        )
+
+
+@dataclass
+class CircuitStats:
+    """The state of one circuit, for monitoring."""
+
+    state: CircuitState
+    calls: int
+    failure_rate: float
+    slow_call_rate: float
+    retry_after: float
+
+
+class CircuitBreaker:
+    """Tracks the outcomes of recent calls to one backend and opens when it fails.
+
+    The circuit starts closed and records whether each of the last `window_size`
+    calls failed or was slow. Once at least `minimum_calls` are recorded and the
+    failure rate or slow call rate reaches its threshold, the circuit opens and
+    rejects calls for `open_duration` seconds. It then becomes half-open and lets
+    `half_open_calls` trial calls through: if they all succeed quickly it closes
+    again, otherwise it opens for another `open_duration`.
+    """
+
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        slow_call_rate_threshold: float = 1.0,
+        slow_call_duration: float | None = None,
+        window_size: int = 20,
+        minimum_calls: int = 10,
+        open_duration: float = 30.0,
+        half_open_calls: int = 1,
+    ):
+        """Initialize circuit breaker.
+
+        Args:
+            failure_rate_threshold: Fraction of failed calls that opens the circuit
+            slow_call_rate_threshold: Fraction of slow calls that opens the circuit
+            slow_call_duration: Seconds after which a call counts as slow, or None
+                to ignore call durations
+            window_size: Number of recent calls whose outcomes are recorded
+            minimum_calls: Number of calls recorded before the circuit can open
+            open_duration: Seconds the circuit stays open before trial calls
+            half_open_calls: Number of trial calls that must succeed to close the
+                circuit
+        """
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.slow_call_duration = slow_call_duration
+        self.minimum_calls = minimum_calls
+        self.open_duration = open_duration
+        self.half_open_calls = half_open_calls
+
+        self.state: CircuitState = "closed"
+        # (failed, slow) for each recent call
+        self._outcomes: deque[tuple[bool, bool]] = deque(maxlen=window_size)
+        self._opened_at = 0.0
+        self._trials_started = 0
+        self._trials_succeeded = 0
+
+    def _open(self, now: float) -> None:
+        self.state = "open"
+        self._opened_at = now
+        self._outcomes.clear()
+
+    def _retry_after(self, now: float) -> float:
+        if self.state != "open":
+            return 0.0
+        return max(0.0, self._opened_at + self.open_duration - now)
+
+    def before_call(self, key: str) -> CircuitState:
+        """Raise CircuitOpenError if the circuit doesn't let a call through.
+
+        Returns:
+            The state the call was let through in, to pass to `record` or
+            `release` once it ends
+        """
+        now = time.monotonic()
+        if self.state == "open":
+            if now - self._opened_at < self.open_duration:
+                raise CircuitOpenError(key, self._retry_after(now))
+            self.state = "half_open"
+            self._trials_started = 0
+            self._trials_succeeded = 0
+
+        if self.state == "half_open":
+            if self._trials_started >= self.half_open_calls:
+                raise CircuitOpenError(key, 0.0)
+            self._trials_started += 1
+        return self.state
+
+    def record(self, failed: bool, duration: float, admitted: CircuitState) -> None:
+        """Record the outcome of a call that `before_call` let through.
+
+        Args:
+            failed: Whether the call failed
+            duration: How long the call took, in seconds
+            admitted: The state `before_call` let the call through in
+        """
+        slow = (
+            self.slow_call_duration is not None and duration > self.slow_call_duration
+        )
+        now = time.monotonic()
+
+        if admitted != self.state:
+            # a call from before the circuit opened, or a trial call that ended
+            # after the other trials decided the state
+            return
+
+        if self.state == "half_open":
+            if failed or slow:
+                self._open(now)
+                return
+            self._trials_succeeded += 1
+            if self._trials_succeeded >= self.half_open_calls:
+                self.state = "closed"
+            return
+
+        self._outcomes.append((failed, slow))
+        if len(self._outcomes) >= self.minimum_calls:
+            stats = self.stats()
+            if (
+                stats.failure_rate >= self.failure_rate_threshold
+                or stats.slow_call_rate >= self.slow_call_rate_threshold
+            ):
+                self._open(now)
+
+    def release(self, admitted: CircuitState) -> None:
+        """Give back the slot of a trial call that ended without an outcome."""
+        if admitted == "half_open" and self.state == "half_open":
+            self._trials_started -= 1
+
+    def stats(self) -> CircuitStats:
+        calls = len(self._outcomes)
+        return CircuitStats(
+            state=self.state,
+            calls=calls,
+            failure_rate=sum(failed for failed, _ in self._outcomes) / calls
+            if calls
+            else 0.0,
+            slow_call_rate=sum(slow for _, slow in self._outcomes) / calls
+            if calls
+            else 0.0,
+            retry_after=self._retry_after(time.monotonic()),
+        )
+
+
+def _is_client_error(error: BaseException) -> bool:
+    """Whether a tool call failed because of the request rather than the backend."""
+    if isinstance(error, ToolError):
+        # tools raise ToolError to report a bad request, while the tool manager
+        # wraps unexpected exceptions in one
+        return error.__cause__ is None or _is_client_error(error.__cause__)
+    return isinstance(
+        error,
+        NotFoundError | DisabledError | ValidationError | pydantic.ValidationError,
+    )
+
+
+class CircuitBreakerMiddleware(Middleware):
+    """Middleware that rejects tool calls to failing backends without calling them.
+
+    Each tool, or each mounted server if `key_by_mount` is set, gets its own
+    circuit. When calls through a circuit keep failing or running slowly, the
+    circuit opens and further calls fail immediately with a retryable
+    `CircuitOpenError` instead of waiting on a backend that is down. After
+    `open_duration` seconds a few trial calls are let through to check whether
+    the backend has recovered. Use it together with `RetryMiddleware`, which
+    should be added first so that retries are rejected quickly too.
+
+    Calls that fail because of the request, such as calls to unknown tools, with
+    invalid arguments, or that a tool rejects by raising a `ToolError` itself,
+    say nothing about the backend and are not recorded.
+
+    Example:
+        ```python
+        from fastmcp.server.middleware.error_handling import (
+            CircuitBreakerMiddleware,
+            RetryMiddleware,
+        )
+
+        mcp = FastMCP("MyServer")
+        mcp.mount(weather_proxy, prefix="weather")
+
+        # Stop calling a mounted server for 30 seconds when half of its last
+        # 20 calls failed or took longer than 5 seconds
+        circuit_breaker = CircuitBreakerMiddleware(
+            key_by_mount=True,
+            slow_call_duration=5.0,
+            slow_call_rate_threshold=0.5,
+        )
+        mcp.add_middleware(RetryMiddleware())
+        mcp.add_middleware(circuit_breaker)
+
+        # Check on the circuits
+        print(circuit_breaker.get_circuit_stats())
+        ```
+    """
+
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        slow_call_rate_threshold: float = 1.0,
+        slow_call_duration: float | None = None,
+        window_size: int = 20,
+        minimum_calls: int = 10,
+        open_duration: float = 30.0,
+        half_open_calls: int = 1,
+        failure_exceptions: tuple[type[Exception], ...] = (Exception,),
+        count_client_errors: bool = False,
+        key_by_mount: bool = False,
+        get_key: Callable[[MiddlewareContext], str] | None = None,
+        max_circuits: int | None = 10_000,
+        logger: logging.Logger | None = None,
+    ):
+        """Initialize circuit breaker middleware.
+
+        Args:
+            failure_rate_threshold: Fraction of failed calls that opens a circuit
+            slow_call_rate_threshold: Fraction of slow calls that opens a circuit
+            slow_call_duration: Seconds after which a call counts as slow, or None
+                to ignore call durations
+            window_size: Number of recent calls whose outcomes each circuit records
+            minimum_calls: Number of calls recorded before a circuit can open
+            open_duration: Seconds a circuit stays open before trial calls
+            half_open_calls: Number of trial calls that must succeed to close a
+                circuit
+            failure_exceptions: Tuple of exception types that count as failures.
+                Calls that raise other exceptions count as successes.
+            count_client_errors: Whether calls that fail because of the request,
+                rather than the backend, are recorded too
+            key_by_mount: Whether tools of the same mounted server share a circuit,
+                keyed by the mount prefix
+            get_key: Function to extract the circuit key from context. Overrides
+                the tool key and `key_by_mount`.
+            max_circuits: Maximum number of circuits kept, or None for no limit
+            logger: Logger for circuit state changes
+        """
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.slow_call_duration = slow_call_duration
+        self.window_size = window_size
+        self.minimum_calls = minimum_calls
+        self.open_duration = open_duration
+        self.half_open_calls = half_open_calls
+        self.failure_exceptions = failure_exceptions
+        self.count_client_errors = count_client_errors
+        self.key_by_mount = key_by_mount
+        self.get_key = get_key
+        self.max_circuits = max_circuits
+        self.logger = logger or logging.getLogger("fastmcp.circuit_breaker")
+        self.circuits: OrderedDict[str, CircuitBreaker] = OrderedDict()
+
+    def _get_circuit(self, key: str) -> CircuitBreaker:
+        """Get the circuit with this key, creating it on first use."""
+        circuit = self.circuits.pop(key, None)
+        if circuit is None:
+            circuit = self._create_circuit()
+        self.circuits[key] = circuit
+        if self.max_circuits is not None and len(self.circuits) > self.max_circuits:
+            # forget the least recently used circuit
+            self.circuits.popitem(last=False)
+        return circuit
+
+    def _create_circuit(self) -> CircuitBreaker:
+        return CircuitBreaker(
+            failure_rate_threshold=self.failure_rate_threshold,
+            slow_call_rate_threshold=self.slow_call_rate_threshold,
+            slow_call_duration=self.slow_call_duration,
+            window_size=self.window_size,
+            minimum_calls=self.minimum_calls,
+            open_duration=self.open_duration,
+            half_open_calls=self.half_open_calls,
+        )
+
+    async def _get_circuit_key(
+        self, context: MiddlewareContext[mcp.types.CallToolRequestParams]
+    ) -> str:
+        """Get the key of the circuit a tool call goes through."""
+        if self.get_key:
+            return self.get_key(context)
+
+        key = context.message.name
+        if self.key_by_mount and context.fastmcp_context is not None:
+            server = context.fastmcp_context.fastmcp
+            if prefix := await server.get_tool_mount_prefix(key):
+                return f"mount:{prefix}"
+        return key
+
+    def _record(
+        self, key: str, failed: bool, duration: float, admitted: CircuitState
+    ) -> None:
+        circuit = self._get_circuit(key)
+        state = circuit.state
+        circuit.record(failed, duration, admitted)
+        if circuit.state != state:
+            self.logger.warning(
+                f"Circuit for {key} changed from {state} to {circuit.state}"
+            )
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[mcp.types.CallToolRequestParams],
+        call_next: CallNext,
+    ) -> Any:
+        """Reject the call if its circuit is open, and record its outcome."""
+        key = await self._get_circuit_key(context)
+        # circuits are created once a call has an outcome, so that calls to
+        # unknown tools don't create any
+        circuit = self.circuits.get(key)
+        admitted: CircuitState = (
+            "closed" if circuit is None else circuit.before_call(key)
+        )
+
+        start = time.monotonic()
+        try:
+            result = await call_next(context)
+        except Exception as error:
+            if self.count_client_errors or not _is_client_error(error):
+                failed = isinstance(error, self.failure_exceptions)
+                self._record(key, failed, time.monotonic() - start, admitted)
+            elif circuit is not None:
+                circuit.release(admitted)
+            raise
+        except BaseException:
+            if circuit is not None:
+                circuit.release(admitted)
+            raise
+        self._record(key, False, time.monotonic() - start, admitted)
+        return result
+
+    def get_circuit_stats(self) -> dict[str, CircuitStats]:
+        """Get the state of each circuit for monitoring."""
+        return {key: circuit.stats() for key, circuit in self.circuits.items()}
+
+    def reset(self, key: str | None = None) -> None:
+        """Close the circuit with this key, or all circuits, forgetting past calls."""
+        if key is None:
+            self.circuits.clear()
+        else:
+            self.circuits.pop(key, None)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Callable, Sequence
 from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from functools import partial
@@ -76,6 +76,65 @@ def make_middleware_wrapper(
     return wrapper
 
 
+# The hook that handles each method, in addition to the generic hooks
+_METHOD_HOOKS: dict[str | None, str] = {
+    "tools/call": "on_call_tool",
+    "resources/read": "on_read_resource",
+    "prompts/get": "on_get_prompt",
+    "tools/list": "on_list_tools",
+    "resources/list": "on_list_resources",
+    "resources/templates/list": "on_list_resource_templates",
+    "prompts/list": "on_list_prompts",
+}
+_TYPE_HOOKS: dict[str, str] = {
+    "request": "on_request",
+    "notification": "on_notification",
+}
+
+MiddlewareHook = Callable[..., Awaitable[Any]]
+
+
+def compile_middleware_hooks(
+    middleware: Sequence[Middleware],
+    method: str | None,
+    message_type: str,
+) -> tuple[MiddlewareHook, ...]:
+    """
+    Flatten a middleware stack into the hooks that actually run for a given
+    method and message type, outermost first.
+
+    Each hook is called as `hook(context, call_next=...)`, which is equivalent to
+    calling the middleware itself. Hooks a middleware inherits unchanged from
+    `Middleware` only pass the context through, so they are left out. Middleware
+    that customize `__call__` or `_dispatch_handler` (or aren't `Middleware`
+    subclasses at all) are kept as a single opaque hook.
+    """
+    hook_names = ["on_message"]
+    if type_hook := _TYPE_HOOKS.get(message_type):
+        hook_names.append(type_hook)
+    if method_hook := _METHOD_HOOKS.get(method):
+        hook_names.append(method_hook)
+
+    hooks: list[MiddlewareHook] = []
+    for mw in middleware:
+        if (
+            not isinstance(mw, Middleware)
+            or _is_overridden(mw, "__call__")
+            or _is_overridden(mw, "_dispatch_handler")
+        ):
+            hooks.append(mw)
+            continue
+        for name in hook_names:
+            if _is_overridden(mw, name):
+                hooks.append(getattr(mw, name))
+    return tuple(hooks)
+
+
+def _is_overridden(middleware: Middleware, name: str) -> bool:
+    hook = getattr(middleware, name)
+    return getattr(hook, "__func__", hook) is not getattr(Middleware, name)
+
+
 class Middleware:
     """Base class for FastMCP middleware with dispatching hooks."""
 
@@ -1,16 +1,22 @@
 """Rate limiting middleware for protecting FastMCP servers from abuse."""
 
-import asyncio
+import sqlite3
+import threading
 import time
-from collections import defaultdict, deque
+from abc import ABC, abstractmethod
+from collections import OrderedDict
 from collections.abc import Callable
-from typing import Any
+from pathlib import Path
+from typing import Any, Generic, TypeVar
 
+import anyio.to_thread
 from mcp import McpError
 from mcp.types import ErrorData
 
 from .middleware import CallNext, Middleware, MiddlewareContext
 
+L = TypeVar("L")
+
 
 class RateLimitError(McpError):
     """Error raised when rate limit is exceeded."""
@@ -20,7 +26,11 @@ class RateLimitError(McpError):
 
 
 class TokenBucketRateLimiter:
-    """Token bucket implementation for rate limiting."""
+    """Token bucket implementation for rate limiting.
+
+    Limiters are only used from the event loop and don't await while updating
+    their state, so they need no lock.
+    """
 
     def __init__(self, capacity: int, refill_rate: float):
         """Initialize token bucket.
@@ -32,8 +42,7 @@ class TokenBucketRateLimiter:
         self.capacity = capacity
         self.refill_rate = refill_rate
         self.tokens = capacity
-        self.last_refill = time.time()
-        self._lock = asyncio.Lock()
+        self.last_refill = time.monotonic()
 
     async def consume(self, tokens: int = 1) -> bool:
         """Try to consume tokens from the bucket.
@@ -44,22 +53,27 @@ class TokenBucketRateLimiter:
         Returns:
             True if tokens were available and consumed, False otherwise
         """
-        async with self._lock:
-            now = time.time()
-            elapsed = now - self.last_refill
+        now = time.monotonic()
+        elapsed = now - self.last_refill
 
-            # Add tokens based on elapsed time
-            self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
-            self.last_refill = now
+        # Add tokens based on elapsed time
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+        self.last_refill = now
 
-            if self.tokens >= tokens:
-                self.tokens -= tokens
-                return True
-            return False
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return True
+        return False
 
 
 class SlidingWindowRateLimiter:
-    """Sliding window rate limiter implementation."""
+    """Sliding window rate limiter implementation.
+
+    Approximates a log of every request in the window with two counters: the
+    requests in the current fixed window, and those in the previous one,
+    weighted by how much of it the sliding window still covers. This keeps the
+    memory per client constant however many requests are allowed.
+    """
 
     def __init__(self, max_requests: int, window_seconds: int):
         """Initialize sliding window rate limiter.
@@ -70,23 +84,278 @@ class SlidingWindowRateLimiter:
         """
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self.requests = deque()
-        self._lock = asyncio.Lock()
+        self.window = 0
+        self.current_count = 0
+        self.previous_count = 0
 
     async def is_allowed(self) -> bool:
         """Check if a request is allowed."""
-        async with self._lock:
-            now = time.time()
-            cutoff = now - self.window_seconds
+        now = time.monotonic()
+        window = int(now // self.window_seconds)
+        if window != self.window:
+            # the current window becomes the previous one, unless more than a
+            # whole window has passed without requests
+            self.previous_count = self.current_count if window == self.window + 1 else 0
+            self.current_count = 0
+            self.window = window
+
+        elapsed = now - window * self.window_seconds
+        previous_weight = 1 - elapsed / self.window_seconds
+        if (
+            self.previous_count * previous_weight + self.current_count
+            < self.max_requests
+        ):
+            self.current_count += 1
+            return True
+        return False
+
+
+class LimiterTable(Generic[L]):
+    """The rate limiters of each client, created on first use.
+
+    A limiter that has been idle for `ttl` seconds is dropped, so clients that
+    stop making requests don't use memory forever. The least recently used
+    limiters are also dropped to keep at most `max_clients`; a client whose
+    limiter was dropped starts over with a fresh limit. Limiters with requests
+    in flight, such as a busy `ConcurrencyLimiter`, are never dropped, since
+    those requests still have to release their slots.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], L],
+        max_clients: int | None = 10_000,
+        ttl: float | None = None,
+    ):
+        """Initialize limiter table.
+
+        Args:
+            factory: Creates the limiter of a new client
+            max_clients: Maximum number of limiters kept, or None for no limit
+            ttl: Seconds after which an idle limiter is dropped, or None to keep
+                idle limiters
+        """
+        self.factory = factory
+        self.max_clients = max_clients
+        self.ttl = ttl
+        self._limiters: OrderedDict[str, tuple[L, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._limiters)
+
+    def __contains__(self, client_id: object) -> bool:
+        return client_id in self._limiters
+
+    def __getitem__(self, client_id: str) -> L:
+        now = time.monotonic()
+        if self.ttl is not None:
+            # limiters are ordered by last use, so the idle ones are first
+            expired = []
+            for other_id, (other, last_used) in self._limiters.items():
+                if now - last_used < self.ttl:
+                    break
+                if not _in_use(other):
+                    expired.append(other_id)
+            for other_id in expired:
+                del self._limiters[other_id]
+
+        entry = self._limiters.pop(client_id, None)
+        limiter = self.factory() if entry is None else entry[0]
+        self._limiters[client_id] = (limiter, now)
+        if self.max_clients is not None and len(self._limiters) > self.max_clients:
+            for other_id, (other, _) in self._limiters.items():
+                if other_id != client_id and not _in_use(other):
+                    del self._limiters[other_id]
+                    break
+        return limiter
+
+
+def _in_use(limiter: Any) -> bool:
+    return getattr(limiter, "in_flight", 0) > 0
+
+
+class RateLimiterStorage(ABC):
+    """Storage for token buckets that several processes can share.
+
+    By default, each `RateLimitingMiddleware` keeps its buckets in memory, so
+    each worker process of a server enforces the limits on its own. Storage
+    keeps the buckets in one place instead, so that the limits hold across all
+    workers.
+    """
+
+    @abstractmethod
+    async def consume(
+        self, key: str, capacity: int, refill_rate: float, tokens: int = 1
+    ) -> bool:
+        """Atomically try to consume tokens from the bucket stored under `key`.
+
+        Args:
+            key: The bucket's key. A bucket that doesn't exist yet starts full.
+            capacity: Maximum number of tokens in the bucket
+            refill_rate: Tokens added per second
+            tokens: Number of tokens to consume
+
+        Returns:
+            True if tokens were available and consumed, False otherwise
+        """
+
+
+class SQLiteRateLimiterStorage(RateLimiterStorage):
+    """Keeps token buckets in a SQLite database shared by the worker processes
+    of a server on one host.
 
-            # Remove old requests outside the window
-            while self.requests and self.requests[0] < cutoff:
-                self.requests.popleft()
+    The database uses write-ahead logging, so that a bucket update only locks
+    the database for the few microseconds the update takes. Buckets that have been idle
+    long enough to refill completely are deleted from time to time.
+    """
+
+    def __init__(self, path: str | Path, prefix: str = ""):
+        """Initialize SQLite rate limiter storage.
+
+        Args:
+            path: The database file, which is created if it doesn't exist
+            prefix: Prepended to every key, so that several middlewares can
+                share a database
+        """
+        self.path = Path(path)
+        self.prefix = prefix
+        self._consumed = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None, timeout=1
+        )
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS token_buckets ("
+                "key TEXT PRIMARY KEY, tokens REAL NOT NULL, "
+                "updated_at REAL NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    async def consume(
+        self, key: str, capacity: int, refill_rate: float, tokens: int = 1
+    ) -> bool:
+        # another process may hold the write lock, which would block the event
+        # loop for up to the busy timeout
+        return await anyio.to_thread.run_sync(
+            self._consume, self.prefix + key, capacity, refill_rate, tokens
+        )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _consume(
+        self, key: str, capacity: int, refill_rate: float, tokens: int
+    ) -> bool:
+        # wall-clock time, since the database is shared between processes
+        now = time.time()
+        with self._lock:
+            connection = self._connection
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = connection.execute(
+                    "SELECT tokens, updated_at FROM token_buckets WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                available = (
+                    capacity
+                    if row is None
+                    else min(capacity, row[0] + max(0.0, now - row[1]) * refill_rate)
+                )
+                allowed = available >= tokens
+                if allowed:
+                    available -= tokens
+                connection.execute(
+                    "INSERT OR REPLACE INTO token_buckets VALUES (?, ?, ?, ?)",
+                    (key, available, now, now + capacity / refill_rate),
+                )
+                self._consumed += 1
+                if self._consumed % 1000 == 0:
+                    connection.execute(
+                        "DELETE FROM token_buckets WHERE expires_at < ?", (now,)
+                    )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        return allowed
+
+
+# Runs on the Redis server, so the bucket is read and updated atomically and
+# every process uses the server's clock
+_REDIS_CONSUME_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local refill_rate = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = capacity
+if bucket[1] then
+    local elapsed = math.max(0, now - tonumber(bucket[2]))
+    tokens = math.min(capacity, tonumber(bucket[1]) + elapsed * refill_rate)
+end
+local allowed = 0
+if tokens >= requested then
+    tokens = tokens - requested
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated_at', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / refill_rate * 1000))
+return allowed
+"""
+
+
+class RedisRateLimiterStorage(RateLimiterStorage):
+    """Keeps token buckets in Redis, or a server that speaks its protocol, so
+    that limits hold across processes and hosts.
+
+    Each update is a single script run on the server, so it takes one round
+    trip and is atomic. Buckets expire once they have been idle long enough to
+    refill completely.
+
+    Example:
+        ```python
+        import redis.asyncio as redis
 
-            if len(self.requests) < self.max_requests:
-                self.requests.append(now)
-                return True
-            return False
+        from fastmcp.server.middleware.rate_limiting import (
+            RateLimitingMiddleware,
+            RedisRateLimiterStorage,
+        )
+
+        storage = RedisRateLimiterStorage(redis.Redis(host="localhost"))
+        mcp.add_middleware(
+            RateLimitingMiddleware(max_requests_per_second=10, storage=storage)
+        )
+        ```
+    """
+
+    def __init__(self, client: Any, prefix: str = "fastmcp:rate_limit:"):
+        """Initialize Redis rate limiter storage.
+
+        Args:
+            client: An async Redis client, such as `redis.asyncio.Redis`. It only
+                needs an `eval(script, numkeys, *keys_and_args)` coroutine method.
+            prefix: Prepended to every key
+        """
+        self.client = client
+        self.prefix = prefix
+
+    async def consume(
+        self, key: str, capacity: int, refill_rate: float, tokens: int = 1
+    ) -> bool:
+        allowed = await self.client.eval(
+            _REDIS_CONSUME_SCRIPT,
+            1,
+            self.prefix + key,
+            capacity,
+            refill_rate,
+            tokens,
+        )
+        return int(allowed) == 1
 
 
 class RateLimitingMiddleware(Middleware):
@@ -116,6 +385,8 @@ class RateLimitingMiddleware(Middleware):
         burst_capacity: int | None = None,
         get_client_id: Callable[[MiddlewareContext], str] | None = None,
         global_limit: bool = False,
+        max_clients: int | None = 10_000,
+        storage: RateLimiterStorage | None = None,
     ):
         """Initialize rate limiting middleware.
 
@@ -124,17 +395,25 @@ class RateLimitingMiddleware(Middleware):
             burst_capacity: Maximum burst capacity. If None, defaults to 2x max_requests_per_second
             get_client_id: Function to extract client ID from context. If None, uses global limiting
             global_limit: If True, apply limit globally; if False, per-client
+            max_clients: Maximum number of clients whose limits are tracked at
+                once. The least recently seen clients are forgotten beyond it.
+            storage: Where token buckets are kept. If None, they are kept in this
+                process, so each worker process enforces the limits on its own.
         """
         self.max_requests_per_second = max_requests_per_second
         self.burst_capacity = burst_capacity or int(max_requests_per_second * 2)
         self.get_client_id = get_client_id
         self.global_limit = global_limit
+        self.storage = storage
 
-        # Storage for rate limiters per client
-        self.limiters: dict[str, TokenBucketRateLimiter] = defaultdict(
+        # Storage for rate limiters per client. A bucket that has been idle
+        # long enough to refill completely is dropped, since a new one is the same
+        self.limiters: LimiterTable[TokenBucketRateLimiter] = LimiterTable(
             lambda: TokenBucketRateLimiter(
                 self.burst_capacity, self.max_requests_per_second
-            )
+            ),
+            max_clients=max_clients,
+            ttl=self.burst_capacity / self.max_requests_per_second,
         )
 
         # Global rate limiter
@@ -153,25 +432,35 @@ class RateLimitingMiddleware(Middleware):
         """Apply rate limiting to requests."""
         if self.global_limit:
             # Global rate limiting
-            allowed = await self.global_limiter.consume()
+            allowed = await self._consume(None)
             if not allowed:
                 raise RateLimitError("Global rate limit exceeded")
         else:
             # Per-client rate limiting
             client_id = self._get_client_identifier(context)
-            limiter = self.limiters[client_id]
-            allowed = await limiter.consume()
+            allowed = await self._consume(client_id)
             if not allowed:
                 raise RateLimitError(f"Rate limit exceeded for client: {client_id}")
 
         return await call_next(context)
 
+    async def _consume(self, client_id: str | None) -> bool:
+        """Consume a token for a client, or from the global bucket if None."""
+        if self.storage is not None:
+            key = "global" if client_id is None else f"client:{client_id}"
+            return await self.storage.consume(
+                key, self.burst_capacity, self.max_requests_per_second
+            )
+        if client_id is None:
+            return await self.global_limiter.consume()
+        return await self.limiters[client_id].consume()
+
 
 class SlidingWindowRateLimitingMiddleware(Middleware):
     """Middleware that implements sliding window rate limiting.
 
-    Uses a sliding window approach which provides more precise rate limiting
-    but uses more memory to track individual request timestamps.
+    Uses a sliding window approach, which limits requests more evenly than a
+    token bucket by counting the requests in a window that moves with time.
 
     Example:
         ```python
@@ -193,6 +482,7 @@ class SlidingWindowRateLimitingMiddleware(Middleware):
         max_requests: int,
         window_minutes: int = 1,
         get_client_id: Callable[[MiddlewareContext], str] | None = None,
+        max_clients: int | None = 10_000,
     ):
         """Initialize sliding window rate limiting middleware.
 
@@ -200,14 +490,19 @@ class SlidingWindowRateLimitingMiddleware(Middleware):
             max_requests: Maximum requests allowed in the time window
             window_minutes: Time window in minutes
             get_client_id: Function to extract client ID from context
+            max_clients: Maximum number of clients whose limits are tracked at
+                once. The least recently seen clients are forgotten beyond it.
         """
         self.max_requests = max_requests
         self.window_seconds = window_minutes * 60
         self.get_client_id = get_client_id
 
-        # Storage for rate limiters per client
-        self.limiters: dict[str, SlidingWindowRateLimiter] = defaultdict(
-            lambda: SlidingWindowRateLimiter(self.max_requests, self.window_seconds)
+        # Storage for rate limiters per client. After two idle windows a
+        # limiter has no requests left to count, so it is dropped
+        self.limiters: LimiterTable[SlidingWindowRateLimiter] = LimiterTable(
+            lambda: SlidingWindowRateLimiter(self.max_requests, self.window_seconds),
+            max_clients=max_clients,
+            ttl=2 * self.window_seconds,
         )
 
     def _get_client_identifier(self, context: MiddlewareContext) -> str:
@@ -3,6 +3,7 @@ from __future__ import annotations
 import inspect
 import warnings
 from collections.abc import Awaitable, Callable
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 from urllib.parse import quote
@@ -21,7 +22,7 @@ from mcp.types import (
 from pydantic.networks import AnyUrl
 
 import fastmcp
-from fastmcp.client.client import Client, FastMCP1Server
+from fastmcp.client.client import CallToolResult, Client, FastMCP1Server
 from fastmcp.client.elicitation import ElicitResult
 from fastmcp.client.logging import LogMessage
 from fastmcp.client.roots import RootsList
@@ -37,6 +38,7 @@ from fastmcp.server.context import Context
 from fastmcp.server.dependencies import get_context
 from fastmcp.server.server import FastMCP
 from fastmcp.tools.tool import Tool, ToolResult
+from fastmcp.tools.tool_batch import ToolBatcher
 from fastmcp.tools.tool_manager import ToolManager
 from fastmcp.tools.tool_transform import (
     apply_transformations_to_tools,
@@ -72,32 +74,51 @@ class ProxyToolManager(ToolManager, ProxyManagerMixin):
     def __init__(self, client_factory: ClientFactoryT, **kwargs):
         super().__init__(**kwargs)
         self.client_factory = client_factory
+        # Batchers of the remote tools that batch their calls, by name
+        self._batchers: dict[str, ToolBatcher] = {}
 
-    async def get_tools(self) -> dict[str, Tool]:
+    def _inventory_version(self) -> None:
+        """The remote inventory can change at any time, so it is never cached."""
+        return None
+
+    async def _get_inventory(self) -> dict[str, Tool]:
         """Gets the unfiltered tool inventory including local, mounted, and proxy tools."""
-        # First get local and mounted tools from parent
-        all_tools = await super().get_tools()
+        # First get local and mounted tools from parent, which are already transformed
+        all_tools = dict(await super()._get_inventory())
 
         # Then add proxy tools, but don't overwrite existing ones
+        proxy_tools: dict[str, Tool] = {}
         try:
             client = await self._get_client()
             async with client:
                 client_tools = await client.list_tools()
                 for tool in client_tools:
                     if tool.name not in all_tools:
-                        all_tools[tool.name] = ProxyTool.from_mcp_tool(client, tool)
+                        proxy_tools[tool.name] = ProxyTool.from_mcp_tool(client, tool)
         except McpError as e:
             if e.error.code == METHOD_NOT_FOUND:
                 pass  # No tools available from proxy
             else:
                 raise e
 
-        transformed_tools = apply_transformations_to_tools(
-            tools=all_tools,
-            transformations=self.transformations,
+        # Concurrent calls to remote tools that batch their calls are forwarded
+        # together over one session, so they can reach the remote batch as one
+        self._batchers = {
+            name: self._batchers.get(name)
+            or ToolBatcher(partial(self._call_batch, name))
+            for name, tool in proxy_tools.items()
+            if (tool.meta or {}).get("_fastmcp", {}).get("batch")
+        }
+
+        all_tools.update(
+            apply_transformations_to_tools(
+                tools=proxy_tools,
+                transformations=self.transformations,
+                cache=self._transform_cache,
+            )
         )
 
-        return transformed_tools
+        return all_tools
 
     async def list_tools(self) -> list[Tool]:
         """Gets the filtered list of tools including local, mounted, and proxy tools."""
@@ -111,6 +132,8 @@ class ProxyToolManager(ToolManager, ProxyManagerMixin):
             return await super().call_tool(key, arguments)
         except NotFoundError:
             # If not found locally, try proxy
+            if (batcher := self._batchers.get(key)) is not None:
+                return await batcher.call(arguments)
             client = await self._get_client()
             async with client:
                 result = await client.call_tool(key, arguments)
@@ -119,6 +142,30 @@ class ProxyToolManager(ToolManager, ProxyManagerMixin):
                     structured_content=result.structured_content,
                 )
 
+    async def _call_batch(
+        self, key: str, arguments: list[dict[str, Any]]
+    ) -> list[ToolResult | ToolError]:
+        """Forwards a batch of calls to a remote tool over one client session."""
+        client = await self._get_client()
+        async with client:
+            results = await client.call_tool_batch(key, arguments)
+        return [
+            _batch_error(key, result)
+            if result.is_error
+            else ToolResult(
+                content=result.content,
+                structured_content=result.structured_content,
+            )
+            for result in results
+        ]
+
+
+def _batch_error(key: str, result: CallToolResult) -> ToolError:
+    """The error of a failed remote call, with the message the remote sent, if any."""
+    if result.content and isinstance(result.content[0], mcp.types.TextContent):
+        return ToolError(result.content[0].text)
+    return ToolError(f"Error calling tool {key!r}")
+
 
 class ProxyResourceManager(ResourceManager, ProxyManagerMixin):
     """A ResourceManager that sources its resources from a remote client in addition to local and mounted resources."""
@@ -127,10 +174,14 @@ class ProxyResourceManager(ResourceManager, ProxyManagerMixin):
         super().__init__(**kwargs)
         self.client_factory = client_factory
 
-    async def get_resources(self) -> dict[str, Resource]:
+    def _inventory_version(self) -> None:
+        """The remote inventory can change at any time, so it is never cached."""
+        return None
+
+    async def _get_resource_inventory(self) -> dict[str, Resource]:
         """Gets the unfiltered resource inventory including local, mounted, and proxy resources."""
         # First get local and mounted resources from parent
-        all_resources = await super().get_resources()
+        all_resources = dict(await super()._get_resource_inventory())
 
         # Then add proxy resources, but don't overwrite existing ones
         try:
@@ -150,10 +201,10 @@ class ProxyResourceManager(ResourceManager, ProxyManagerMixin):
 
         return all_resources
 
-    async def get_resource_templates(self) -> dict[str, ResourceTemplate]:
+    async def _build_template_inventory(self) -> dict[str, ResourceTemplate]:
         """Gets the unfiltered template inventory including local, mounted, and proxy templates."""
         # First get local and mounted templates from parent
-        all_templates = await super().get_resource_templates()
+        all_templates = dict(await super()._build_template_inventory())
 
         # Then add proxy templates, but don't overwrite existing ones
         try:
@@ -208,10 +259,14 @@ class ProxyPromptManager(PromptManager, ProxyManagerMixin):
         super().__init__(**kwargs)
         self.client_factory = client_factory
 
-    async def get_prompts(self) -> dict[str, Prompt]:
+    def _inventory_version(self) -> None:
+        """The remote inventory can change at any time, so it is never cached."""
+        return None
+
+    async def _get_inventory(self) -> dict[str, Prompt]:
         """Gets the unfiltered prompt inventory including local, mounted, and proxy prompts."""
         # First get local and mounted prompts from parent
-        all_prompts = await super().get_prompts()
+        all_prompts = dict(await super()._get_inventory())
 
         # Then add proxy prompts, but don't overwrite existing ones
         try:
@@ -7,7 +7,7 @@ import json
 import re
 import secrets
 import warnings
-from collections.abc import AsyncIterator, Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
 from contextlib import (
     AbstractAsyncContextManager,
     AsyncExitStack,
@@ -16,7 +16,7 @@ from contextlib import (
 from dataclasses import dataclass
 from functools import partial
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Generic, Literal, cast, overload
+from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar, cast, overload
 
 import anyio
 import httpx
@@ -25,6 +25,7 @@ import uvicorn
 from mcp.server.lowlevel.helper_types import ReadResourceContents
 from mcp.server.lowlevel.server import LifespanResultT, NotificationOptions
 from mcp.server.stdio import stdio_server
+from mcp.shared.exceptions import McpError
 from mcp.types import (
     Annotations,
     AnyFunction,
@@ -60,13 +61,26 @@ from fastmcp.server.http import (
 )
 from fastmcp.server.low_level import LowLevelServer
 from fastmcp.server.middleware import Middleware, MiddlewareContext
+from fastmcp.server.middleware.middleware import (
+    MiddlewareHook,
+    compile_middleware_hooks,
+)
 from fastmcp.settings import Settings
 from fastmcp.tools import ToolManager
 from fastmcp.tools.tool import FunctionTool, Tool, ToolResult
+from fastmcp.tools.tool_cache import ToolCacheStats
+from fastmcp.tools.tool_limits import ToolCallStats
 from fastmcp.tools.tool_transform import ToolTransformConfig
 from fastmcp.utilities.cli import log_server_banner
-from fastmcp.utilities.components import FastMCPComponent
+from fastmcp.utilities.components import ComponentStateSnapshot, FastMCPComponent
+from fastmcp.utilities.executors import (
+    Executor,
+    ToolExecutor,
+    WorkerProcessPool,
+    WorkerThreadPool,
+)
 from fastmcp.utilities.logging import get_logger
+from fastmcp.utilities.pagination import InvalidCursorError, paginate
 from fastmcp.utilities.types import NotSet, NotSetT
 
 if TYPE_CHECKING:
@@ -90,6 +104,7 @@ logger = get_logger(__name__)
 
 DuplicateBehavior = Literal["warn", "error", "replace", "ignore"]
 Transport = Literal["stdio", "http", "sse", "streamable-http"]
+T = TypeVar("T")
 
 # Compiled URI parsing regex to split a URI into protocol and path components
 URI_PATTERN = re.compile(r"^([^:]+://)(.*?)$")
@@ -152,6 +167,11 @@ class FastMCP(Generic[LifespanResultT]):
         include_tags: set[str] | None = None,
         exclude_tags: set[str] | None = None,
         include_fastmcp_meta: bool | None = None,
+        list_page_size: int | None = None,
+        strict_input_validation: bool | None = None,
+        sync_executor: Executor | None = None,
+        sync_worker_threads: int | None = None,
+        process_workers: int | None = None,
         on_duplicate_tools: DuplicateBehavior | None = None,
         on_duplicate_resources: DuplicateBehavior | None = None,
         on_duplicate_prompts: DuplicateBehavior | None = None,
@@ -225,6 +245,13 @@ class FastMCP(Generic[LifespanResultT]):
         self.exclude_tags = exclude_tags
 
         self.middleware = middleware or []
+        self._compiled_middleware: list[Middleware] = []
+        self._compiled_middleware_hooks: dict[
+            tuple[str | None, str], tuple[MiddlewareHook, ...]
+        ] = {}
+        self._listing_cache: dict[
+            str, tuple[Any, ComponentStateSnapshot, list[Any]]
+        ] = {}
 
         # Set up MCP protocol handlers
         self._setup_handlers()
@@ -256,6 +283,33 @@ class FastMCP(Generic[LifespanResultT]):
             else fastmcp.settings.include_fastmcp_meta
         )
 
+        if list_page_size is not None and list_page_size < 1:
+            raise ValueError("list_page_size must be a positive integer")
+        self.list_page_size = (
+            list_page_size
+            if list_page_size is not None
+            else fastmcp.settings.list_page_size
+        )
+        self.strict_input_validation = (
+            strict_input_validation
+            if strict_input_validation is not None
+            else fastmcp.settings.strict_input_validation
+        )
+
+        if sync_worker_threads is not None and sync_worker_threads < 1:
+            raise ValueError("sync_worker_threads must be a positive integer")
+        self.sync_executor: Executor = sync_executor or fastmcp.settings.sync_executor
+        self.worker_pool = WorkerThreadPool(
+            sync_worker_threads
+            if sync_worker_threads is not None
+            else fastmcp.settings.sync_worker_threads
+        )
+        if process_workers is not None and process_workers < 1:
+            raise ValueError("process_workers must be a positive integer")
+        self.process_pool = WorkerProcessPool(
+            process_workers or fastmcp.settings.process_workers
+        )
+
         # handle deprecated settings
         self._handle_deprecated_settings(
             log_level=log_level,
@@ -387,11 +441,19 @@ class FastMCP(Generic[LifespanResultT]):
 
     def _setup_handlers(self) -> None:
         """Set up core MCP protocol handlers."""
-        self._mcp_server.list_tools()(self._mcp_list_tools)
-        self._mcp_server.list_resources()(self._mcp_list_resources)
-        self._mcp_server.list_resource_templates()(self._mcp_list_resource_templates)
-        self._mcp_server.list_prompts()(self._mcp_list_prompts)
-        self._mcp_server.call_tool()(self._mcp_call_tool)
+        # List handlers are registered directly, rather than through the low-level
+        # server's decorators, so that they can see the request's cursor
+        request_handlers = self._mcp_server.request_handlers
+        request_handlers[mcp.types.ListToolsRequest] = self._handle_list_tools
+        request_handlers[mcp.types.ListResourcesRequest] = self._handle_list_resources
+        request_handlers[mcp.types.ListResourceTemplatesRequest] = (
+            self._handle_list_resource_templates
+        )
+        request_handlers[mcp.types.ListPromptsRequest] = self._handle_list_prompts
+        # Arguments are validated against the input schema by _call_tool, with
+        # the tool it already looks up and a validator compiled once per tool,
+        # instead of by the SDK, which builds a new validator on every call
+        self._mcp_server.call_tool(validate_input=False)(self._mcp_call_tool)
         self._mcp_server.read_resource()(self._mcp_read_resource)
         self._mcp_server.get_prompt()(self._mcp_get_prompt)
 
@@ -402,10 +464,95 @@ class FastMCP(Generic[LifespanResultT]):
     ) -> Any:
         """Builds and executes the middleware chain."""
         chain = call_next
-        for mw in reversed(self.middleware):
-            chain = partial(mw, call_next=chain)
+        for hook in reversed(self._get_middleware_hooks(context.method, context.type)):
+            chain = partial(hook, call_next=chain)
         return await chain(context)
 
+    def _get_middleware_hooks(
+        self, method: str | None, message_type: str
+    ) -> tuple[MiddlewareHook, ...]:
+        """
+        Returns the compiled middleware hooks for a method and message type,
+        recompiling them only when the middleware list has changed.
+        """
+        # Compare by identity: hooks are bound to the middleware instances, so a
+        # value-equal replacement must still trigger a recompile
+        compiled = self._compiled_middleware
+        if len(compiled) != len(self.middleware) or any(
+            a is not b for a, b in zip(compiled, self.middleware)
+        ):
+            self._compiled_middleware = list(self.middleware)
+            self._compiled_middleware_hooks = {}
+
+        key = (method, message_type)
+        hooks = self._compiled_middleware_hooks.get(key)
+        if hooks is None:
+            hooks = compile_middleware_hooks(self.middleware, method, message_type)
+            self._compiled_middleware_hooks[key] = hooks
+        return hooks
+
+    def _get_listing_version(self, method: str) -> tuple[Any, ...] | None:
+        """
+        Returns a value that changes whenever the filtering applied to a list
+        method by this server or its mounted servers could change, or None if the
+        listing depends on middleware and therefore can't be cached.
+        """
+        if self._get_middleware_hooks(method, "request"):
+            return None
+
+        versions: list[Any] = [
+            None if self.include_tags is None else frozenset(self.include_tags),
+            None if self.exclude_tags is None else frozenset(self.exclude_tags),
+        ]
+        for mounted in self._mounted_servers:
+            child_version = mounted.server._get_listing_version(method)
+            if child_version is None:
+                return None
+            versions.append(child_version)
+        return tuple(versions)
+
+    async def _get_cached_listing(
+        self,
+        method: str,
+        manager: ToolManager | ResourceManager | PromptManager,
+        get_inventory: Callable[[], Awaitable[Mapping[str, FastMCPComponent]]],
+        convert: Callable[[], Awaitable[list[Any]]],
+    ) -> list[Any]:
+        """
+        Returns the converted MCP listing for a list method, reusing the previous
+        result until a component, the filter configuration or the middleware
+        changes anywhere in the mount tree. Listings that pass through middleware
+        or remote servers are always rebuilt.
+
+        Tags and meta can be edited in place without a field assignment, so they
+        are snapshotted with the listing and compared before it is reused.
+        """
+        listing_version = self._get_listing_version(method)
+        inventory_version = (
+            manager._inventory_version() if listing_version is not None else None
+        )
+        if inventory_version is None:
+            return await convert()
+
+        version = (inventory_version, listing_version, self.include_fastmcp_meta)
+        components = (await get_inventory()).values()
+        cached = self._listing_cache.get(method)
+        if (
+            cached is not None
+            and cached[0] == version
+            and cached[1].matches(components)
+        ):
+            return list(cached[2])
+
+        listing = await convert()
+        # snapshot after converting, since get_meta() can write into `meta`
+        self._listing_cache[method] = (
+            version,
+            ComponentStateSnapshot(components),
+            listing,
+        )
+        return list(listing)
+
     def add_middleware(self, middleware: Middleware) -> None:
         self.middleware.append(middleware)
 
@@ -414,10 +561,33 @@ class FastMCP(Generic[LifespanResultT]):
         return await self._tool_manager.get_tools()
 
     async def get_tool(self, key: str) -> Tool:
-        tools = await self.get_tools()
-        if key not in tools:
+        try:
+            return await self._tool_manager.get_tool(key)
+        except NotFoundError:
             raise NotFoundError(f"Unknown tool: {key}")
-        return tools[key]
+
+    async def get_tool_mount_prefix(self, key: str) -> str | None:
+        """
+        Get the prefix of the mounted server that calls to the tool with this key
+        go to, or None for local tools, unknown tools, and servers mounted
+        without a prefix.
+        """
+        return await self._tool_manager.get_mount_prefix(key)
+
+    def get_tool_call_stats(self) -> dict[str, ToolCallStats]:
+        """
+        Get the in-flight, queued, and timed-out calls of each local tool with
+        call limits (`max_concurrency` or `timeout`), indexed by tool key.
+        Tools appear once they have been called.
+        """
+        return self._tool_manager.get_call_stats()
+
+    def get_tool_cache_stats(self) -> ToolCacheStats:
+        """
+        Get the size and hit and miss counts of the cache for local tools with
+        a `cache_ttl`.
+        """
+        return self._tool_manager.get_cache_stats()
 
     async def get_resources(self) -> dict[str, Resource]:
         """Get all registered resources, indexed by registered key."""
@@ -520,10 +690,83 @@ class FastMCP(Generic[LifespanResultT]):
 
         return routes
 
+    def _paginate(
+        self,
+        request: mcp.types.PaginatedRequest | None,
+        items: list[T],
+        key: Callable[[T], str],
+    ) -> tuple[list[T], str | None]:
+        """
+        Returns the requested page of a listing and the cursor of the next page.
+        Requests without params (including the low-level server's internal
+        refreshes, which pass None) start from the first page.
+        """
+        cursor = request.params.cursor if request and request.params else None
+        try:
+            return paginate(items, cursor, self.list_page_size, key=key)
+        except InvalidCursorError as e:
+            raise McpError(
+                mcp.types.ErrorData(code=mcp.types.INVALID_PARAMS, message=str(e))
+            ) from e
+
+    async def _handle_list_tools(
+        self, request: mcp.types.ListToolsRequest | None
+    ) -> mcp.types.ServerResult:
+        tools = await self._mcp_list_tools()
+        if request is None:
+            # The low-level server refreshes its tool cache this way, and expects
+            # every tool in one response
+            page, next_cursor = tools, None
+        else:
+            page, next_cursor = self._paginate(request, tools, key=lambda t: t.name)
+
+        # Keep the low-level server's tool cache, used to validate tool call
+        # arguments, in sync with what was listed
+        tool_cache = self._mcp_server._tool_cache
+        if request is None or not (request.params and request.params.cursor):
+            tool_cache.clear()
+        for tool in page:
+            tool_cache[tool.name] = tool
+
+        return mcp.types.ServerResult(
+            mcp.types.ListToolsResult(tools=page, nextCursor=next_cursor)
+        )
+
+    async def _handle_list_resources(
+        self, request: mcp.types.ListResourcesRequest | None
+    ) -> mcp.types.ServerResult:
+        resources = await self._mcp_list_resources()
+        page, next_cursor = self._paginate(request, resources, key=lambda r: str(r.uri))
+        return mcp.types.ServerResult(
+            mcp.types.ListResourcesResult(resources=page, nextCursor=next_cursor)
+        )
+
+    async def _handle_list_resource_templates(
+        self, request: mcp.types.ListResourceTemplatesRequest | None
+    ) -> mcp.types.ServerResult:
+        templates = await self._mcp_list_resource_templates()
+        page, next_cursor = self._paginate(
+            request, templates, key=lambda t: t.uriTemplate
+        )
+        return mcp.types.ServerResult(
+            mcp.types.ListResourceTemplatesResult(
+                resourceTemplates=page, nextCursor=next_cursor
+            )
+        )
+
+    async def _handle_list_prompts(
+        self, request: mcp.types.ListPromptsRequest | None
+    ) -> mcp.types.ServerResult:
+        prompts = await self._mcp_list_prompts()
+        page, next_cursor = self._paginate(request, prompts, key=lambda p: p.name)
+        return mcp.types.ServerResult(
+            mcp.types.ListPromptsResult(prompts=page, nextCursor=next_cursor)
+        )
+
     async def _mcp_list_tools(self) -> list[MCPTool]:
         logger.debug(f"[{self.name}] Handler called: list_tools")
 
-        async with fastmcp.server.context.Context(fastmcp=self):
+        async def convert() -> list[MCPTool]:
             tools = await self._list_tools()
             return [
                 tool.to_mcp_tool(
@@ -533,6 +776,14 @@ class FastMCP(Generic[LifespanResultT]):
                 for tool in tools
             ]
 
+        async with fastmcp.server.context.Context(fastmcp=self):
+            return await self._get_cached_listing(
+                "tools/list",
+                self._tool_manager,
+                self._tool_manager._get_inventory,
+                convert,
+            )
+
     async def _list_tools(self) -> list[Tool]:
         """
         List all available tools, in the format expected by the low-level MCP
@@ -567,7 +818,7 @@ class FastMCP(Generic[LifespanResultT]):
     async def _mcp_list_resources(self) -> list[MCPResource]:
         logger.debug(f"[{self.name}] Handler called: list_resources")
 
-        async with fastmcp.server.context.Context(fastmcp=self):
+        async def convert() -> list[MCPResource]:
             resources = await self._list_resources()
             return [
                 resource.to_mcp_resource(
@@ -577,6 +828,14 @@ class FastMCP(Generic[LifespanResultT]):
                 for resource in resources
             ]
 
+        async with fastmcp.server.context.Context(fastmcp=self):
+            return await self._get_cached_listing(
+                "resources/list",
+                self._resource_manager,
+                self._resource_manager._get_resource_inventory,
+                convert,
+            )
+
     async def _list_resources(self) -> list[Resource]:
         """
         List all available resources, in the format expected by the low-level MCP
@@ -612,7 +871,7 @@ class FastMCP(Generic[LifespanResultT]):
     async def _mcp_list_resource_templates(self) -> list[MCPResourceTemplate]:
         logger.debug(f"[{self.name}] Handler called: list_resource_templates")
 
-        async with fastmcp.server.context.Context(fastmcp=self):
+        async def convert() -> list[MCPResourceTemplate]:
             templates = await self._list_resource_templates()
             return [
                 template.to_mcp_template(
@@ -622,6 +881,14 @@ class FastMCP(Generic[LifespanResultT]):
                 for template in templates
             ]
 
+        async with fastmcp.server.context.Context(fastmcp=self):
+            return await self._get_cached_listing(
+                "resources/templates/list",
+                self._resource_manager,
+                self._resource_manager._get_template_inventory,
+                convert,
+            )
+
     async def _list_resource_templates(self) -> list[ResourceTemplate]:
         """
         List all available resource templates, in the format expected by the low-level MCP
@@ -657,7 +924,7 @@ class FastMCP(Generic[LifespanResultT]):
     async def _mcp_list_prompts(self) -> list[MCPPrompt]:
         logger.debug(f"[{self.name}] Handler called: list_prompts")
 
-        async with fastmcp.server.context.Context(fastmcp=self):
+        async def convert() -> list[MCPPrompt]:
             prompts = await self._list_prompts()
             return [
                 prompt.to_mcp_prompt(
@@ -667,6 +934,14 @@ class FastMCP(Generic[LifespanResultT]):
                 for prompt in prompts
             ]
 
+        async with fastmcp.server.context.Context(fastmcp=self):
+            return await self._get_cached_listing(
+                "prompts/list",
+                self._prompt_manager,
+                self._prompt_manager._get_inventory,
+                convert,
+            )
+
     async def _list_prompts(self) -> list[Prompt]:
         """
         List all available prompts, in the format expected by the low-level MCP
@@ -738,6 +1013,7 @@ class FastMCP(Generic[LifespanResultT]):
             tool = await self._tool_manager.get_tool(context.message.name)
             if not self._should_enable_component(tool):
                 raise NotFoundError(f"Unknown tool: {context.message.name!r}")
+            tool.validate_input(context.message.arguments or {})
 
             return await self._tool_manager.call_tool(
                 key=context.message.name, arguments=context.message.arguments or {}
@@ -923,6 +1199,14 @@ class FastMCP(Generic[LifespanResultT]):
         exclude_args: list[str] | None = None,
         meta: dict[str, Any] | None = None,
         enabled: bool | None = None,
+        executor: ToolExecutor | None = None,
+        max_concurrency: int | None = None,
+        timeout: float | None = None,
+        queue_timeout: float | None = None,
+        cache_ttl: float | None = None,
+        batch_fn: Callable[..., Any] | None = None,
+        max_batch_size: int | None = None,
+        batch_window: float | None = None,
     ) -> FunctionTool: ...
 
     @overload
@@ -939,6 +1223,14 @@ class FastMCP(Generic[LifespanResultT]):
         exclude_args: list[str] | None = None,
         meta: dict[str, Any] | None = None,
         enabled: bool | None = None,
+        executor: ToolExecutor | None = None,
+        max_concurrency: int | None = None,
+        timeout: float | None = None,
+        queue_timeout: float | None = None,
+        cache_ttl: float | None = None,
+        batch_fn: Callable[..., Any] | None = None,
+        max_batch_size: int | None = None,
+        batch_window: float | None = None,
     ) -> Callable[[AnyFunction], FunctionTool]: ...
 
     def tool(
@@ -954,6 +1246,14 @@ class FastMCP(Generic[LifespanResultT]):
         exclude_args: list[str] | None = None,
         meta: dict[str, Any] | None = None,
         enabled: bool | None = None,
+        executor: ToolExecutor | None = None,
+        max_concurrency: int | None = None,
+        timeout: float | None = None,
+        queue_timeout: float | None = None,
+        cache_ttl: float | None = None,
+        batch_fn: Callable[..., Any] | None = None,
+        max_batch_size: int | None = None,
+        batch_window: float | None = None,
     ) -> Callable[[AnyFunction], FunctionTool] | FunctionTool:
         """Decorator to register a tool.
 
@@ -978,6 +1278,26 @@ class FastMCP(Generic[LifespanResultT]):
             exclude_args: Optional list of argument names to exclude from the tool schema
             meta: Optional meta information about the tool
             enabled: Optional boolean to enable or disable the tool
+            executor: Optional executor for a synchronous tool: "thread" to run it
+                in the worker thread pool, "inline" to run it on the event loop, or
+                "process" to run it in the worker process pool. Defaults to the
+                server's `sync_executor`.
+            max_concurrency: Optional maximum number of calls to the tool that run
+                at once. Further calls wait for a free slot in FIFO order.
+            timeout: Optional maximum time, in seconds, a call may run before it
+                fails
+            queue_timeout: Optional maximum time, in seconds, a call waits for a
+                free slot before it fails. Only applies with max_concurrency.
+            cache_ttl: Optional time, in seconds, to cache the tool's results by
+                arguments. Only use this for idempotent tools whose results don't
+                depend on the caller.
+            batch_fn: Optional vectorized implementation of the tool, which takes a
+                list with the arguments of many calls and returns a list with one
+                result per call. Concurrent calls are coalesced into one call of it.
+            max_batch_size: Optional maximum number of calls passed to batch_fn at
+                once
+            batch_window: Optional time, in seconds, a batch waits for more calls
+                before batch_fn is called. Defaults to 5 milliseconds.
 
         Examples:
             Register a tool with a custom name:
@@ -1038,6 +1358,14 @@ class FastMCP(Generic[LifespanResultT]):
                 meta=meta,
                 serializer=self._tool_serializer,
                 enabled=enabled,
+                executor=executor,
+                max_concurrency=max_concurrency,
+                timeout=timeout,
+                queue_timeout=queue_timeout,
+                cache_ttl=cache_ttl,
+                batch_fn=batch_fn,
+                max_batch_size=max_batch_size,
+                batch_window=batch_window,
             )
             self.add_tool(tool)
             return tool
@@ -1070,6 +1398,14 @@ class FastMCP(Generic[LifespanResultT]):
             exclude_args=exclude_args,
             meta=meta,
             enabled=enabled,
+            executor=executor,
+            max_concurrency=max_concurrency,
+            timeout=timeout,
+            queue_timeout=queue_timeout,
+            cache_ttl=cache_ttl,
+            batch_fn=batch_fn,
+            max_batch_size=max_batch_size,
+            batch_window=batch_window,
         )
 
     def add_resource(self, resource: Resource) -> Resource:
@@ -1164,6 +1500,7 @@ class FastMCP(Generic[LifespanResultT]):
         mime_type: str | None = None,
         tags: set[str] | None = None,
         enabled: bool | None = None,
+        executor: Executor | None = None,
         annotations: Annotations | dict[str, Any] | None = None,
         meta: dict[str, Any] | None = None,
     ) -> Callable[[AnyFunction], Resource | ResourceTemplate]:
@@ -1189,6 +1526,9 @@ class FastMCP(Generic[LifespanResultT]):
             mime_type: Optional MIME type for the resource
             tags: Optional set of tags for categorizing the resource
             enabled: Optional boolean to enable or disable the resource
+            executor: Optional executor for a synchronous resource: "thread" to run it
+                in the worker thread pool or "inline" to run it on the event loop.
+                Defaults to the server's `sync_executor`.
             annotations: Optional annotations about the resource's behavior
             meta: Optional meta information about the resource
 
@@ -1263,6 +1603,7 @@ class FastMCP(Generic[LifespanResultT]):
                     mime_type=mime_type,
                     tags=tags,
                     enabled=enabled,
+                    executor=executor,
                     annotations=cast(Annotations | None, annotations),
                     meta=meta,
                 )
@@ -1278,6 +1619,7 @@ class FastMCP(Generic[LifespanResultT]):
                     mime_type=mime_type,
                     tags=tags,
                     enabled=enabled,
+                    executor=executor,
                     annotations=cast(Annotations | None, annotations),
                     meta=meta,
                 )
@@ -1323,6 +1665,7 @@ class FastMCP(Generic[LifespanResultT]):
         description: str | None = None,
         tags: set[str] | None = None,
         enabled: bool | None = None,
+        executor: Executor | None = None,
         meta: dict[str, Any] | None = None,
     ) -> FunctionPrompt: ...
 
@@ -1336,6 +1679,7 @@ class FastMCP(Generic[LifespanResultT]):
         description: str | None = None,
         tags: set[str] | None = None,
         enabled: bool | None = None,
+        executor: Executor | None = None,
         meta: dict[str, Any] | None = None,
     ) -> Callable[[AnyFunction], FunctionPrompt]: ...
 
@@ -1348,6 +1692,7 @@ class FastMCP(Generic[LifespanResultT]):
         description: str | None = None,
         tags: set[str] | None = None,
         enabled: bool | None = None,
+        executor: Executor | None = None,
         meta: dict[str, Any] | None = None,
     ) -> Callable[[AnyFunction], FunctionPrompt] | FunctionPrompt:
         """Decorator to register a prompt.
@@ -1369,6 +1714,9 @@ class FastMCP(Generic[LifespanResultT]):
             description: Optional description of what the prompt does
             tags: Optional set of tags for categorizing the prompt
             enabled: Optional boolean to enable or disable the prompt
+            executor: Optional executor for a synchronous prompt: "thread" to run it
+                in the worker thread pool or "inline" to run it on the event loop.
+                Defaults to the server's `sync_executor`.
             meta: Optional meta information about the prompt
 
         Examples:
@@ -1447,6 +1795,7 @@ class FastMCP(Generic[LifespanResultT]):
                 description=description,
                 tags=tags,
                 enabled=enabled,
+                executor=executor,
                 meta=meta,
             )
             self.add_prompt(prompt)
@@ -1477,6 +1826,7 @@ class FastMCP(Generic[LifespanResultT]):
             description=description,
             tags=tags,
             enabled=enabled,
+            executor=executor,
             meta=meta,
         )
 
@@ -335,6 +335,133 @@ class Settings(BaseSettings):
         ),
     ] = False
 
+    list_page_size: Annotated[
+        int | None,
+        Field(
+            gt=0,
+            description=inspect.cleandoc(
+                """
+                The default number of items returned per page by the tools/list,
+                resources/list, resources/templates/list and prompts/list endpoints.
+                If None, lists are returned in full on a single page.
+                """
+            ),
+        ),
+    ] = None
+
+    strict_input_validation: Annotated[
+        bool,
+        Field(
+            description=inspect.cleandoc(
+                """
+                If True, function tools validate their arguments in pydantic's strict
+                mode, so values that lax mode would convert (e.g. 1.0 for an integer)
+                are rejected. If False, pydantic's lax mode converts compatible
+                values. Either way, tool call arguments are checked against the
+                tool's JSON input schema first.
+                """
+            ),
+        ),
+    ] = False
+
+    sync_executor: Annotated[
+        Literal["inline", "thread"],
+        Field(
+            description=inspect.cleandoc(
+                """
+                Where synchronous tools, resources, and prompts run. "inline" runs them
+                on the event loop; "thread" runs them in a bounded worker thread pool
+                so they don't block the event loop. Individual components can
+                override this with their `executor` option.
+                """
+            ),
+        ),
+    ] = "inline"
+
+    sync_worker_threads: Annotated[
+        int,
+        Field(
+            gt=0,
+            description=inspect.cleandoc(
+                """
+                The maximum number of synchronous tools, resources, and prompts that
+                run at once in a server's worker thread pool. Further calls wait for
+                a free worker.
+                """
+            ),
+        ),
+    ] = 40
+
+    process_workers: Annotated[
+        int | None,
+        Field(
+            gt=0,
+            description=inspect.cleandoc(
+                """
+                The number of worker processes in a server's process pool, which runs
+                tools with `executor="process"`. If None, the number of CPUs is used.
+                """
+            ),
+        ),
+    ] = None
+
+    tool_stream_max_bytes: Annotated[
+        int | None,
+        Field(
+            gt=0,
+            description=inspect.cleandoc(
+                """
+                The maximum size, in bytes, of the content kept for the final result of
+                a tool that streams content blocks from an async generator. Blocks past
+                the limit are still sent to the client as progress notifications, but
+                are left out of the final result. Set to None to keep everything.
+                """
+            ),
+        ),
+    ] = 10_000_000
+
+    tool_cache_max_entries: Annotated[
+        int | None,
+        Field(
+            gt=0,
+            description=inspect.cleandoc(
+                """
+                The maximum number of results a server keeps for tools with a
+                `cache_ttl`. The least recently used results are evicted first. Set to
+                None for no limit.
+                """
+            ),
+        ),
+    ] = 1000
+
+    tool_cache_max_bytes: Annotated[
+        int | None,
+        Field(
+            gt=0,
+            description=inspect.cleandoc(
+                """
+                The maximum total size, in bytes, of the results a server keeps for
+                tools with a `cache_ttl`. Larger results are not cached. Set to None
+                for no limit.
+                """
+            ),
+        ),
+    ] = 50_000_000
+
+    mounted_components_load_timeout: Annotated[
+        float | None,
+        Field(
+            description=inspect.cleandoc(
+                """
+                The maximum time, in seconds, to wait for a single mounted server to return
+                its components (tools, resources, prompts). Mounted servers are queried
+                concurrently; a mount that exceeds the timeout is treated like any other
+                load error. Set to None or 0 to disable.
+                """
+            ),
+        ),
+    ] = None
+
 
 def __getattr__(name: str):
     """
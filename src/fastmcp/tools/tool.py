@@ -2,27 +2,35 @@ from __future__ import annotations
 
 import inspect
 import warnings
-from collections.abc import Callable
+from collections.abc import AsyncGenerator, Callable
+from contextlib import aclosing
 from dataclasses import dataclass
 from typing import (
     TYPE_CHECKING,
     Annotated,
     Any,
+    ClassVar,
     Generic,
     Literal,
     TypeVar,
     get_type_hints,
 )
 
+import jsonschema
 import mcp.types
 import pydantic_core
+from jsonschema.protocols import Validator
 from mcp.types import ContentBlock, TextContent, ToolAnnotations
 from mcp.types import Tool as MCPTool
-from pydantic import Field, PydanticSchemaGenerationError
+from pydantic import Field, PrivateAttr, PydanticSchemaGenerationError
 
 import fastmcp
+from fastmcp.exceptions import ToolError
 from fastmcp.server.dependencies import get_context
+from fastmcp.tools.tool_batch import DEFAULT_BATCH_WINDOW, ToolBatcher
+from fastmcp.utilities.call_plan import CallPlan
 from fastmcp.utilities.components import FastMCPComponent
+from fastmcp.utilities.executors import ToolExecutor
 from fastmcp.utilities.json_schema import compress_schema
 from fastmcp.utilities.logging import get_logger
 from fastmcp.utilities.types import (
@@ -37,6 +45,7 @@ from fastmcp.utilities.types import (
 )
 
 if TYPE_CHECKING:
+    from fastmcp.server.context import Context
     from fastmcp.tools.tool_transform import ArgTransform, TransformedTool
 
 logger = get_logger(__name__)
@@ -73,21 +82,9 @@ class ToolResult:
         self.content = _convert_to_content(content)
 
         if structured_content is not None:
-            try:
-                structured_content = pydantic_core.to_jsonable_python(
-                    structured_content
-                )
-            except pydantic_core.PydanticSerializationError as e:
-                logger.error(
-                    f"Could not serialize structured content. If this is unexpected, set your tool's output_schema to None to disable automatic serialization: {e}"
-                )
-                raise
-            if not isinstance(structured_content, dict):
-                raise ValueError(
-                    "structured_content must be a dict or None. "
-                    f"Got {type(structured_content).__name__}: {structured_content!r}. "
-                    "Tools should wrap non-dict values based on their output_schema."
-                )
+            structured_content = _check_structured_content(
+                _to_jsonable_structured_content(structured_content)
+            )
         self.structured_content: dict[str, Any] | None = structured_content
 
     def to_mcp_result(
@@ -101,6 +98,12 @@ class ToolResult:
 class Tool(FastMCPComponent):
     """Internal tool registration info."""
 
+    _listing_fields: ClassVar[frozenset[str]] = FastMCPComponent._listing_fields | {
+        "parameters",
+        "output_schema",
+        "annotations",
+    }
+
     parameters: Annotated[
         dict[str, Any], Field(description="JSON schema for tool parameters")
     ]
@@ -115,6 +118,59 @@ class Tool(FastMCPComponent):
         Callable[[Any], str] | None,
         Field(description="Optional custom serializer for tool results"),
     ] = None
+    max_concurrency: Annotated[
+        int | None,
+        Field(
+            gt=0,
+            description="The maximum number of calls to the tool that run at once. Further calls wait in FIFO order.",
+        ),
+    ] = None
+    timeout: Annotated[
+        float | None,
+        Field(
+            gt=0,
+            description="The maximum time, in seconds, a call to the tool may run before it fails",
+        ),
+    ] = None
+    queue_timeout: Annotated[
+        float | None,
+        Field(
+            ge=0,
+            description="The maximum time, in seconds, a call waits for a free slot when the tool is at its max_concurrency",
+        ),
+    ] = None
+    cache_ttl: Annotated[
+        float | None,
+        Field(
+            gt=0,
+            description="If set, results are cached by arguments for this many seconds. Only for idempotent tools.",
+        ),
+    ] = None
+
+    _input_validator: tuple[dict[str, Any], Validator] | None = PrivateAttr(
+        default=None
+    )
+
+    def validate_input(self, arguments: dict[str, Any]) -> None:
+        """
+        Validate arguments against the tool's input schema, as the MCP SDK does
+        for tools/call requests, but with a validator that is compiled once per
+        schema rather than on every call.
+
+        Raises:
+            ToolError: If the arguments don't match the schema
+        """
+        cached = self._input_validator
+        if cached is None or cached[0] is not self.parameters:
+            validator_class = jsonschema.validators.validator_for(self.parameters)
+            validator_class.check_schema(self.parameters)
+            cached = self._input_validator = (
+                self.parameters,
+                validator_class(self.parameters),
+            )
+        error = jsonschema.exceptions.best_match(cached[1].iter_errors(arguments))
+        if error is not None:
+            raise ToolError(f"Input validation error: {error.message}")
 
     def enable(self) -> None:
         super().enable()
@@ -169,6 +225,14 @@ class Tool(FastMCPComponent):
         serializer: Callable[[Any], str] | None = None,
         meta: dict[str, Any] | None = None,
         enabled: bool | None = None,
+        executor: ToolExecutor | None = None,
+        max_concurrency: int | None = None,
+        timeout: float | None = None,
+        queue_timeout: float | None = None,
+        cache_ttl: float | None = None,
+        batch_fn: Callable[..., Any] | None = None,
+        max_batch_size: int | None = None,
+        batch_window: float | None = None,
     ) -> FunctionTool:
         """Create a Tool from a function."""
         return FunctionTool.from_function(
@@ -183,6 +247,14 @@ class Tool(FastMCPComponent):
             serializer=serializer,
             meta=meta,
             enabled=enabled,
+            executor=executor,
+            max_concurrency=max_concurrency,
+            timeout=timeout,
+            queue_timeout=queue_timeout,
+            cache_ttl=cache_ttl,
+            batch_fn=batch_fn,
+            max_batch_size=max_batch_size,
+            batch_window=batch_window,
         )
 
     async def run(self, arguments: dict[str, Any]) -> ToolResult:
@@ -235,6 +307,101 @@ class Tool(FastMCPComponent):
 class FunctionTool(Tool):
     fn: Callable[..., Any]
 
+    executor: ToolExecutor | None = Field(
+        default=None,
+        description="Where the tool runs if it is synchronous. If None, the server's executor is used.",
+    )
+
+    batch_fn: Callable[..., Any] | None = Field(
+        default=None,
+        description="A vectorized implementation that takes the arguments of many calls and returns one result per call. Concurrent calls are coalesced into one call of it.",
+    )
+    max_batch_size: int | None = Field(
+        default=None,
+        gt=0,
+        description="The maximum number of calls passed to batch_fn at once",
+    )
+    batch_window: float | None = Field(
+        default=None,
+        ge=0,
+        description="How long, in seconds, a batch waits for more calls before batch_fn is called. If None, a default of 5 milliseconds is used.",
+    )
+
+    _call_plan: CallPlan | None = PrivateAttr(default=None)
+    _batch_plan: CallPlan | None = PrivateAttr(default=None)
+    _batcher: ToolBatcher | None = PrivateAttr(default=None)
+
+    def _get_call_plan(self) -> CallPlan:
+        """
+        Returns the call plan of `fn`, rebuilding it if `fn` or `executor` has
+        been replaced.
+        """
+        plan = self._call_plan
+        if plan is None or plan.fn is not self.fn or plan.executor != self.executor:
+            plan = self._call_plan = CallPlan.from_function(
+                self.fn, executor=self.executor
+            )
+        return plan
+
+    def _get_batch_plan(self) -> CallPlan:
+        """
+        Returns the call plan of `batch_fn`, rebuilding it if `batch_fn` or
+        `executor` has been replaced.
+        """
+        assert self.batch_fn is not None
+        plan = self._batch_plan
+        if (
+            plan is None
+            or plan.fn is not self.batch_fn
+            or plan.executor != self.executor
+        ):
+            plan = CallPlan.from_function(
+                self.batch_fn, validate=False, executor=self.executor
+            )
+            if len([p for p in plan.parameters if p != plan.context_kwarg]) != 1:
+                raise ValueError(
+                    f"The batch function of tool {self.name!r} must take exactly one "
+                    "parameter, the list of arguments of each call, besides an "
+                    "optional Context"
+                )
+            self._batch_plan = plan
+        return plan
+
+    def _get_batcher(self) -> ToolBatcher:
+        """
+        Returns the batcher that coalesces calls to `batch_fn`, replacing it if
+        the batch settings have changed.
+        """
+        batch_window = (
+            self.batch_window if self.batch_window is not None else DEFAULT_BATCH_WINDOW
+        )
+        batcher = self._batcher
+        if (
+            batcher is None
+            or batcher.max_batch_size != self.max_batch_size
+            or batcher.batch_window != batch_window
+        ):
+            batcher = self._batcher = ToolBatcher(
+                self._call_batch_fn,
+                max_batch_size=self.max_batch_size,
+                batch_window=batch_window,
+            )
+        return batcher
+
+    async def _call_batch_fn(self, arguments: list[dict[str, Any]]) -> list[Any]:
+        plan = self._get_batch_plan()
+        name = next(p for p in plan.parameters if p != plan.context_kwarg)
+        return list(await plan.call({name: arguments}))
+
+    def get_meta(
+        self, include_fastmcp_meta: bool | None = None
+    ) -> dict[str, Any] | None:
+        meta = super().get_meta(include_fastmcp_meta=include_fastmcp_meta)
+        # let clients and proxies know that concurrent calls are batched
+        if self.batch_fn is not None and meta and "_fastmcp" in meta:
+            meta["_fastmcp"]["batch"] = True
+        return meta
+
     @classmethod
     def from_function(
         cls,
@@ -249,11 +416,22 @@ class FunctionTool(Tool):
         serializer: Callable[[Any], str] | None = None,
         meta: dict[str, Any] | None = None,
         enabled: bool | None = None,
+        executor: ToolExecutor | None = None,
+        max_concurrency: int | None = None,
+        timeout: float | None = None,
+        queue_timeout: float | None = None,
+        cache_ttl: float | None = None,
+        batch_fn: Callable[..., Any] | None = None,
+        max_batch_size: int | None = None,
+        batch_window: float | None = None,
     ) -> FunctionTool:
         """Create a Tool from a function."""
 
         parsed_fn = ParsedFunction.from_function(fn, exclude_args=exclude_args)
 
+        if batch_fn is not None and inspect.isasyncgenfunction(fn):
+            raise ValueError("Streaming tools can't have a batch function")
+
         if name is None and parsed_fn.name == "<lambda>":
             raise ValueError("You must provide a name for lambda functions")
 
@@ -280,7 +458,7 @@ class FunctionTool(Tool):
                     f'Output schemas must have "type" set to "object" due to MCP spec limitations. Received: {final_output_schema!r}'
                 )
 
-        return cls(
+        tool = cls(
             fn=parsed_fn.fn,
             name=name or parsed_fn.name,
             title=title,
@@ -292,50 +470,40 @@ class FunctionTool(Tool):
             serializer=serializer,
             meta=meta,
             enabled=enabled if enabled is not None else True,
+            executor=executor,
+            max_concurrency=max_concurrency,
+            timeout=timeout,
+            queue_timeout=queue_timeout,
+            cache_ttl=cache_ttl,
+            batch_fn=batch_fn,
+            max_batch_size=max_batch_size,
+            batch_window=batch_window,
         )
+        tool._get_call_plan()
+        if batch_fn is not None:
+            tool._get_batch_plan()
+        return tool
 
     async def run(self, arguments: dict[str, Any]) -> ToolResult:
         """Run the tool with arguments."""
-        from fastmcp.server.context import Context
-
-        arguments = arguments.copy()
-
-        context_kwarg = find_kwarg_by_type(self.fn, kwarg_type=Context)
-        if context_kwarg and context_kwarg not in arguments:
-            arguments[context_kwarg] = get_context()
-
-        type_adapter = get_cached_typeadapter(self.fn)
-        result = type_adapter.validate_python(arguments)
-
-        if inspect.isawaitable(result):
-            result = await result
+        plan = self._get_call_plan()
+        strict = _use_strict_input_validation()
+        if self.batch_fn is not None:
+            arguments = plan.validate_arguments(arguments, strict=strict)
+            result = await self._get_batcher().call(arguments)
+        else:
+            result = await plan.call(arguments, strict=strict)
 
         if isinstance(result, ToolResult):
             return result
 
-        unstructured_result = _convert_to_content(result, serializer=self.serializer)
-
-        structured_output = None
-        # First handle structured content based on output schema, if any
-        if self.output_schema is not None:
-            if self.output_schema.get("x-fastmcp-wrap-result"):
-                # Schema says wrap - always wrap in result key
-                structured_output = {"result": result}
-            else:
-                structured_output = result
-        # If no output schema, try to serialize the result. If it is a dict, use
-        # it as structured content. If it is not a dict, ignore it.
-        if structured_output is None:
-            try:
-                structured_output = pydantic_core.to_jsonable_python(result)
-                if not isinstance(structured_output, dict):
-                    structured_output = None
-            except Exception:
-                pass
+        if inspect.isasyncgen(result):
+            return ToolResult(
+                content=await _collect_stream(result, serializer=self.serializer)
+            )
 
-        return ToolResult(
-            content=unstructured_result,
-            structured_content=structured_output,
+        return _convert_to_tool_result(
+            result, serializer=self.serializer, output_schema=self.output_schema
         )
 
 
@@ -419,6 +587,11 @@ class ParsedFunction:
                 # If resolution fails, keep the string annotation
                 pass
 
+        # async generators stream content blocks, which don't form structured
+        # content
+        if inspect.isasyncgenfunction(fn):
+            output_type = None
+
         if output_type not in (inspect._empty, None, Any, ...):
             # there are a variety of types that we don't want to attempt to
             # serialize because they are either used by FastMCP internally,
@@ -476,6 +649,174 @@ class ParsedFunction:
         )
 
 
+_UNSERIALIZABLE = object()
+
+
+def _to_jsonable_structured_content(structured_content: Any) -> Any:
+    try:
+        return pydantic_core.to_jsonable_python(structured_content)
+    except pydantic_core.PydanticSerializationError as e:
+        logger.error(
+            f"Could not serialize structured content. If this is unexpected, set your tool's output_schema to None to disable automatic serialization: {e}"
+        )
+        raise
+
+
+def _check_structured_content(structured_content: Any) -> dict[str, Any] | None:
+    if structured_content is not None and not isinstance(structured_content, dict):
+        raise ValueError(
+            "structured_content must be a dict or None. "
+            f"Got {type(structured_content).__name__}: {structured_content!r}. "
+            "Tools should wrap non-dict values based on their output_schema."
+        )
+    return structured_content
+
+
+def _serializes_as_single_text_block(result: Any) -> bool:
+    """Whether `_convert_to_content` would serialize the whole result as one text block."""
+    if result is None or isinstance(result, str | ContentBlock | Image | Audio | File):
+        return False
+    if isinstance(result, list | tuple):
+        # an empty sequence is converted to no content at all
+        return bool(result) and not any(
+            isinstance(item, ContentBlock | Image | Audio | File) for item in result
+        )
+    return True
+
+
+def _convert_to_tool_result(
+    result: Any,
+    serializer: Callable[[Any], str] | None = None,
+    output_schema: dict[str, Any] | None = None,
+) -> ToolResult:
+    """
+    Convert a tool function's return value to a ToolResult.
+
+    The result is converted to JSON-compatible data once, and both the
+    structured content and (with the default serializer) the text content are
+    derived from that data, so large results aren't serialized twice.
+    """
+    if output_schema is not None:
+        data = _to_jsonable_structured_content(result)
+    else:
+        # without a schema, structured content is best-effort
+        try:
+            data = pydantic_core.to_jsonable_python(result)
+        except Exception:
+            data = _UNSERIALIZABLE
+
+    if (
+        serializer is None
+        and data is not _UNSERIALIZABLE
+        and _serializes_as_single_text_block(result)
+    ):
+        content: list[ContentBlock] = [
+            TextContent(type="text", text=pydantic_core.to_json(data).decode())
+        ]
+    else:
+        content = _convert_to_content(result, serializer=serializer)
+
+    if output_schema is not None:
+        if output_schema.get("x-fastmcp-wrap-result"):
+            # Schema says wrap - always wrap in result key
+            structured_content = {"result": data}
+        else:
+            structured_content = _check_structured_content(data)
+    # If there is no output schema, use the result as structured content if it
+    # serializes to a dict, and ignore it otherwise
+    elif isinstance(data, dict):
+        structured_content = data
+    else:
+        structured_content = None
+
+    tool_result = ToolResult(content=content)
+    # already JSON-compatible, so skip ToolResult's own conversion
+    tool_result.structured_content = structured_content
+    return tool_result
+
+
+def _content_block_size(block: ContentBlock) -> int:
+    if isinstance(block, TextContent):
+        return len(block.text)
+    if isinstance(block, mcp.types.ImageContent | mcp.types.AudioContent):
+        return len(block.data)
+    return len(block.model_dump_json())
+
+
+def _use_strict_input_validation() -> bool:
+    """
+    Whether the server handling the current request validates tool arguments
+    in pydantic's strict mode, falling back to `settings.strict_input_validation`
+    outside of a request.
+    """
+    try:
+        return get_context().fastmcp.strict_input_validation
+    except RuntimeError:
+        return fastmcp.settings.strict_input_validation
+
+
+def _get_progress_context() -> Context | None:
+    """Returns the current context if the client asked for progress on its request."""
+    try:
+        context = get_context()
+        meta = context.request_context.meta
+    except (RuntimeError, ValueError):
+        return None
+    if meta is None or meta.progressToken is None:
+        return None
+    return context
+
+
+async def _collect_stream(
+    stream: AsyncGenerator[Any, None],
+    serializer: Callable[[Any], str] | None = None,
+) -> list[ContentBlock]:
+    """
+    Consume the async generator returned by a streaming tool.
+
+    Each content block is sent to the client as a progress notification as soon
+    as it is yielded, if the client asked for progress, and is kept for the
+    final result until `settings.tool_stream_max_bytes` of content has been
+    kept. Later blocks are still sent as progress but replaced in the final
+    result by a note saying how many were omitted.
+    """
+    context = _get_progress_context()
+    max_bytes = fastmcp.settings.tool_stream_max_bytes
+    content: list[ContentBlock] = []
+    kept_bytes = 0
+    omitted = 0
+    progress = 0
+
+    async with aclosing(stream):
+        async for item in stream:
+            for block in _convert_to_content(item, serializer=serializer):
+                progress += 1
+                if context is not None:
+                    await context.report_progress(
+                        progress,
+                        message=block.text
+                        if isinstance(block, TextContent)
+                        else block.model_dump_json(by_alias=True, exclude_none=True),
+                    )
+
+                size = _content_block_size(block)
+                if max_bytes is not None and kept_bytes + size > max_bytes:
+                    omitted += 1
+                    continue
+                kept_bytes += size
+                content.append(block)
+
+    if omitted:
+        content.append(
+            TextContent(
+                type="text",
+                text=f"[{omitted} more content blocks were omitted because the "
+                f"result exceeded {max_bytes} bytes]",
+            )
+        )
+    return content
+
+
 def _convert_to_content(
     result: Any,
     serializer: Callable[[Any], str] | None = None,
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import anyio
+
+DEFAULT_BATCH_WINDOW = 0.005
+"""How long, in seconds, a batch waits for more calls before it runs by default."""
+
+
+class _BatchedCall:
+    def __init__(self, arguments: dict[str, Any]) -> None:
+        self.arguments = arguments
+        self.done = anyio.Event()
+        self.result: Any = None
+        self.error: Exception | None = None
+
+
+class _Batch:
+    def __init__(self) -> None:
+        self.calls: list[_BatchedCall] = []
+        self.full = anyio.Event()
+
+
+class ToolBatcher:
+    """
+    Coalesces concurrent calls to a batchable tool into one call of its
+    vectorized implementation. The first call opens a batch and waits up to
+    `batch_window` seconds, or until the batch holds `max_batch_size` calls, for
+    more calls to join it; then the whole batch runs at once and each call gets
+    its own result.
+
+    Args:
+        call_batch: Called with the arguments of every call in a batch, in the
+            order the calls arrived. It must return one result per call. A
+            result that is an exception is raised by its call only; an exception
+            raised by `call_batch` itself is raised by every call in the batch.
+        max_batch_size: The maximum number of calls in a batch, or None for no
+            limit
+        batch_window: How long, in seconds, a batch waits for more calls
+    """
+
+    def __init__(
+        self,
+        call_batch: Callable[[list[dict[str, Any]]], Awaitable[list[Any]]],
+        max_batch_size: int | None = None,
+        batch_window: float = DEFAULT_BATCH_WINDOW,
+    ):
+        self.call_batch = call_batch
+        self.max_batch_size = max_batch_size
+        self.batch_window = batch_window
+        self._open: _Batch | None = None
+
+    async def call(self, arguments: dict[str, Any]) -> Any:
+        """Add a call to the open batch, or open a new one, and return its result."""
+        call = _BatchedCall(arguments)
+        batch = self._open
+        if batch is None:
+            batch = self._open = _Batch()
+            batch.calls.append(call)
+            await self._lead(batch)
+        else:
+            batch.calls.append(call)
+            if self.max_batch_size and len(batch.calls) >= self.max_batch_size:
+                # later calls open a new batch
+                self._open = None
+                batch.full.set()
+            await call.done.wait()
+
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    async def _lead(self, batch: _Batch) -> None:
+        try:
+            with anyio.move_on_after(self.batch_window):
+                await batch.full.wait()
+        finally:
+            if self._open is batch:
+                self._open = None
+            # the other calls in the batch depend on this one to run it, so it
+            # runs even if this call is cancelled
+            with anyio.CancelScope(shield=True):
+                await self._run(batch)
+
+    async def _run(self, batch: _Batch) -> None:
+        calls = batch.calls
+        try:
+            results = await self.call_batch([call.arguments for call in calls])
+            if len(results) != len(calls):
+                raise ValueError(
+                    f"Batch function returned {len(results)} results for "
+                    f"{len(calls)} calls"
+                )
+        except Exception as e:
+            for call in calls:
+                call.error = e
+        else:
+            for call, result in zip(calls, results):
+                if isinstance(result, Exception):
+                    call.error = result
+                else:
+                    call.result = result
+        finally:
+            for call in calls:
+                call.done.set()
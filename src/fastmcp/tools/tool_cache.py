@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+import anyio
+import pydantic_core
+
+from fastmcp.tools.tool import ToolResult, _content_block_size
+
+
+@dataclass(frozen=True)
+class ToolCacheStats:
+    """
+    A point-in-time view of a tool result cache.
+
+    Attributes:
+        entries: The number of cached results
+        bytes: The approximate size of the cached results
+        hits: The number of calls answered from the cache, including calls that
+            waited for an identical call already in progress
+        misses: The number of calls that ran the tool
+        evictions: The number of results evicted to stay within the bounds
+    """
+
+    entries: int
+    bytes: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+@dataclass
+class _CacheEntry:
+    result: ToolResult
+    expires_at: float
+    size: int
+
+
+class _PendingCall:
+    def __init__(self) -> None:
+        self.done = anyio.Event()
+        self.result: ToolResult | None = None
+        self.error: Exception | None = None
+
+
+def canonicalize_arguments(arguments: dict[str, Any]) -> str:
+    """Returns a string that is the same for equal arguments, regardless of key order."""
+    return json.dumps(arguments, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def _result_size(result: ToolResult) -> int:
+    size = sum(_content_block_size(block) for block in result.content)
+    if result.structured_content is not None:
+        size += len(pydantic_core.to_json(result.structured_content))
+    return size
+
+
+class ToolResultCache:
+    """
+    Caches the results of tools that opt in with `cache_ttl`, keyed by tool key
+    and arguments. The least recently used results are evicted to stay within
+    `max_entries` and `max_bytes`, and identical calls made while a result is
+    being computed wait for it instead of running the tool again.
+    """
+
+    def __init__(self, max_entries: int | None = None, max_bytes: int | None = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[str, str], _CacheEntry] = OrderedDict()
+        self._pending: dict[tuple[str, str], _PendingCall] = {}
+        self._bytes = 0
+        # bumped by every invalidation, so calls that were already running
+        # don't store results computed before it
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    async def get_or_call(
+        self,
+        key: str,
+        arguments: dict[str, Any],
+        ttl: float,
+        call: Callable[[], Awaitable[ToolResult]],
+    ) -> ToolResult:
+        """
+        Returns the cached result of calling the tool with these arguments, or
+        calls it and caches the result for `ttl` seconds. Errors are not cached.
+        """
+        cache_key = (key, canonicalize_arguments(arguments))
+
+        while True:
+            entry = self._entries.get(cache_key)
+            if entry is not None:
+                if entry.expires_at > time.monotonic():
+                    self._entries.move_to_end(cache_key)
+                    self._hits += 1
+                    return entry.result
+                self._remove(cache_key)
+
+            pending = self._pending.get(cache_key)
+            if pending is None:
+                break
+            await pending.done.wait()
+            if pending.error is not None:
+                raise pending.error
+            if pending.result is not None:
+                self._hits += 1
+                return pending.result
+            # the call we waited for was cancelled, so try again
+
+        self._misses += 1
+        pending = self._pending[cache_key] = _PendingCall()
+        generation = self._generation
+        try:
+            result = await call()
+            pending.result = result
+            if generation == self._generation:
+                self._store(cache_key, result, ttl)
+            return result
+        except Exception as e:
+            pending.error = e
+            raise
+        finally:
+            del self._pending[cache_key]
+            pending.done.set()
+
+    def invalidate(self, key: str | None = None) -> None:
+        """Removes the cached results of the tool with this key, or of all tools."""
+        self._generation += 1
+        for cache_key in list(self._entries):
+            if key is None or cache_key[0] == key:
+                self._remove(cache_key)
+
+    def stats(self) -> ToolCacheStats:
+        """Returns the cache's current size and counters."""
+        return ToolCacheStats(
+            entries=len(self._entries),
+            bytes=self._bytes,
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+        )
+
+    def _store(
+        self, cache_key: tuple[str, str], result: ToolResult, ttl: float
+    ) -> None:
+        size = _result_size(result)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        if cache_key in self._entries:
+            self._remove(cache_key)
+        self._entries[cache_key] = _CacheEntry(
+            result=result, expires_at=time.monotonic() + ttl, size=size
+        )
+        self._bytes += size
+
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+
+    def _remove(self, cache_key: tuple[str, str]) -> None:
+        entry = self._entries.pop(cache_key)
+        self._bytes -= entry.size
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, TypeVar
+
+import anyio
+
+from fastmcp.exceptions import ToolError
+
+if TYPE_CHECKING:
+    from fastmcp.tools.tool import Tool
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class ToolCallStats:
+    """
+    A point-in-time view of the calls to a tool with call limits.
+
+    Attributes:
+        in_flight: The number of calls currently running
+        queued: The number of calls waiting for a free slot
+        completed: The number of calls that have finished, successfully or not
+        timed_out: The number of calls that exceeded the tool's timeout
+        queue_timed_out: The number of calls rejected because no slot became
+            free within the tool's queue timeout
+    """
+
+    in_flight: int
+    queued: int
+    completed: int
+    timed_out: int
+    queue_timed_out: int
+
+
+class ToolCallLimiter:
+    """
+    Enforces a tool's `max_concurrency`, `timeout`, and `queue_timeout`, and
+    counts its calls. Calls beyond `max_concurrency` wait for a free slot in
+    FIFO order.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int | None = None,
+        timeout: float | None = None,
+        queue_timeout: float | None = None,
+    ):
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.queue_timeout = queue_timeout
+        self._semaphore = anyio.Semaphore(max_concurrency) if max_concurrency else None
+        self._in_flight = 0
+        self._queued = 0
+        self._completed = 0
+        self._timed_out = 0
+        self._queue_timed_out = 0
+
+    @classmethod
+    def from_tool(cls, tool: Tool) -> ToolCallLimiter | None:
+        """Returns a limiter for the tool's limits, or None if it has none."""
+        if tool.max_concurrency is None and tool.timeout is None:
+            return None
+        return cls(
+            max_concurrency=tool.max_concurrency,
+            timeout=tool.timeout,
+            queue_timeout=tool.queue_timeout,
+        )
+
+    def matches(self, tool: Tool) -> bool:
+        """Whether this limiter enforces the tool's current limits."""
+        return (
+            self.max_concurrency == tool.max_concurrency
+            and self.timeout == tool.timeout
+            and self.queue_timeout == tool.queue_timeout
+        )
+
+    async def call(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Call `fn` once a slot is free, within the tool's timeout.
+
+        Raises:
+            ToolError: If no slot became free within the queue timeout, or the
+                call exceeded the timeout
+        """
+        if self._semaphore is not None:
+            await self._acquire(key, self._semaphore)
+
+        self._in_flight += 1
+        try:
+            with anyio.move_on_after(self.timeout):
+                return await fn()
+            # only reached if the timeout cancelled the call
+            self._timed_out += 1
+            raise ToolError(f"Tool {key!r} timed out after {self.timeout} seconds")
+        finally:
+            self._in_flight -= 1
+            self._completed += 1
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+    async def _acquire(self, key: str, semaphore: anyio.Semaphore) -> None:
+        try:
+            semaphore.acquire_nowait()
+            return
+        except anyio.WouldBlock:
+            pass
+
+        self._queued += 1
+        try:
+            with anyio.move_on_after(self.queue_timeout) as scope:
+                await semaphore.acquire()
+        finally:
+            self._queued -= 1
+        if scope.cancelled_caught:
+            self._queue_timed_out += 1
+            raise ToolError(
+                f"Tool {key!r} is busy: no free slot within {self.queue_timeout} seconds"
+            )
+
+    def stats(self) -> ToolCallStats:
+        """Returns the tool's current in-flight and queued calls and counters."""
+        return ToolCallStats(
+            in_flight=self._in_flight,
+            queued=self._queued,
+            completed=self._completed,
+            timed_out=self._timed_out,
+            queue_timed_out=self._queue_timed_out,
+        )
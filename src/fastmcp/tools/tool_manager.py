@@ -10,11 +10,16 @@ from fastmcp import settings
 from fastmcp.exceptions import NotFoundError, ToolError
 from fastmcp.settings import DuplicateBehavior
 from fastmcp.tools.tool import Tool, ToolResult
+from fastmcp.tools.tool_cache import ToolCacheStats, ToolResultCache
+from fastmcp.tools.tool_limits import ToolCallLimiter, ToolCallStats
 from fastmcp.tools.tool_transform import (
     ToolTransformConfig,
+    TransformedToolCache,
     apply_transformations_to_tools,
 )
+from fastmcp.utilities.components import next_generation
 from fastmcp.utilities.logging import get_logger
+from fastmcp.utilities.mounts import MountRouter, load_from_mounted_servers
 
 if TYPE_CHECKING:
     from fastmcp.server.server import MountedServer
@@ -33,8 +38,28 @@ class ToolManager:
     ):
         self._tools: dict[str, Tool] = {}
         self._mounted_servers: list[MountedServer] = []
+        self._mount_router = MountRouter()
         self.mask_error_details = mask_error_details or settings.mask_error_details
         self.transformations = transformations or {}
+        self._transform_cache = TransformedToolCache()
+
+        # The merged inventory is cached and reused until this manager, or any
+        # manager in its mount tree, takes a new generation.
+        self._generation = next_generation()
+        self._inventory_cache: tuple[Any, dict[str, Tool]] | None = None
+
+        # Called whenever the inventory of this manager, or of a server mounted
+        # on it, changes
+        self._change_listeners: list[Callable[[], None]] = []
+
+        # Limiters of tools with call limits, created on their first call
+        self._limiters: dict[str, ToolCallLimiter] = {}
+
+        # Results of tools with a cache_ttl
+        self._result_cache = ToolResultCache(
+            max_entries=settings.tool_cache_max_entries,
+            max_bytes=settings.tool_cache_max_bytes,
+        )
 
         # Default to "warn" if None is provided
         if duplicate_behavior is None:
@@ -51,6 +76,53 @@ class ToolManager:
     def mount(self, server: MountedServer) -> None:
         """Adds a mounted server as a source for tools."""
         self._mounted_servers.append(server)
+        server.server._tool_manager._add_change_listener(self._notify_change)
+        self._mount_router.add(server)
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        """Mark the cached inventory of this manager, and of any manager it is mounted on, as stale."""
+        self._generation = next_generation()
+        self._notify_change()
+
+    def _add_change_listener(self, listener: Callable[[], None]) -> None:
+        """Call `listener` whenever the inventory of this manager, or of a server mounted on it, changes."""
+        self._change_listeners.append(listener)
+
+    def _notify_change(self) -> None:
+        for listener in self._change_listeners:
+            listener()
+
+    def _inventory_version(self) -> tuple[Any, ...] | None:
+        """
+        Returns a value that changes whenever the unfiltered inventory of this
+        manager could have changed, or None if the inventory cannot be cached
+        (e.g. because it depends on a remote server).
+        """
+        versions: list[Any] = [self._generation]
+        for mounted in self._mounted_servers:
+            child_version = mounted.server._tool_manager._inventory_version()
+            if child_version is None:
+                return None
+            versions.append(child_version)
+        return tuple(versions)
+
+    async def _get_inventory(self) -> dict[str, Tool]:
+        """
+        Returns the unfiltered inventory, rebuilding it only if something in the
+        mount tree has changed. The returned dict is shared and must not be mutated.
+        """
+        version = self._inventory_version()
+        if version is not None:
+            if self._inventory_cache and self._inventory_cache[0] == version:
+                return self._inventory_cache[1]
+
+        tools = await self._load_tools(via_server=False)
+        if version is not None:
+            for tool in tools.values():
+                tool._add_owner(self)
+            self._inventory_cache = (version, tools)
+        return tools
 
     async def _load_tools(self, *, via_server: bool = False) -> dict[str, Tool]:
         """
@@ -60,35 +132,34 @@ class ToolManager:
         - via_server=False: Manager-to-manager path for complete, unfiltered inventory
         - via_server=True: Server-to-server path for filtered MCP requests
         """
-        all_tools: dict[str, Tool] = {}
 
-        for mounted in self._mounted_servers:
-            try:
-                if via_server:
-                    # Use the server-to-server filtered path
-                    child_results = await mounted.server._list_tools()
-                else:
-                    # Use the manager-to-manager unfiltered path
-                    child_results = await mounted.server._tool_manager.list_tools()
-
-                # The combination logic is the same for both paths
-                child_dict = {t.key: t for t in child_results}
-                if mounted.prefix:
-                    for tool in child_dict.values():
-                        prefixed_tool = tool.model_copy(
-                            key=f"{mounted.prefix}_{tool.key}"
-                        )
-                        all_tools[prefixed_tool.key] = prefixed_tool
-                else:
-                    all_tools.update(child_dict)
-            except Exception as e:
-                # Skip failed mounts silently, matches existing behavior
-                logger.warning(
-                    f"Failed to get tools from server: {mounted.server.name!r}, mounted at: {mounted.prefix!r}: {e}"
-                )
-                if settings.mounted_components_raise_on_load_error:
-                    raise
-                continue
+        async def load_mounted(mounted: MountedServer) -> dict[str, Tool]:
+            if via_server:
+                # Use the server-to-server filtered path
+                child_results = await mounted.server._list_tools()
+            else:
+                # Use the manager-to-manager unfiltered path
+                child_results = (
+                    await mounted.server._tool_manager._get_inventory()
+                ).values()
+
+            # The combination logic is the same for both paths
+            child_dict = {t.key: t for t in child_results}
+            if mounted.prefix:
+                return {
+                    f"{mounted.prefix}_{tool.key}": tool.model_copy(
+                        key=f"{mounted.prefix}_{tool.key}"
+                    )
+                    for tool in child_dict.values()
+                }
+            return child_dict
+
+        # Mounted servers are queried concurrently but merged in mount order
+        all_tools: dict[str, Tool] = {}
+        for child_tools in await load_from_mounted_servers(
+            self._mounted_servers, load_mounted, "tools"
+        ):
+            all_tools.update(child_tools)
 
         # Finally, add local tools, which always take precedence
         all_tools.update(self._tools)
@@ -96,18 +167,19 @@ class ToolManager:
         transformed_tools = apply_transformations_to_tools(
             tools=all_tools,
             transformations=self.transformations,
+            cache=self._transform_cache,
         )
 
         return transformed_tools
 
     async def has_tool(self, key: str) -> bool:
         """Check if a tool exists."""
-        tools = await self.get_tools()
+        tools = await self._get_inventory()
         return key in tools
 
     async def get_tool(self, key: str) -> Tool:
         """Get tool by key."""
-        tools = await self.get_tools()
+        tools = await self._get_inventory()
         if key in tools:
             return tools[key]
         raise NotFoundError(f"Tool {key!r} not found")
@@ -116,7 +188,7 @@ class ToolManager:
         """
         Gets the complete, unfiltered inventory of all tools.
         """
-        return await self._load_tools(via_server=False)
+        return dict(await self._get_inventory())
 
     async def list_tools(self) -> list[Tool]:
         """
@@ -165,6 +237,8 @@ class ToolManager:
 
     def add_tool(self, tool: Tool) -> Tool:
         """Register a tool with the server."""
+        tool._add_owner(self)
+        self._invalidate()
         existing = self._tools.get(tool.key)
         if existing:
             if self.duplicate_behavior == "warn":
@@ -185,6 +259,8 @@ class ToolManager:
     ) -> None:
         """Add a tool transformation."""
         self.transformations[tool_name] = transformation
+        self._transform_cache.invalidate(tool_name)
+        self._invalidate()
 
     def get_tool_transformation(self, tool_name: str) -> ToolTransformConfig | None:
         """Get a tool transformation."""
@@ -194,6 +270,8 @@ class ToolManager:
         """Remove a tool transformation."""
         if tool_name in self.transformations:
             del self.transformations[tool_name]
+            self._transform_cache.invalidate(tool_name)
+            self._invalidate()
 
     def remove_tool(self, key: str) -> None:
         """Remove a tool from the server.
@@ -206,9 +284,45 @@ class ToolManager:
         """
         if key in self._tools:
             del self._tools[key]
+            self._invalidate()
         else:
             raise NotFoundError(f"Tool {key!r} not found")
 
+    def _get_limiter(self, key: str, tool: Tool) -> ToolCallLimiter | None:
+        """
+        Returns the limiter that enforces the tool's call limits, replacing it
+        if the tool's limits have changed, or None if the tool has no limits.
+        """
+        limiter = self._limiters.get(key)
+        if limiter is None or not limiter.matches(tool):
+            limiter = ToolCallLimiter.from_tool(tool)
+            if limiter is None:
+                self._limiters.pop(key, None)
+            else:
+                self._limiters[key] = limiter
+        return limiter
+
+    def get_call_stats(self) -> dict[str, ToolCallStats]:
+        """Returns the call stats of each tool with call limits that has been called."""
+        return {key: limiter.stats() for key, limiter in self._limiters.items()}
+
+    def get_cache_stats(self) -> ToolCacheStats:
+        """Returns the stats of the cache for tools with a cache_ttl."""
+        return self._result_cache.stats()
+
+    def invalidate_cache(self, key: str | None = None) -> None:
+        """
+        Removes the cached results of the tool with this key, or of all tools,
+        including the tools of mounted servers.
+        """
+        self._result_cache.invalidate(key)
+        if key is None:
+            for mounted in self._mounted_servers:
+                mounted.server._tool_manager.invalidate_cache()
+        else:
+            for mounted, tool_key in self._mount_router.resolve(key):
+                mounted.server._tool_manager.invalidate_cache(tool_key)
+
     async def call_tool(self, key: str, arguments: dict[str, Any]) -> ToolResult:
         """
         Internal API for servers: Finds and calls a tool, respecting the
@@ -221,7 +335,18 @@ class ToolManager:
                 raise NotFoundError(f"Tool {key!r} not found")
 
             try:
-                return await tool.run(arguments)
+                limiter = self._get_limiter(key, tool)
+
+                async def run() -> ToolResult:
+                    if limiter is None:
+                        return await tool.run(arguments)
+                    return await limiter.call(key, lambda: tool.run(arguments))
+
+                if tool.cache_ttl is None:
+                    return await run()
+                return await self._result_cache.get_or_call(
+                    key, arguments, tool.cache_ttl, run
+                )
 
             # raise ToolErrors as-is
             except ToolError as e:
@@ -239,16 +364,40 @@ class ToolManager:
                     raise ToolError(f"Error calling tool {key!r}: {e}") from e
 
         # 2. Check mounted servers using the filtered protocol path.
-        for mounted in reversed(self._mounted_servers):
-            tool_key = key
-            if mounted.prefix:
-                if key.startswith(f"{mounted.prefix}_"):
-                    tool_key = key.removeprefix(f"{mounted.prefix}_")
-                else:
-                    continue
+        for mounted, tool_key in await self._resolve_mounted(key):
             try:
                 return await mounted.server._call_tool(tool_key, arguments)
             except NotFoundError:
                 continue
 
         raise NotFoundError(f"Tool {key!r} not found.")
+
+    async def get_mount_prefix(self, key: str) -> str | None:
+        """
+        Returns the prefix of the mounted server that calls to the tool with this
+        key go to, or None for local tools, unknown tools, and servers mounted
+        without a prefix.
+        """
+        if key in self._tools or key in self._tools_transformed:
+            return None
+        for mounted, _ in await self._resolve_mounted(key):
+            return mounted.prefix
+        return None
+
+    async def _resolve_mounted(self, key: str) -> list[tuple[MountedServer, str]]:
+        """
+        Returns the mounts that may own the tool with this key, in the order
+        calls try them, with the key each of them knows the tool by.
+        """
+        candidates = []
+        for mounted, tool_key in self._mount_router.resolve(key):
+            # Skip mounts whose (cached) inventory doesn't contain the tool at all,
+            # rather than running their middleware only to get a NotFoundError
+            child_manager = mounted.server._tool_manager
+            if (
+                child_manager._inventory_version() is not None
+                and tool_key not in await child_manager._get_inventory()
+            ):
+                continue
+            candidates.append((mounted, tool_key))
+        return candidates
@@ -7,15 +7,22 @@ from contextvars import ContextVar
 from dataclasses import dataclass
 from typing import Annotated, Any, Literal, cast
 
-import pydantic_core
 from mcp.types import ToolAnnotations
 from pydantic import ConfigDict
 from pydantic.fields import Field
 from pydantic.functional_validators import BeforeValidator
 
 import fastmcp
-from fastmcp.tools.tool import ParsedFunction, Tool, ToolResult, _convert_to_content
-from fastmcp.utilities.components import _convert_set_default_none
+from fastmcp.tools.tool import (
+    ParsedFunction,
+    Tool,
+    ToolResult,
+    _convert_to_tool_result,
+)
+from fastmcp.utilities.components import (
+    ComponentStateSnapshot,
+    _convert_set_default_none,
+)
 from fastmcp.utilities.json_schema import compress_schema
 from fastmcp.utilities.logging import get_logger
 from fastmcp.utilities.types import (
@@ -33,6 +40,9 @@ _current_tool: ContextVar[TransformedTool | None] = ContextVar(  # type: ignore[
     "_current_tool", default=None
 )
 
+# How many source variants a TransformedToolCache remembers for each transformation
+_MAX_CACHED_TRANSFORMS = 4
+
 
 async def forward(**kwargs) -> ToolResult:
     """Forward to parent tool with argument transformation applied.
@@ -330,32 +340,8 @@ class TransformedTool(Tool):
                     return result
 
             # Otherwise convert to content and create ToolResult with proper structured content
-
-            unstructured_result = _convert_to_content(
-                result, serializer=self.serializer
-            )
-
-            structured_output = None
-            # First handle structured content based on output schema, if any
-            if self.output_schema is not None:
-                if self.output_schema.get("x-fastmcp-wrap-result"):
-                    # Schema says wrap - always wrap in result key
-                    structured_output = {"result": result}
-                else:
-                    structured_output = result
-            # If no output schema, try to serialize the result. If it is a dict, use
-            # it as structured content. If it is not a dict, ignore it.
-            if structured_output is None:
-                try:
-                    structured_output = pydantic_core.to_jsonable_python(result)
-                    if not isinstance(structured_output, dict):
-                        structured_output = None
-                except Exception:
-                    pass
-
-            return ToolResult(
-                content=unstructured_result,
-                structured_content=structured_output,
+            return _convert_to_tool_result(
+                result, serializer=self.serializer, output_schema=self.output_schema
             )
         finally:
             _current_tool.reset(token)
@@ -930,20 +916,99 @@ class ToolTransformConfig(FastMCPBaseModel):
         )
 
 
+class TransformedToolCache:
+    """
+    Remembers the tools each transformation created, so that repeated loads of
+    the same inventory don't rebuild schemas or forwarding functions.
+
+    A transformed tool is reused if the same config is applied to an
+    equivalent source tool: one with the same type and key whose fields hold
+    the same objects, with unchanged tags and meta. Shallow copies, such as the
+    prefixed copies made for mounted servers on every load, therefore share one
+    transformed tool. A config is registered under a single tool name, but the
+    inventory and listing paths can each hand it a different source, so a few
+    entries are kept per name.
+    """
+
+    def __init__(self) -> None:
+        # tool name -> recent (config, (source type, key), source fields,
+        # source tags/meta, result) entries, most recent first
+        self._entries: dict[
+            str,
+            list[
+                tuple[
+                    ToolTransformConfig,
+                    tuple[type, str],
+                    tuple[Any, ...],
+                    ComponentStateSnapshot,
+                    TransformedTool,
+                ]
+            ],
+        ] = {}
+
+    def apply(
+        self, tool_name: str, transformation: ToolTransformConfig, tool: Tool
+    ) -> TransformedTool:
+        """Like `transformation.apply(tool)`, but reuses a previous result."""
+        entries = self._entries.setdefault(tool_name, [])
+        source_id = (type(tool), tool.key)
+        fields = tuple(tool.__dict__.values())
+        for i, (config, cached_id, cached_fields, state, transformed) in enumerate(
+            entries
+        ):
+            if (
+                config is transformation
+                and cached_id == source_id
+                and len(cached_fields) == len(fields)
+                and all(a is b for a, b in zip(cached_fields, fields))
+                and state.matches([tool])
+            ):
+                if i:
+                    entries.insert(0, entries.pop(i))
+                return transformed
+
+        transformed = transformation.apply(tool)
+        entries.insert(
+            0,
+            (
+                transformation,
+                source_id,
+                fields,
+                ComponentStateSnapshot([tool]),
+                transformed,
+            ),
+        )
+        del entries[_MAX_CACHED_TRANSFORMS:]
+        return transformed
+
+    def invalidate(self, tool_name: str | None = None) -> None:
+        """Forget the tools transformed under this name, or all of them."""
+        if tool_name is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(tool_name, None)
+
+
 def apply_transformations_to_tools(
     tools: dict[str, Tool],
     transformations: dict[str, ToolTransformConfig],
+    cache: TransformedToolCache | None = None,
 ) -> dict[str, Tool]:
     """Apply a list of transformations to a list of tools. Tools that do not have any transforamtions
     are left unchanged.
+
+    If a cache is given, transformed tools are reused for as long as the
+    source tool (or a shallow copy of it) is unchanged.
     """
 
     transformed_tools: dict[str, Tool] = {}
 
     for tool_name, tool in tools.items():
         if transformation := transformations.get(tool_name):
-            transformed_tools[transformation.name or tool_name] = transformation.apply(
-                tool
+            transformed_tools[transformation.name or tool_name] = (
+                transformation.apply(tool)
+                if cache is None
+                else cache.apply(tool_name, transformation, tool)
             )
             continue
 
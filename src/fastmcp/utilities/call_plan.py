@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import inspect
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from functools import cached_property
+from types import MappingProxyType
+from typing import Any
+
+import anyio
+import pydantic_core
+from pydantic_core import ArgsKwargs, SchemaValidator
+
+from fastmcp.server.dependencies import get_context
+from fastmcp.utilities.executors import (
+    ToolExecutor,
+    get_import_path,
+    get_process_pool,
+    get_worker_pool,
+)
+from fastmcp.utilities.types import find_kwarg_by_type, get_cached_typeadapter
+
+
+@dataclass(frozen=True)
+class CallPlan:
+    """
+    Everything about calling a user function that is fixed once the function is
+    known, so that components can compute it when they are created instead of
+    inspecting the function on every call.
+
+    Attributes:
+        fn: The function to call
+        context_kwarg: The name of the parameter that receives the Context, if any
+        is_async: Whether the function is a coroutine function
+        is_async_generator: Whether the function is an async generator function,
+            whose results are streamed by the caller
+        validator: If set, the compiled pydantic-core validator of the function's
+            signature, which validates the arguments and calls the function.
+            Otherwise the function is called directly.
+        parameters: The function's parameters, by name
+        executor: Where the function runs if it is synchronous. If None, the
+            server's executor is used.
+    """
+
+    fn: Callable[..., Any]
+    context_kwarg: str | None
+    is_async: bool
+    validator: SchemaValidator | None
+    parameters: Mapping[str, inspect.Parameter]
+    is_async_generator: bool = False
+    executor: ToolExecutor | None = None
+
+    @classmethod
+    def from_function(
+        cls,
+        fn: Callable[..., Any],
+        validate: bool = True,
+        executor: ToolExecutor | None = None,
+    ) -> CallPlan:
+        """
+        Build the call plan of a function.
+
+        Args:
+            fn: The function to call
+            validate: Whether to validate arguments against the function's
+                signature before calling it
+            executor: Where the function runs if it is synchronous
+
+        Raises:
+            ValueError: If the executor is "process" and the function can't run
+                in a worker process
+        """
+        from fastmcp.server.context import Context
+
+        context_kwarg = find_kwarg_by_type(fn, kwarg_type=Context)
+        is_async = inspect.iscoroutinefunction(fn)
+        is_async_generator = inspect.isasyncgenfunction(fn)
+        if executor == "process":
+            if is_async or is_async_generator:
+                raise ValueError(
+                    f"{fn!r} can't run in a worker process because it is async. "
+                    'The "process" executor is for synchronous, CPU-bound functions.'
+                )
+            if context_kwarg:
+                raise ValueError(
+                    f"{fn!r} can't run in a worker process because it takes a "
+                    "Context, which is only available in the server process."
+                )
+            get_import_path(fn)
+
+        return cls(
+            fn=fn,
+            context_kwarg=context_kwarg,
+            is_async=is_async,
+            validator=get_cached_typeadapter(fn).validator if validate else None,
+            parameters=MappingProxyType(dict(inspect.signature(fn).parameters)),
+            is_async_generator=is_async_generator,
+            executor=executor,
+        )
+
+    def inject(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        """
+        Returns the arguments with the Context added if the function takes one
+        and it was not provided. The arguments are only copied if they change.
+        """
+        if self.context_kwarg and self.context_kwarg not in arguments:
+            arguments = arguments.copy()
+            arguments[self.context_kwarg] = get_context()
+        return arguments
+
+    def validate_arguments(
+        self, arguments: dict[str, Any], strict: bool = False
+    ) -> dict[str, Any]:
+        """
+        Returns the arguments validated against the function's signature,
+        without calling it. The Context parameter, if any, is not validated and
+        is left out. Arguments are returned as they are if the plan doesn't
+        validate.
+
+        Args:
+            arguments: The arguments, as decoded from JSON
+            strict: Whether to validate them in pydantic's strict mode, which
+                rejects values of the wrong JSON type instead of coercing them.
+                They are validated as JSON, so e.g. dates and enums can still
+                be given as strings.
+        """
+        if self.validator is None:
+            return arguments
+        if self.context_kwarg is not None and self.context_kwarg in arguments:
+            arguments = {k: v for k, v in arguments.items() if k != self.context_kwarg}
+        if strict:
+            args, kwargs = self._arguments_validator.validate_json(
+                pydantic_core.to_json(arguments), strict=True
+            )
+        else:
+            args, kwargs = self._arguments_validator.validate_python(
+                ArgsKwargs((), arguments)
+            )
+        return dict(zip(self.parameters, args)) | kwargs
+
+    @cached_property
+    def _arguments_validator(self) -> SchemaValidator:
+        """
+        A validator of the function's arguments, without the Context, that
+        returns them as `(args, kwargs)` rather than calling the function.
+        Built on first use, since most plans never need it.
+        """
+        schema = get_cached_typeadapter(self.fn).core_schema
+        call_schema = schema["schema"] if schema["type"] == "definitions" else schema
+        arguments_schema = dict(call_schema["arguments_schema"])  # type: ignore[typeddict-item]
+        arguments_schema["arguments_schema"] = [
+            parameter
+            for parameter in arguments_schema["arguments_schema"]
+            if parameter["name"] != self.context_kwarg
+        ]
+        if schema["type"] == "definitions":
+            arguments_schema = {**schema, "schema": arguments_schema}
+        return SchemaValidator(arguments_schema)  # type: ignore[arg-type]
+
+    async def call(self, arguments: dict[str, Any], strict: bool = False) -> Any:
+        """
+        Call the function with the given arguments, awaiting it if needed.
+        Synchronous functions run in the worker pool unless their executor (or
+        the server's) is "inline", or in the process pool if it is "process".
+        Async generator functions return their generator without iterating it.
+        If the call is cancelled, the current Context is marked as cancelled so
+        that a function still running in a worker thread can stop early.
+
+        Args:
+            arguments: The arguments, as decoded from JSON
+            strict: Whether to validate the arguments in pydantic's strict mode,
+                as `validate_arguments` does
+        """
+        validate = self.validator is not None
+        if strict and validate:
+            arguments = self.validate_arguments(arguments, strict=True)
+            validate = False
+
+        if self.executor == "process":
+            return await get_process_pool().run(self.fn, arguments, validate=validate)
+
+        arguments = self.inject(arguments)
+        invoke = self._invoke if validate else self._call_directly
+        try:
+            if (
+                not self.is_async
+                and not self.is_async_generator
+                and (pool := get_worker_pool(self.executor))
+            ):
+                result = await pool.run(invoke, arguments)
+            else:
+                result = invoke(arguments)
+
+            # sync callables can still return awaitables, e.g. lambdas wrapping coroutines
+            if self.is_async or inspect.isawaitable(result):
+                result = await result
+        except anyio.get_cancelled_exc_class():
+            # a function running in a worker thread keeps going after its call
+            # is abandoned, so let it see the cancellation through its Context
+            try:
+                get_context()._cancel()
+            except RuntimeError:
+                pass
+            raise
+        return result
+
+    def _invoke(self, arguments: dict[str, Any]) -> Any:
+        if self.validator is not None:
+            return self.validator.validate_python(arguments)
+        return self.fn(**arguments)
+
+    def _call_directly(self, arguments: dict[str, Any]) -> Any:
+        return self.fn(**arguments)
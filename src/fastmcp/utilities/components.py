@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
-from typing import Annotated, Any, TypedDict, TypeVar
+import copy
+import itertools
+import weakref
+from collections.abc import Iterable, Sequence
+from typing import Annotated, Any, ClassVar, Protocol, TypedDict, TypeVar
 
 from pydantic import BeforeValidator, Field, PrivateAttr
 from typing_extensions import Self
@@ -11,9 +14,26 @@ from fastmcp.utilities.types import FastMCPBaseModel
 
 T = TypeVar("T")
 
+# Monotonic source of inventory generations. Managers take a fresh value whenever
+# their contents change, so a cached inventory can be validated by comparing
+# generations instead of rebuilding it.
+_generation_counter = itertools.count(1)
+
+
+def next_generation() -> int:
+    """Return a new, globally unique inventory generation."""
+    return next(_generation_counter)
+
+
+class ComponentOwner(Protocol):
+    """A manager whose cached inventory holds components."""
+
+    def _invalidate(self) -> None: ...
+
 
 class FastMCPMeta(TypedDict, total=False):
     tags: list[str]
+    batch: bool
 
 
 def _convert_set_default_none(maybe_set: set[T] | Sequence[T] | None) -> set[T]:
@@ -51,12 +71,32 @@ class FastMCPComponent(FastMCPBaseModel):
         description="Whether the component is enabled.",
     )
 
+    # Fields that appear in list responses or decide whether the component is
+    # listed. Assigning one of them makes the owners' cached inventories stale.
+    _listing_fields: ClassVar[frozenset[str]] = frozenset(
+        {"name", "title", "description", "tags", "meta", "enabled"}
+    )
+
     _key: str | None = PrivateAttr()
+    _owners: weakref.WeakSet[ComponentOwner] = PrivateAttr(
+        default_factory=weakref.WeakSet
+    )
 
     def __init__(self, *, key: str | None = None, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self._key = key
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in self._listing_fields:
+            # private attributes aren't set yet while the model is validated
+            for owner in list(getattr(self, "_owners", ())):
+                owner._invalidate()
+
+    def _add_owner(self, owner: ComponentOwner) -> None:
+        """Register a manager whose cached inventory holds this component."""
+        self._owners.add(owner)
+
     @property
     def key(self) -> str:
         """
@@ -112,6 +152,8 @@ class FastMCPComponent(FastMCPBaseModel):
         copy = super().model_copy(update=update, deep=deep)
         if key is not None:
             copy._key = key
+        # the copy is held by the same caches as the original, and possibly more
+        copy._owners = weakref.WeakSet(self._owners)
         return copy
 
     def __eq__(self, other: object) -> bool:
@@ -174,3 +216,30 @@ class MirroredComponent(FastMCPComponent):
         copied = self.model_copy()
         copied._mirrored = False
         return copied
+
+
+class ComponentStateSnapshot:
+    """
+    The tags and meta of a sequence of components at one point in time.
+
+    Both are mutable containers that can be edited in place (e.g. by OpenAPI
+    component hooks) without a field assignment, so caches derived from
+    components keep a snapshot and check it before they are reused.
+    """
+
+    def __init__(self, components: Iterable[FastMCPComponent]) -> None:
+        self._state = [
+            (frozenset(component.tags), copy.deepcopy(component.meta))
+            for component in components
+        ]
+
+    def matches(self, components: Iterable[FastMCPComponent]) -> bool:
+        """Whether the components still have the snapshotted tags and meta."""
+        count = 0
+        for count, component in enumerate(components, start=1):
+            if count > len(self._state):
+                return False
+            tags, meta = self._state[count - 1]
+            if component.tags != tags or component.meta != meta:
+                return False
+        return count == len(self._state)
@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+import inspect
+import math
+import multiprocessing
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, Literal, TypeVar
+
+import anyio
+import anyio.from_thread
+import anyio.to_thread
+
+import fastmcp
+from fastmcp.utilities.types import get_cached_typeadapter
+
+T = TypeVar("T")
+
+Executor = Literal["inline", "thread"]
+"""
+Where synchronous user functions run:
+
+- "inline": on the event loop, blocking it until the function returns
+- "thread": in the server's bounded worker thread pool
+"""
+
+ToolExecutor = Literal["inline", "thread", "process"]
+"""
+Where synchronous tools run. In addition to the `Executor` options, tools can
+use "process" to run in the server's worker process pool, which suits CPU-bound
+work that would otherwise hold the GIL.
+"""
+
+
+@dataclass(frozen=True)
+class WorkerPoolStats:
+    """
+    A point-in-time view of a worker pool.
+
+    Attributes:
+        max_workers: The maximum number of functions that run at once
+        running: The number of functions currently running
+        queued: The number of calls waiting for a free worker
+        completed: The number of calls that have finished, successfully or not
+    """
+
+    max_workers: int
+    running: int
+    queued: int
+    completed: int
+
+
+class WorkerThreadPool:
+    """
+    A bounded pool of worker threads for synchronous user functions, so a slow
+    sync tool, resource, or prompt doesn't block the event loop. Calls beyond
+    `max_workers` wait in FIFO order for a free worker.
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._completed = 0
+        # created lazily because a limiter is bound to the event loop that
+        # first uses it
+        self._limiter: anyio.CapacityLimiter | None = None
+        self._thread_limiter: anyio.CapacityLimiter | None = None
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run `fn(*args)` in a worker thread and return its result."""
+        if self._limiter is None or self._thread_limiter is None:
+            self._limiter = anyio.CapacityLimiter(self.max_workers)
+            # threads are bounded by `_limiter`, whose tokens outlive
+            # cancelled calls, so anyio's own limiter must not hold them back
+            self._thread_limiter = anyio.CapacityLimiter(math.inf)
+        limiter = self._limiter
+        borrower = object()
+        await limiter.acquire_on_behalf_of(borrower)
+
+        lock = threading.Lock()
+        started = finished = abandoned = False
+
+        def call() -> T | None:
+            nonlocal started, finished
+            with lock:
+                if abandoned:
+                    return None
+                started = True
+            try:
+                return fn(*args)
+            finally:
+                with lock:
+                    finished = True
+                    release = abandoned
+                if release:
+                    # the caller gave up on this call, so its worker is only
+                    # freed now that the thread is done
+                    try:
+                        anyio.from_thread.run_sync(
+                            limiter.release_on_behalf_of, borrower
+                        )
+                    except RuntimeError:
+                        pass  # the event loop has already shut down
+
+        try:
+            # a cancelled call (e.g. one that timed out) returns immediately,
+            # but its thread keeps counting against max_workers until it
+            # finishes
+            return await anyio.to_thread.run_sync(  # type: ignore[return-value]
+                call, limiter=self._thread_limiter, abandon_on_cancel=True
+            )
+        finally:
+            with lock:
+                abandoned = True
+                release = not started or finished
+            if release:
+                limiter.release_on_behalf_of(borrower)
+            self._completed += 1
+
+    def stats(self) -> WorkerPoolStats:
+        """Returns the pool's current queue depth and usage."""
+        if self._limiter is None:
+            running = queued = 0
+        else:
+            statistics = self._limiter.statistics()
+            running = statistics.borrowed_tokens
+            queued = statistics.tasks_waiting
+        return WorkerPoolStats(
+            max_workers=self.max_workers,
+            running=running,
+            queued=queued,
+            completed=self._completed,
+        )
+
+
+def get_import_path(fn: Callable[..., Any]) -> tuple[str, str]:
+    """
+    Returns the module and qualified name a worker process can import `fn` by.
+
+    Raises:
+        ValueError: If `fn` can't be imported by name, e.g. because it is a
+            lambda, a nested function, or a bound method.
+    """
+    module = getattr(fn, "__module__", None)
+    qualname = getattr(fn, "__qualname__", None)
+    if inspect.ismethod(fn) or not module or not qualname or "<" in qualname:
+        raise ValueError(
+            f"{fn!r} can't run in a worker process because it can't be imported "
+            "by name. Define it at the top level of a module."
+        )
+    return module, qualname
+
+
+def _resolve_import_path(module: str, qualname: str) -> Callable[..., Any]:
+    try:
+        obj: Any = importlib.import_module(module)
+        for attr in qualname.split("."):
+            obj = getattr(obj, attr)
+    except (ImportError, AttributeError) as e:
+        raise ValueError(
+            f"Could not import {module}.{qualname} in a worker process: {e}"
+        ) from e
+    # decorators like @mcp.tool replace the module attribute with the component
+    # they create, which keeps the original function as `fn`
+    return getattr(obj, "fn", obj)
+
+
+def _call_by_import_path(
+    module: str, qualname: str, arguments: dict[str, Any], validate: bool
+) -> Any:
+    fn = _resolve_import_path(module, qualname)
+    if validate:
+        return get_cached_typeadapter(fn).validate_python(arguments)
+    return fn(**arguments)
+
+
+class WorkerProcessPool:
+    """
+    A pool of worker processes for CPU-bound synchronous tools. Functions are
+    sent to the workers by import path, and their arguments and results are
+    pickled. The processes are started on first use and kept warm for later
+    calls.
+    """
+
+    def __init__(self, max_workers: int | None = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._completed = 0
+        self._in_flight = 0
+        self._executor: ProcessPoolExecutor | None = None
+
+    async def run(
+        self,
+        fn: Callable[..., T],
+        arguments: dict[str, Any],
+        validate: bool = True,
+    ) -> T:
+        """
+        Call `fn(**arguments)` in a worker process and return its result.
+
+        Args:
+            fn: The function to call. It must be importable by name.
+            arguments: The keyword arguments, which must be picklable
+            validate: Whether to validate the arguments against the function's
+                signature before calling it
+        """
+        module, qualname = get_import_path(fn)
+        if self._executor is None:
+            # forking a process that runs an event loop and worker threads can
+            # deadlock the child, so workers are always spawned fresh
+            self._executor = ProcessPoolExecutor(
+                self.max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        future = self._executor.submit(
+            _call_by_import_path, module, qualname, arguments, validate
+        )
+        self._in_flight += 1
+        try:
+            return await asyncio.wrap_future(future)
+        except BrokenProcessPool:
+            # a worker died, e.g. from a crash in native code, so start over
+            # with a fresh pool on the next call
+            self.shutdown()
+            raise
+        finally:
+            self._in_flight -= 1
+            self._completed += 1
+
+    def stats(self) -> WorkerPoolStats:
+        """Returns the pool's current queue depth and usage."""
+        return WorkerPoolStats(
+            max_workers=self.max_workers,
+            running=min(self._in_flight, self.max_workers),
+            queued=max(self._in_flight - self.max_workers, 0),
+            completed=self._completed,
+        )
+
+    def shutdown(self) -> None:
+        """Stop the worker processes. They are restarted by the next call."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+_default_pool: WorkerThreadPool | None = None
+_default_process_pool: WorkerProcessPool | None = None
+
+
+def get_worker_pool(executor: Executor | None) -> WorkerThreadPool | None:
+    """
+    Returns the pool a synchronous function should run in, or None if it
+    should run inline on the event loop.
+
+    Args:
+        executor: The function's own executor, if any. Otherwise the executor
+            of the server handling the current request is used, falling back
+            to `settings.sync_executor` outside of a request.
+    """
+    from fastmcp.server.dependencies import get_context
+
+    global _default_pool
+
+    try:
+        server = get_context().fastmcp
+    except RuntimeError:
+        server = None
+
+    if server is not None:
+        if (executor or server.sync_executor) == "inline":
+            return None
+        return server.worker_pool
+
+    if (executor or fastmcp.settings.sync_executor) == "inline":
+        return None
+    if _default_pool is None:
+        _default_pool = WorkerThreadPool(fastmcp.settings.sync_worker_threads)
+    return _default_pool
+
+
+def get_process_pool() -> WorkerProcessPool:
+    """
+    Returns the process pool of the server handling the current request, or a
+    shared pool outside of a request.
+    """
+    from fastmcp.server.dependencies import get_context
+
+    global _default_process_pool
+
+    try:
+        return get_context().fastmcp.process_pool
+    except RuntimeError:
+        pass
+
+    if _default_process_pool is None:
+        _default_process_pool = WorkerProcessPool(fastmcp.settings.process_workers)
+    return _default_process_pool
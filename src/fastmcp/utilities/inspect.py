@@ -392,11 +392,11 @@ async def format_mcp_info(mcp: FastMCP[Any] | FastMCP1x) -> bytes:
     Includes version metadata at the top level.
     """
     async with Client(mcp) as client:
-        # Get all the MCP protocol objects
-        tools_result = await client.list_tools_mcp()
-        prompts_result = await client.list_prompts_mcp()
-        resources_result = await client.list_resources_mcp()
-        templates_result = await client.list_resource_templates_mcp()
+        # Get all the MCP protocol objects, across every page of each listing
+        tools = await client.list_tools()
+        prompts = await client.list_prompts()
+        resources = await client.list_resources()
+        templates = await client.list_resource_templates()
 
         # Get server info from the initialize result
         server_info = client.initialize_result.serverInfo
@@ -409,10 +409,10 @@ async def format_mcp_info(mcp: FastMCP[Any] | FastMCP1x) -> bytes:
             },
             "serverInfo": server_info,
             "capabilities": {},  # MCP format doesn't include capabilities at top level
-            "tools": tools_result.tools,
-            "prompts": prompts_result.prompts,
-            "resources": resources_result.resources,
-            "resourceTemplates": templates_result.resourceTemplates,
+            "tools": tools,
+            "prompts": prompts,
+            "resources": resources,
+            "resourceTemplates": templates,
         }
 
         return pydantic_core.to_json(result, indent=2)
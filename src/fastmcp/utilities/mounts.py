@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Sequence
+from typing import TYPE_CHECKING, TypeVar
+
+import anyio
+
+from fastmcp import settings
+from fastmcp.utilities.logging import get_logger
+
+if TYPE_CHECKING:
+    from fastmcp.server.server import MountedServer
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+async def load_from_mounted_servers(
+    mounted_servers: Sequence[MountedServer],
+    load: Callable[[MountedServer], Awaitable[T]],
+    component_type: str,
+) -> list[T]:
+    """
+    Load components from every mounted server concurrently.
+
+    Each mount is loaded in its own task, bounded by
+    `settings.mounted_components_load_timeout`. Results are returned in mount
+    order regardless of which mount finished first. Mounts that fail or time out
+    are logged and skipped, unless `settings.mounted_components_raise_on_load_error`
+    is set, in which case the error from the first failing mount (in mount order)
+    is raised once all mounts have finished.
+
+    Args:
+        mounted_servers: The mounted servers to load from
+        load: Loads the components of a single mounted server
+        component_type: Name of the components being loaded, used in log messages
+    """
+    if not mounted_servers:
+        return []
+
+    results: dict[int, T] = {}
+    errors: dict[int, Exception] = {}
+    timeout = settings.mounted_components_load_timeout or None
+
+    async def load_one(index: int, mounted: MountedServer) -> None:
+        try:
+            with anyio.fail_after(timeout) as scope:
+                results[index] = await load(mounted)
+        except Exception as e:
+            if isinstance(e, TimeoutError) and scope.cancel_called:
+                error = TimeoutError(
+                    f"Timed out after {timeout}s loading {component_type}"
+                )
+                error.__cause__ = e
+            else:
+                error = e
+            # Skip failed mounts silently, matches existing behavior
+            logger.warning(
+                f"Failed to get {component_type} from server: {mounted.server.name!r}, mounted at: {mounted.prefix!r}: {error}"
+            )
+            errors[index] = error
+
+    if len(mounted_servers) == 1:
+        # Avoid the task group overhead for the common single-mount case
+        await load_one(0, mounted_servers[0])
+    else:
+        async with anyio.create_task_group() as tg:
+            for index, mounted in enumerate(mounted_servers):
+                tg.start_soon(load_one, index, mounted)
+
+    if errors and settings.mounted_components_raise_on_load_error:
+        raise errors[min(errors)]
+
+    return [results[index] for index in sorted(results)]
+
+
+class MountRouter:
+    """
+    Index of mounted servers by prefix, for components whose keys are prefixed
+    as `{prefix}_{key}` (tools and prompts).
+
+    Resolving a key looks up each underscore-delimited prefix of the key in a
+    dict instead of testing every mount, and yields the matching mounts together
+    with the key stripped of their prefix.
+    """
+
+    def __init__(self) -> None:
+        self._count = 0
+        self._by_prefix: dict[str, list[tuple[int, MountedServer]]] = {}
+        self._unprefixed: list[tuple[int, MountedServer]] = []
+
+    def add(self, mounted: MountedServer) -> None:
+        """Add a mounted server. Later mounts take precedence over earlier ones."""
+        entry = (self._count, mounted)
+        self._count += 1
+        if mounted.prefix:
+            self._by_prefix.setdefault(mounted.prefix, []).append(entry)
+        else:
+            self._unprefixed.append(entry)
+
+    def resolve(self, key: str) -> list[tuple[MountedServer, str]]:
+        """
+        Returns every mount that could own `key`, most recently mounted first,
+        with the key each of them knows the component by.
+        """
+        matches: list[tuple[int, MountedServer, str]] = [
+            (index, mounted, key) for index, mounted in self._unprefixed
+        ]
+        if self._by_prefix:
+            position = key.find("_")
+            while position != -1:
+                for index, mounted in self._by_prefix.get(key[:position], ()):
+                    matches.append((index, mounted, key[position + 1 :]))
+                position = key.find("_", position + 1)
+
+        matches.sort(key=lambda match: match[0], reverse=True)
+        return [(mounted, child_key) for _, mounted, child_key in matches]
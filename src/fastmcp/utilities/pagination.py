@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+from collections.abc import Callable, Sequence
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor is malformed or no longer valid."""
+
+
+def listing_fingerprint(items: Sequence[T], key: Callable[[T], str]) -> str:
+    """
+    Returns a short fingerprint of a listing that changes whenever its members
+    or their order change, so cursors issued for one version of a listing are
+    rejected once it has changed.
+
+    The fingerprint is a digest of the keys, so it is the same in every process
+    and a cursor stays valid across workers and restarts.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    for item in items:
+        encoded = key(item).encode()
+        # length-prefix each key so ["ab"] and ["a", "b"] differ
+        digest.update(len(encoded).to_bytes(8, "big") + encoded)
+    return digest.hexdigest()
+
+
+def encode_cursor(fingerprint: str, offset: int) -> str:
+    return base64.urlsafe_b64encode(f"{fingerprint}:{offset}".encode()).decode()
+
+
+def decode_cursor(cursor: str, fingerprint: str) -> int:
+    """
+    Returns the offset encoded in a cursor.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or was issued for a
+            different version of the listing.
+    """
+    try:
+        cursor_fingerprint, offset = (
+            base64.urlsafe_b64decode(cursor.encode()).decode().split(":")
+        )
+        offset_value = int(offset)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from e
+
+    if cursor_fingerprint != fingerprint:
+        raise InvalidCursorError(
+            "Cursor is no longer valid because the listing has changed"
+        )
+    if offset_value < 0:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}")
+    return offset_value
+
+
+def paginate(
+    items: Sequence[T],
+    cursor: str | None,
+    page_size: int | None,
+    key: Callable[[T], str],
+) -> tuple[list[T], str | None]:
+    """
+    Returns the page of `items` that starts at `cursor`, and the cursor of the
+    next page (or None if this is the last page). Without a page size, the
+    whole listing is returned as a single page.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or was issued for a
+            different version of the listing.
+    """
+    if page_size is None:
+        if cursor is not None:
+            raise InvalidCursorError(f"Invalid cursor: {cursor!r}")
+        return list(items), None
+
+    fingerprint = listing_fingerprint(items, key)
+    offset = 0 if cursor is None else decode_cursor(cursor, fingerprint)
+    end = offset + page_size
+    next_cursor = encode_cursor(fingerprint, end) if end < len(items) else None
+    return list(items[offset:end]), next_cursor
@@ -1,10 +1,12 @@
 """Common types used across FastMCP."""
 
-import base64
+import binascii
 import inspect
 import mimetypes
+import mmap
 import os
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from functools import lru_cache
 from pathlib import Path
 from types import EllipsisType, UnionType
@@ -30,6 +32,9 @@ T = TypeVar("T")
 NotSet = ...
 NotSetT: TypeAlias = EllipsisType
 
+BinaryData: TypeAlias = bytes | bytearray | memoryview | mmap.mmap
+"""Binary content, as bytes or any buffer that can be read without copying it."""
+
 
 class FastMCPBaseModel(BaseModel):
     """Base model for FastMCP models."""
@@ -171,13 +176,33 @@ def find_kwarg_by_type(fn: Callable, kwarg_type: type) -> str | None:
     return None
 
 
+@contextmanager
+def _map_file(path: Path) -> Iterator[BinaryData]:
+    """
+    Map a file into memory, so its content can be encoded without first being
+    read into a bytes object.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # empty files can't be mapped
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def _b64encode(data: BinaryData) -> str:
+    """Base64-encode binary content straight from its buffer."""
+    return binascii.b2a_base64(data, newline=False).decode("ascii")
+
+
 class Image:
     """Helper class for returning images from tools."""
 
     def __init__(
         self,
         path: str | Path | None = None,
-        data: bytes | None = None,
+        data: BinaryData | None = None,
         format: str | None = None,
         annotations: Annotations | None = None,
     ):
@@ -215,10 +240,10 @@ class Image:
     ) -> mcp.types.ImageContent:
         """Convert to MCP ImageContent."""
         if self.path:
-            with open(self.path, "rb") as f:
-                data = base64.b64encode(f.read()).decode()
+            with _map_file(self.path) as mapped:
+                data = _b64encode(mapped)
         elif self.data is not None:
-            data = base64.b64encode(self.data).decode()
+            data = _b64encode(self.data)
         else:
             raise ValueError("No image data available")
 
@@ -236,7 +261,7 @@ class Audio:
     def __init__(
         self,
         path: str | Path | None = None,
-        data: bytes | None = None,
+        data: BinaryData | None = None,
         format: str | None = None,
         annotations: Annotations | None = None,
     ):
@@ -273,10 +298,10 @@ class Audio:
         annotations: Annotations | None = None,
     ) -> mcp.types.AudioContent:
         if self.path:
-            with open(self.path, "rb") as f:
-                data = base64.b64encode(f.read()).decode()
+            with _map_file(self.path) as mapped:
+                data = _b64encode(mapped)
         elif self.data is not None:
-            data = base64.b64encode(self.data).decode()
+            data = _b64encode(self.data)
         else:
             raise ValueError("No audio data available")
 
@@ -294,7 +319,7 @@ class File:
     def __init__(
         self,
         path: str | Path | None = None,
-        data: bytes | None = None,
+        data: BinaryData | None = None,
         format: str | None = None,
         name: str | None = None,
         annotations: Annotations | None = None,
@@ -333,11 +358,8 @@ class File:
         annotations: Annotations | None = None,
     ) -> mcp.types.EmbeddedResource:
         if self.path:
-            with open(self.path, "rb") as f:
-                raw_data = f.read()
-                uri_str = self.path.resolve().as_uri()
+            uri_str = self.path.resolve().as_uri()
         elif self.data is not None:
-            raw_data = self.data
             if self._name:
                 uri_str = f"file:///{self._name}.{self._mime_type.split('/')[1]}"
             else:
@@ -349,23 +371,11 @@ class File:
         UriType = Annotated[AnyUrl, UrlConstraints(host_required=False)]
         uri = TypeAdapter(UriType).validate_python(uri_str)
 
-        if mime.startswith("text/"):
-            try:
-                text = raw_data.decode("utf-8")
-            except UnicodeDecodeError:
-                text = raw_data.decode("latin-1")
-            resource = mcp.types.TextResourceContents(
-                text=text,
-                mimeType=mime,
-                uri=uri,
-            )
+        if self.path:
+            with _map_file(self.path) as mapped:
+                resource = self._to_resource_contents(mapped, mime, uri)
         else:
-            data = base64.b64encode(raw_data).decode()
-            resource = mcp.types.BlobResourceContents(
-                blob=data,
-                mimeType=mime,
-                uri=uri,
-            )
+            resource = self._to_resource_contents(self.data or b"", mime, uri)
 
         return mcp.types.EmbeddedResource(
             type="resource",
@@ -373,6 +383,19 @@ class File:
             annotations=annotations or self.annotations,
         )
 
+    def _to_resource_contents(
+        self, data: BinaryData, mime: str, uri: AnyUrl
+    ) -> mcp.types.TextResourceContents | mcp.types.BlobResourceContents:
+        if mime.startswith("text/"):
+            try:
+                text = str(data, "utf-8")
+            except UnicodeDecodeError:
+                text = str(data, "latin-1")
+            return mcp.types.TextResourceContents(text=text, mimeType=mime, uri=uri)
+        return mcp.types.BlobResourceContents(
+            blob=_b64encode(data), mimeType=mime, uri=uri
+        )
+
 
 def replace_type(type_, type_map: dict[type, type]):
     """
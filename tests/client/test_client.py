@@ -114,6 +114,49 @@ async def test_list_tools_mcp(fastmcp_server):
         assert set(tool.name for tool in result.tools) == {"greet", "add", "sleep"}
 
 
+async def test_iter_tools_follows_pages(fastmcp_server):
+    """Test that iter_tools requests every page of a paginated listing."""
+    fastmcp_server.list_page_size = 1
+    client = Client(transport=FastMCPTransport(fastmcp_server))
+
+    async with client:
+        first_page = await client.list_tools_mcp()
+        assert len(first_page.tools) == 1
+        assert first_page.nextCursor is not None
+
+        names = [tool.name async for tool in client.iter_tools()]
+        assert names == [tool.name for tool in await client.list_tools()]
+        assert set(names) == {"greet", "add", "sleep"}
+
+
+async def test_iter_tools_stops_on_repeated_cursor(fastmcp_server):
+    """Test that a server returning the same cursor again doesn't loop forever."""
+    client = Client(transport=FastMCPTransport(fastmcp_server))
+    tool = mcp.types.Tool(name="greet", inputSchema={"type": "object"})
+    pages = {
+        None: mcp.types.ListToolsResult(tools=[tool], nextCursor="a"),
+        "a": mcp.types.ListToolsResult(tools=[tool], nextCursor="b"),
+        "b": mcp.types.ListToolsResult(tools=[tool], nextCursor="a"),
+    }
+
+    async def list_tools_mcp(cursor: str | None = None):
+        return pages[cursor]
+
+    client.list_tools_mcp = list_tools_mcp  # type: ignore[method-assign]
+    tools = await client.list_tools()
+    assert len(tools) == 3
+
+
+async def test_proxy_follows_pages(fastmcp_server):
+    """Test that a proxy lists every page of the remote server's tools."""
+    fastmcp_server.list_page_size = 1
+    proxy = FastMCP.as_proxy(Client(transport=FastMCPTransport(fastmcp_server)))
+
+    async with Client(proxy) as client:
+        tools = await client.list_tools()
+    assert set(tool.name for tool in tools) == {"greet", "add", "sleep"}
+
+
 async def test_call_tool(fastmcp_server):
     """Test calling a tool with InMemoryClient."""
     client = Client(transport=FastMCPTransport(fastmcp_server))
@@ -147,6 +190,33 @@ async def test_call_tool_mcp(fastmcp_server):
         assert "Hello, World!" in content_str
 
 
+async def test_call_tool_batch():
+    """Calls sent together reach a batchable tool as one batch."""
+    server = FastMCP("BatchServer")
+    batches = []
+
+    def square_many(calls: list[dict]) -> list[int | Exception]:
+        batches.append(len(calls))
+        return [
+            ValueError("negative") if call["x"] < 0 else call["x"] ** 2
+            for call in calls
+        ]
+
+    @server.tool(batch_fn=square_many, batch_window=0.1)
+    def square(x: int) -> int:
+        return x**2
+
+    async with Client(server) as client:
+        results = await client.call_tool_batch(
+            "square", [{"x": 1}, {"x": 2}, {"x": -1}]
+        )
+
+    assert batches == [3]
+    assert [result.data for result in results[:2]] == [1, 4]
+    assert results[2].is_error
+    assert "negative" in results[2].content[0].text  # type: ignore[attr-defined]
+
+
 async def test_list_resources(fastmcp_server):
     """Test listing resources with InMemoryClient."""
     client = Client(transport=FastMCPTransport(fastmcp_server))
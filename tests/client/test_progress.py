@@ -68,3 +68,26 @@ async def test_progress_handler_supplied_on_tool_call_overrides_default(
         await client.call_tool("progress_tool", {}, progress_handler=progress_handler)
 
     assert PROGRESS_MESSAGES == EXPECTED_PROGRESS_MESSAGES
+
+
+async def test_streaming_tool_sends_content_as_progress():
+    mcp = FastMCP()
+
+    @mcp.tool
+    async def stream_lines(count: int):
+        for i in range(count):
+            yield f"line {i}"
+
+    async with Client(mcp, progress_handler=progress_handler) as client:
+        result = await client.call_tool("stream_lines", {"count": 3})
+
+    assert PROGRESS_MESSAGES == [
+        dict(progress=1, total=None, message="line 0"),
+        dict(progress=2, total=None, message="line 1"),
+        dict(progress=3, total=None, message="line 2"),
+    ]
+    assert [block.text for block in result.content] == [  # type: ignore[attr-defined]
+        "line 0",
+        "line 1",
+        "line 2",
+    ]
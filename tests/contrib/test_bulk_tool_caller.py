@@ -214,3 +214,27 @@ async def test_call_tools_bulk_error_continues(bulk_caller_live: BulkToolCaller)
 
     success_result = results[1]
     assert success_result == expected_success_result
+
+
+async def test_call_tool_bulk_batches_batchable_tool():
+    server = FastMCP()
+    batches = []
+
+    def echo_many(calls: list[dict[str, Any]]) -> list[str]:
+        batches.append(len(calls))
+        return [call["arg1"] for call in calls]
+
+    server.add_tool(Tool.from_function(echo_tool, batch_fn=echo_many, batch_window=0.1))
+    bulk_tool_caller = BulkToolCaller()
+    bulk_tool_caller.register_tools(server)
+
+    results = await bulk_tool_caller.call_tool_bulk(
+        "echo_tool", [{"arg1": "a"}, {"arg1": "b"}, {"arg1": "c"}]
+    )
+
+    assert batches == [3]
+    assert results == [
+        echo_tool_result_factory("a"),
+        echo_tool_result_factory("b"),
+        echo_tool_result_factory("c"),
+    ]
@@ -652,3 +652,77 @@ class TestResourceErrorHandling:
         # The error message should not include the original exception details
         assert "Error reading resource 'buggy://resource'" in str(excinfo.value)
         assert "Internal error details" not in str(excinfo.value)
+
+
+class TestInventoryCache:
+    """Test that merged resource and template inventories are cached and invalidated on change."""
+
+    async def test_template_inventory_is_cached(self):
+        from fastmcp import FastMCP
+
+        parent_mcp = FastMCP("ParentServer")
+        child_mcp = FastMCP("ChildServer")
+
+        @child_mcp.resource("data://{id}")
+        def child_data(id: str) -> str:
+            return id
+
+        parent_mcp.mount(child_mcp, prefix="child")
+
+        manager = parent_mcp._resource_manager
+        first = await manager._get_template_inventory()
+        second = await manager._get_template_inventory()
+        assert first is second
+        assert "data://child/{id}" in first
+
+    async def test_get_resource_templates_returns_copy(self):
+        manager = ResourceManager()
+
+        def greet(name: str) -> str:
+            return f"Hello, {name}!"
+
+        manager.add_template(
+            ResourceTemplate.from_function(greet, uri_template="greet://{name}")
+        )
+
+        templates = await manager.get_resource_templates()
+        templates.pop("greet://{name}")
+        assert "greet://{name}" in await manager.get_resource_templates()
+
+    async def test_add_template_in_mounted_server_invalidates(self):
+        from fastmcp import FastMCP
+
+        parent_mcp = FastMCP("ParentServer")
+        child_mcp = FastMCP("ChildServer")
+        parent_mcp.mount(child_mcp, prefix="child")
+
+        assert not await parent_mcp._resource_manager.has_resource("data://child/1")
+
+        @child_mcp.resource("data://{id}")
+        def child_data(id: str) -> str:
+            return id
+
+        assert await parent_mcp._resource_manager.has_resource("data://child/1")
+        resource = await parent_mcp._resource_manager.get_resource("data://child/1")
+        assert await resource.read() == "1"
+
+    async def test_template_precedence_follows_registration_order(self):
+        manager = ResourceManager()
+
+        def by_id(id: str) -> str:
+            return f"id:{id}"
+
+        def my_section(section: str) -> str:
+            return f"section:{section}"
+
+        manager.add_template(
+            ResourceTemplate.from_function(by_id, uri_template="users://{id}/profile")
+        )
+        manager.add_template(
+            ResourceTemplate.from_function(
+                my_section, uri_template="users://me/{section}"
+            )
+        )
+
+        assert await manager.read_resource("users://me/profile") == "id:me"
+        assert await manager.read_resource("users://me/settings") == "section:settings"
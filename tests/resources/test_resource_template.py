@@ -7,7 +7,7 @@ from pydantic import BaseModel
 from fastmcp import Context
 from fastmcp.resources import ResourceTemplate
 from fastmcp.resources.resource import FunctionResource
-from fastmcp.resources.template import match_uri_template
+from fastmcp.resources.template import URITemplateRouter, match_uri_template
 
 
 class TestResourceTemplate:
@@ -601,6 +601,63 @@ class TestMatchUriTemplate:
         assert result == expected_params
 
 
+class TestURITemplateRouter:
+    """Test the URITemplateRouter."""
+
+    @pytest.mark.parametrize(
+        "uri",
+        [
+            "test://a/x/b",
+            "test://a/b",
+            "resource://prefix_foo_suffix",
+            "resource://prefix_suffix",
+            "data://1/2/3",
+            "weather://london/current",
+            "weather://london/forecast",
+            "other://x",
+        ],
+    )
+    def test_router_agrees_with_match_uri_template(self, uri: str):
+        """Test that the router returns the first template that matches in order."""
+        templates = [
+            "test://a/{x}/b",
+            "resource://prefix_{x}_suffix",
+            "data://{path*}",
+            "data://1/{x}/3",
+            "weather://{city}/current",
+            "weather://{city}/{kind}",
+            "{anything*}",
+        ]
+        expected = None
+        for template in templates:
+            if (params := match_uri_template(uri, template)) is not None:
+                expected = (template, params)
+                break
+
+        assert URITemplateRouter(templates).match(uri) == expected
+
+    def test_router_prefers_earlier_template(self):
+        """Test that a more specific later template does not shadow an earlier one."""
+        router = URITemplateRouter(["users://{id}/profile", "users://me/profile"])
+        assert router.match("users://me/profile") == (
+            "users://{id}/profile",
+            {"id": "me"},
+        )
+
+    def test_router_unquotes_params(self):
+        router = URITemplateRouter(["files://{name}"])
+        assert router.match(f"files://{quote('a b', safe='')}") == (
+            "files://{name}",
+            {"name": "a b"},
+        )
+
+    def test_router_no_match(self):
+        router = URITemplateRouter(["users://{id}/profile"])
+        assert router.match("users://1/settings") is None
+        assert router.match("posts://1/profile") is None
+        assert URITemplateRouter([]).match("users://1/profile") is None
+
+
 class TestContextHandling:
     """Test context handling in resource templates."""
 
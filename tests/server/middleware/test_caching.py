@@ -0,0 +1,306 @@
+"""Tests for response caching middleware."""
+
+import anyio
+import pytest
+
+from fastmcp import FastMCP
+from fastmcp.client import Client
+from fastmcp.server.middleware.caching import (
+    MemoryCacheBackend,
+    ResponseCachingMiddleware,
+    SQLiteCacheBackend,
+)
+
+
+class TestMemoryCacheBackend:
+    """Test the in-memory cache backend."""
+
+    async def test_get_and_set(self):
+        backend = MemoryCacheBackend()
+        assert await backend.get("key") is None
+        await backend.set("key", b"value", ttl=10)
+        assert await backend.get("key") == b"value"
+
+    async def test_expiry(self):
+        backend = MemoryCacheBackend()
+        await backend.set("key", b"value", ttl=0.01)
+        await anyio.sleep(0.02)
+        assert await backend.get("key") is None
+
+    async def test_evicts_least_recently_used(self):
+        backend = MemoryCacheBackend(max_entries=2)
+        await backend.set("a", b"1", ttl=10)
+        await backend.set("b", b"2", ttl=10)
+        await backend.get("a")
+        await backend.set("c", b"3", ttl=10)
+
+        assert await backend.get("a") == b"1"
+        assert await backend.get("b") is None
+        stats = await backend.stats()
+        assert (stats.entries, stats.evictions) == (2, 1)
+
+    async def test_max_bytes(self):
+        backend = MemoryCacheBackend(max_bytes=5)
+        await backend.set("a", b"123", ttl=10)
+        await backend.set("b", b"456", ttl=10)
+        await backend.set("too-big", b"123456", ttl=10)
+
+        assert await backend.get("a") is None
+        assert await backend.get("b") == b"456"
+        assert await backend.get("too-big") is None
+        assert (await backend.stats()).bytes == 3
+
+    async def test_delete_prefix(self):
+        backend = MemoryCacheBackend()
+        await backend.set("tools/call\na", b"1", ttl=10)
+        await backend.set("prompts/get\na", b"2", ttl=10)
+        await backend.delete("tools/call\n")
+
+        assert await backend.get("tools/call\na") is None
+        assert await backend.get("prompts/get\na") == b"2"
+
+
+class TestSQLiteCacheBackend:
+    """Test the SQLite cache backend."""
+
+    async def test_get_and_set(self, tmp_path):
+        backend = SQLiteCacheBackend(tmp_path / "cache.db")
+        assert await backend.get("key") is None
+        await backend.set("key", b"value", ttl=10)
+        assert await backend.get("key") == b"value"
+        await backend.set("key", b"new value", ttl=10)
+        assert await backend.get("key") == b"new value"
+
+    async def test_expiry(self, tmp_path):
+        backend = SQLiteCacheBackend(tmp_path / "cache.db")
+        await backend.set("key", b"value", ttl=0.01)
+        await anyio.sleep(0.02)
+        assert await backend.get("key") is None
+
+    async def test_evicts_least_recently_used(self, tmp_path):
+        backend = SQLiteCacheBackend(tmp_path / "cache.db", max_entries=2)
+        await backend.set("a", b"1", ttl=10)
+        await backend.set("b", b"2", ttl=10)
+        await backend.get("a")
+        await backend.set("c", b"3", ttl=10)
+
+        assert await backend.get("a") == b"1"
+        assert await backend.get("b") is None
+        stats = await backend.stats()
+        assert (stats.entries, stats.bytes, stats.evictions) == (2, 2, 1)
+
+    async def test_shared_between_backends(self, tmp_path):
+        writer = SQLiteCacheBackend(tmp_path / "cache.db")
+        reader = SQLiteCacheBackend(tmp_path / "cache.db")
+        await writer.set("key", b"value", ttl=10)
+        assert await reader.get("key") == b"value"
+
+        await reader.delete("k")
+        assert await writer.get("key") is None
+
+
+@pytest.fixture
+def cached_server():
+    mcp = FastMCP("CacheServer")
+    mcp.calls = []  # type: ignore[attr-defined]
+
+    @mcp.tool
+    def add(a: int, b: int) -> int:
+        mcp.calls.append(("add", a, b))  # type: ignore[attr-defined]
+        return a + b
+
+    @mcp.tool
+    def counter() -> int:
+        mcp.calls.append(("counter",))  # type: ignore[attr-defined]
+        return len(mcp.calls)  # type: ignore[attr-defined]
+
+    @mcp.resource("data://config")
+    def config() -> str:
+        mcp.calls.append(("config",))  # type: ignore[attr-defined]
+        return "config"
+
+    @mcp.resource("data://blob", mime_type="application/octet-stream")
+    def blob() -> bytes:
+        mcp.calls.append(("blob",))  # type: ignore[attr-defined]
+        return b"\x00\x01"
+
+    @mcp.prompt
+    def greet(name: str) -> str:
+        mcp.calls.append(("greet", name))  # type: ignore[attr-defined]
+        return f"Hello, {name}!"
+
+    return mcp
+
+
+class TestResponseCachingMiddleware:
+    """Integration tests for response caching middleware."""
+
+    async def test_caches_reads_and_prompts(self, cached_server):
+        cache = ResponseCachingMiddleware()
+        cached_server.add_middleware(cache)
+
+        async with Client(cached_server) as client:
+            for _ in range(2):
+                config = await client.read_resource("data://config")
+                blob = await client.read_resource("data://blob")
+                prompt = await client.get_prompt("greet", {"name": "Ada"})
+
+        assert config[0].text == "config"  # type: ignore[attr-defined]
+        assert blob[0].blob == "AAE="  # type: ignore[attr-defined]
+        assert prompt.messages[0].content.text == "Hello, Ada!"  # type: ignore[attr-defined]
+        assert cached_server.calls == [("config",), ("blob",), ("greet", "Ada")]
+        stats = await cache.get_stats()
+        assert (stats.entries, stats.hits, stats.misses) == (3, 3, 3)
+
+    async def test_prompt_arguments_are_part_of_key(self, cached_server):
+        cached_server.add_middleware(ResponseCachingMiddleware())
+
+        async with Client(cached_server) as client:
+            await client.get_prompt("greet", {"name": "Ada"})
+            await client.get_prompt("greet", {"name": "Grace"})
+
+        assert cached_server.calls == [("greet", "Ada"), ("greet", "Grace")]
+
+    async def test_tool_calls_are_opt_in(self, cached_server):
+        cached_server.add_middleware(ResponseCachingMiddleware(cached_tools={"add"}))
+
+        async with Client(cached_server) as client:
+            for _ in range(2):
+                result = await client.call_tool("add", {"a": 1, "b": 2})
+                assert result.data == 3
+                await client.call_tool("counter", {})
+
+        assert cached_server.calls == [("add", 1, 2), ("counter",), ("counter",)]
+
+    async def test_caches_listings(self, cached_server):
+        cache = ResponseCachingMiddleware()
+        cached_server.add_middleware(cache)
+
+        async with Client(cached_server) as client:
+            first = await client.list_tools()
+            second = await client.list_tools()
+
+        assert [tool.name for tool in first] == [tool.name for tool in second]
+        assert (await cache.get_stats()).hits == 1
+
+    async def test_component_changes_invalidate(self, cached_server):
+        cached_server.add_middleware(ResponseCachingMiddleware(cached_tools={"add"}))
+
+        async with Client(cached_server) as client:
+            await client.read_resource("data://config")
+            await client.call_tool("add", {"a": 1, "b": 2})
+            assert len(await client.list_tools()) == 2
+
+            @cached_server.tool
+            def subtract(a: int, b: int) -> int:
+                return a - b
+
+            assert len(await client.list_tools()) == 3
+            await client.call_tool("add", {"a": 1, "b": 2})
+            # resources didn't change, so their responses are still cached
+            await client.read_resource("data://config")
+
+        assert cached_server.calls == [("config",), ("add", 1, 2), ("add", 1, 2)]
+
+    async def test_disabling_a_tool_invalidates(self, cached_server):
+        cached_server.add_middleware(ResponseCachingMiddleware())
+
+        async with Client(cached_server) as client:
+            assert len(await client.list_tools()) == 2
+            (await cached_server.get_tool("counter")).disable()
+            assert len(await client.list_tools()) == 1
+
+    async def test_mounted_changes_invalidate(self, cached_server):
+        child = FastMCP("Child")
+        cached_server.mount(child, prefix="child")
+        cached_server.add_middleware(ResponseCachingMiddleware())
+
+        async with Client(cached_server) as client:
+            assert len(await client.list_tools()) == 2
+
+            @child.tool
+            def multiply(a: int, b: int) -> int:
+                return a * b
+
+            assert len(await client.list_tools()) == 3
+
+    async def test_changes_are_tracked_per_server(self):
+        cache = ResponseCachingMiddleware()
+        servers = [FastMCP("A"), FastMCP("B")]
+        calls = []
+
+        def add_data(server: FastMCP) -> None:
+            @server.resource(f"data://{server.name}")
+            def data() -> str:
+                calls.append(server.name)
+                return server.name
+
+        for server in servers:
+            server.add_middleware(cache)
+            add_data(server)
+
+        async with Client(servers[0]) as a, Client(servers[1]) as b:
+            for _ in range(2):
+                await a.read_resource("data://A")
+                await b.read_resource("data://B")
+
+            @servers[1].tool
+            def noop() -> None:
+                pass
+
+            # a change to B's tools leaves the resources of both cached
+            await a.read_resource("data://A")
+            await b.read_resource("data://B")
+
+        assert calls == ["A", "B"]
+
+    async def test_per_client_keys(self, cached_server):
+        client_ids = iter(["a", "b", "a"])
+
+        def get_client_id(context) -> str:
+            return next(client_ids) if context.method == "tools/call" else ""
+
+        cached_server.add_middleware(
+            ResponseCachingMiddleware(
+                cached_tools={"counter"}, get_client_id=get_client_id
+            )
+        )
+
+        async with Client(cached_server) as client:
+            results = [(await client.call_tool("counter", {})).data for _ in range(3)]
+
+        assert results == [1, 2, 1]
+
+    async def test_errors_are_not_cached(self, cached_server):
+        cached_server.add_middleware(ResponseCachingMiddleware())
+
+        async with Client(cached_server) as client:
+            for _ in range(2):
+                with pytest.raises(Exception):
+                    await client.read_resource("data://missing")
+
+    async def test_invalidate(self, cached_server):
+        cache = ResponseCachingMiddleware()
+        cached_server.add_middleware(cache)
+
+        async with Client(cached_server) as client:
+            await client.read_resource("data://config")
+            await cache.invalidate("resources/read")
+            await client.read_resource("data://config")
+
+        assert cached_server.calls == [("config",), ("config",)]
+
+    async def test_sqlite_backend(self, cached_server, tmp_path):
+        backend = SQLiteCacheBackend(tmp_path / "cache.db")
+        cached_server.add_middleware(
+            ResponseCachingMiddleware(backend=backend, cached_tools={"add"})
+        )
+
+        async with Client(cached_server) as client:
+            for _ in range(2):
+                result = await client.call_tool("add", {"a": 2, "b": 3})
+                assert result.data == 5
+                assert result.structured_content == {"result": 5}
+
+        assert cached_server.calls == [("add", 2, 3)]
+        assert (await backend.stats()).entries == 1
@@ -0,0 +1,225 @@
+"""Tests for concurrency limiting middleware."""
+
+import asyncio
+import time
+
+import anyio
+import pytest
+
+from fastmcp import FastMCP
+from fastmcp.client import Client
+from fastmcp.exceptions import ToolError
+from fastmcp.server.middleware.concurrency import (
+    AIMDLimit,
+    ConcurrencyLimiter,
+    ConcurrencyLimitingMiddleware,
+    OverloadedError,
+)
+
+
+class TestConcurrencyLimiter:
+    """Test the queueing concurrency limiter."""
+
+    async def test_acquire_within_limit(self):
+        limiter = ConcurrencyLimiter(2)
+        await limiter.acquire()
+        await limiter.acquire()
+        assert limiter.in_flight == 2
+
+    async def test_rejects_when_queue_is_full(self):
+        limiter = ConcurrencyLimiter(1, max_queue=0)
+        await limiter.acquire()
+
+        with pytest.raises(OverloadedError, match="Server overloaded") as exc_info:
+            await limiter.acquire()
+        assert exc_info.value.error.data == {"retryable": True}
+        assert limiter.rejected == 1
+
+    async def test_queued_requests_are_served_in_order(self):
+        limiter = ConcurrencyLimiter(1, max_queue=None)
+        order = []
+        await limiter.acquire()
+
+        async def waiter(i: int):
+            await limiter.acquire()
+            order.append(i)
+            limiter.release()
+
+        async with anyio.create_task_group() as tg:
+            for i in range(3):
+                tg.start_soon(waiter, i)
+                await anyio.sleep(0)
+            assert limiter.queued == 3
+            limiter.release()
+
+        assert order == [0, 1, 2]
+        assert (limiter.in_flight, limiter.queued) == (0, 0)
+
+    async def test_queue_timeout(self):
+        limiter = ConcurrencyLimiter(1, max_queue=1, queue_timeout=0.01)
+        await limiter.acquire()
+
+        with pytest.raises(OverloadedError):
+            await limiter.acquire()
+        assert (limiter.queued, limiter.rejected) == (0, 1)
+
+    async def test_slot_granted_as_wait_times_out(self):
+        limiter = ConcurrencyLimiter(1, max_queue=1, queue_timeout=0.01)
+        await limiter.acquire()
+
+        async def waiter():
+            with pytest.raises(OverloadedError):
+                await limiter.acquire()
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(waiter)
+            while not limiter.queued:
+                await anyio.sleep(0)
+            # blocking the event loop lets the timeout fire and the slot be
+            # handed over before the waiter runs again
+            asyncio.get_running_loop().call_later(0.02, limiter.release)
+            time.sleep(0.05)
+
+        assert (limiter.in_flight, limiter.queued, limiter.rejected) == (0, 0, 1)
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        limiter = ConcurrencyLimiter(1, max_queue=None)
+        await limiter.acquire()
+
+        with anyio.move_on_after(0.01):
+            await limiter.acquire()
+
+        assert limiter.queued == 0
+        limiter.release()
+        assert limiter.in_flight == 0
+
+
+class TestAIMDLimit:
+    """Test the adaptive AIMD limit."""
+
+    def test_grows_while_fast_and_in_use(self):
+        limit = AIMDLimit(initial_limit=10, latency_threshold=1.0)
+        limit.on_sample(0.1, in_flight=5)
+        assert limit.limit == 11
+        # a mostly idle limit doesn't grow
+        limit.on_sample(0.1, in_flight=1)
+        assert limit.limit == 11
+
+    def test_backs_off_when_slow(self):
+        limit = AIMDLimit(initial_limit=10, latency_threshold=1.0, backoff_ratio=0.5)
+        limit.on_sample(2.0, in_flight=10)
+        assert limit.limit == 5
+
+    def test_bounds(self):
+        limit = AIMDLimit(initial_limit=2, min_limit=2, max_limit=3)
+        limit.on_sample(10.0, in_flight=2)
+        assert limit.limit == 2
+        for _ in range(5):
+            limit.on_sample(0.0, in_flight=2)
+        assert limit.limit == 3
+
+    async def test_adapts_limiter(self):
+        limiter = ConcurrencyLimiter(AIMDLimit(initial_limit=4, backoff_ratio=0.5))
+        await limiter.acquire()
+        limiter.release(latency=5.0)
+        assert limiter.limit == 2
+
+
+@pytest.fixture
+def slow_server():
+    mcp = FastMCP("ConcurrencyServer")
+
+    @mcp.tool
+    async def slow(delay: float = 0.2) -> str:
+        await anyio.sleep(delay)
+        return "done"
+
+    @mcp.tool
+    def fast() -> str:
+        return "done"
+
+    return mcp
+
+
+class TestConcurrencyLimitingMiddleware:
+    """Integration tests for concurrency limiting middleware."""
+
+    async def test_sheds_excess_tool_calls(self, slow_server):
+        middleware = ConcurrencyLimitingMiddleware(max_concurrent=2, max_queue=0)
+        slow_server.add_middleware(middleware)
+        results = []
+
+        async def call(client: Client):
+            try:
+                await client.call_tool("slow", {})
+                results.append("done")
+            except ToolError as e:
+                results.append(str(e))
+
+        async with Client(slow_server) as client:
+            async with anyio.create_task_group() as tg:
+                for _ in range(3):
+                    tg.start_soon(call, client)
+
+        assert results.count("done") == 2
+        assert any("Server overloaded" in result for result in results)
+        assert middleware.global_limiter is not None
+        assert middleware.global_limiter.in_flight == 0
+
+    async def test_queued_calls_complete(self, slow_server):
+        slow_server.add_middleware(
+            ConcurrencyLimitingMiddleware(max_concurrent=1, max_queue=10)
+        )
+
+        async with Client(slow_server) as client:
+            async with anyio.create_task_group() as tg:
+                for _ in range(3):
+                    tg.start_soon(client.call_tool, "slow", {"delay": 0.01})
+
+    async def test_per_method_limit(self, slow_server):
+        slow_server.add_middleware(
+            ConcurrencyLimitingMiddleware(
+                max_concurrent=None, per_method={"tools/call": 1}, max_queue=0
+            )
+        )
+
+        async with Client(slow_server) as client:
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(client.call_tool, "slow", {})
+                await anyio.sleep(0.05)
+                # other methods aren't limited
+                await client.list_tools()
+                with pytest.raises(ToolError, match="Method tools/call overloaded"):
+                    await client.call_tool("fast", {})
+
+    async def test_per_client_limit(self, slow_server):
+        def get_client_id(context) -> str:
+            if context.method != "tools/call":
+                return "listing"
+            return context.message.arguments.get("client", "a")
+
+        slow_server.add_middleware(
+            ConcurrencyLimitingMiddleware(
+                max_concurrent=None,
+                per_client=1,
+                get_client_id=get_client_id,
+                max_queue=0,
+            )
+        )
+
+        @slow_server.tool
+        async def slow_for(client: str, delay: float = 0.0) -> str:
+            await anyio.sleep(delay)
+            return client
+
+        async with Client(slow_server) as client:
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(
+                    client.call_tool, "slow_for", {"client": "a", "delay": 0.5}
+                )
+                await anyio.sleep(0.05)
+                # another client still gets a slot
+                result = await client.call_tool("slow_for", {"client": "b"})
+                assert result.data == "b"
+                with pytest.raises(ToolError, match="Client a overloaded"):
+                    await client.call_tool("slow_for", {"client": "a"})
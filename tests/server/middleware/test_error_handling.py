@@ -6,7 +6,11 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 from mcp import McpError
 
+from fastmcp.server.middleware import error_handling
 from fastmcp.server.middleware.error_handling import (
+    CircuitBreaker,
+    CircuitBreakerMiddleware,
+    CircuitOpenError,
     ErrorHandlingMiddleware,
     RetryMiddleware,
 )
@@ -27,6 +31,21 @@ def mock_call_next():
     return AsyncMock(return_value="test_result")
 
 
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Replace the clock the circuit breakers read with one the test controls."""
+
+    class FakeClock:
+        now = 0.0
+
+        def monotonic(self) -> float:
+            return self.now
+
+    clock = FakeClock()
+    monkeypatch.setattr(error_handling, "time", clock)
+    return clock
+
+
 class TestErrorHandlingMiddleware:
     """Test error handling middleware functionality."""
 
@@ -599,3 +618,239 @@ class TestRetryMiddlewareIntegration:
 
         # Should have error logs from error handling middleware
         assert "Error in tools/call:" in log_text
+
+
+class TestCircuitBreaker:
+    """Test the state machine of a single circuit."""
+
+    def test_opens_on_failure_rate(self, fake_clock):
+        circuit = CircuitBreaker(failure_rate_threshold=0.5, minimum_calls=4)
+        for failed in (False, True, False):
+            admitted = circuit.before_call("tool")
+            circuit.record(failed=failed, duration=0.0, admitted=admitted)
+        assert circuit.state == "closed"
+
+        admitted = circuit.before_call("tool")
+        circuit.record(failed=True, duration=0.0, admitted=admitted)
+        assert circuit.state == "open"
+
+        with pytest.raises(CircuitOpenError, match="Circuit open for tool") as exc_info:
+            circuit.before_call("tool")
+        assert exc_info.value.error.data == {"retryable": True, "retry_after": 30.0}
+
+    def test_opens_on_slow_call_rate(self, fake_clock):
+        circuit = CircuitBreaker(
+            slow_call_duration=1.0, slow_call_rate_threshold=0.5, minimum_calls=2
+        )
+        circuit.record(failed=False, duration=0.5, admitted="closed")
+        circuit.record(failed=False, duration=2.0, admitted="closed")
+        assert circuit.state == "open"
+
+    def test_only_recent_calls_count(self, fake_clock):
+        circuit = CircuitBreaker(window_size=4, minimum_calls=4)
+        for failed in (True, False, False, False, False, False):
+            circuit.record(failed=failed, duration=0.0, admitted="closed")
+        stats = circuit.stats()
+        assert (stats.state, stats.calls, stats.failure_rate) == ("closed", 4, 0.0)
+
+    def test_half_open_trial_closes_circuit(self, fake_clock):
+        circuit = CircuitBreaker(minimum_calls=1, open_duration=10, half_open_calls=2)
+        circuit.record(failed=True, duration=0.0, admitted="closed")
+        assert circuit.state == "open"
+
+        fake_clock.now = 10.0
+        assert circuit.before_call("tool") == "half_open"
+        assert circuit.before_call("tool") == "half_open"
+        # only half_open_calls trial calls are let through
+        with pytest.raises(CircuitOpenError):
+            circuit.before_call("tool")
+
+        circuit.record(failed=False, duration=0.0, admitted="half_open")
+        circuit.record(failed=False, duration=0.0, admitted="half_open")
+        assert circuit.state == "closed"
+        assert circuit.stats().calls == 0
+
+    def test_failed_trial_reopens_circuit(self, fake_clock):
+        circuit = CircuitBreaker(minimum_calls=1, open_duration=10)
+        circuit.record(failed=True, duration=0.0, admitted="closed")
+
+        fake_clock.now = 10.0
+        circuit.before_call("tool")
+        circuit.record(failed=True, duration=0.0, admitted="half_open")
+        assert circuit.state == "open"
+        assert circuit.stats().retry_after == 10.0
+
+    def test_released_trial_frees_slot(self, fake_clock):
+        circuit = CircuitBreaker(minimum_calls=1, open_duration=10)
+        circuit.record(failed=True, duration=0.0, admitted="closed")
+
+        fake_clock.now = 10.0
+        circuit.before_call("tool")
+        circuit.release(admitted="half_open")
+        circuit.before_call("tool")
+        assert circuit.state == "half_open"
+
+    def test_calls_from_before_opening_are_not_trials(self, fake_clock):
+        circuit = CircuitBreaker(minimum_calls=2, open_duration=10)
+        late = circuit.before_call("tool")
+        for _ in range(2):
+            circuit.record(
+                failed=True, duration=0.0, admitted=circuit.before_call("tool")
+            )
+        assert circuit.state == "open"
+
+        fake_clock.now = 10.0
+        trial = circuit.before_call("tool")
+        # a call let through while closed ends during the trial
+        circuit.record(failed=False, duration=0.0, admitted=late)
+        circuit.release(admitted=late)
+        assert circuit.state == "half_open"
+        with pytest.raises(CircuitOpenError):
+            circuit.before_call("tool")
+
+        circuit.record(failed=False, duration=0.0, admitted=trial)
+        assert circuit.state == "closed"
+
+    def test_trials_ending_after_reopening_are_ignored(self, fake_clock):
+        circuit = CircuitBreaker(minimum_calls=1, open_duration=10, half_open_calls=2)
+        circuit.record(failed=True, duration=0.0, admitted="closed")
+
+        fake_clock.now = 10.0
+        first = circuit.before_call("tool")
+        second = circuit.before_call("tool")
+        circuit.record(failed=True, duration=0.0, admitted=first)
+        circuit.record(failed=False, duration=0.0, admitted=second)
+        assert circuit.state == "open"
+
+
+class TestCircuitBreakerMiddleware:
+    """Test circuit breaker middleware functionality."""
+
+    async def test_rejects_calls_while_open(self, fake_clock):
+        middleware = CircuitBreakerMiddleware(minimum_calls=2)
+        context = MagicMock()
+        context.message.name = "flaky"
+        call_next = AsyncMock(side_effect=ConnectionError("down"))
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                await middleware.on_call_tool(context, call_next)
+        with pytest.raises(CircuitOpenError):
+            await middleware.on_call_tool(context, call_next)
+
+        assert call_next.call_count == 2
+        stats = middleware.get_circuit_stats()
+        assert stats["flaky"].state == "open"
+
+    async def test_failure_exceptions(self, fake_clock):
+        middleware = CircuitBreakerMiddleware(
+            minimum_calls=1, failure_exceptions=(ConnectionError,)
+        )
+        context = MagicMock()
+        context.message.name = "tool"
+
+        with pytest.raises(ValueError):
+            await middleware.on_call_tool(context, AsyncMock(side_effect=ValueError))
+        assert middleware.get_circuit_stats()["tool"].state == "closed"
+
+    async def test_reset(self, fake_clock):
+        middleware = CircuitBreakerMiddleware(minimum_calls=1)
+        context = MagicMock()
+        context.message.name = "tool"
+
+        with pytest.raises(ConnectionError):
+            await middleware.on_call_tool(
+                context, AsyncMock(side_effect=ConnectionError)
+            )
+        middleware.reset("tool")
+        assert await middleware.on_call_tool(context, AsyncMock(return_value=1)) == 1
+
+
+class TestCircuitBreakerMiddlewareIntegration:
+    """Integration tests for circuit breaker middleware with real FastMCP server."""
+
+    async def test_open_circuit_fails_fast(self, error_handling_server):
+        from fastmcp.client import Client
+        from fastmcp.exceptions import ToolError
+
+        middleware = CircuitBreakerMiddleware(minimum_calls=2)
+        error_handling_server.add_middleware(middleware)
+
+        async with Client(error_handling_server) as client:
+            for _ in range(2):
+                with pytest.raises(ToolError, match="Value error occurred"):
+                    await client.call_tool("failing_operation", {})
+            with pytest.raises(ToolError, match="Circuit open for failing_operation"):
+                await client.call_tool("failing_operation", {})
+
+            # other tools have their own circuits
+            result = await client.call_tool("reliable_operation", {"data": "ok"})
+            assert result.data == "Success: ok"
+
+        assert set(middleware.get_circuit_stats()) == {
+            "failing_operation",
+            "reliable_operation",
+        }
+
+    async def test_client_errors_are_not_recorded(self, error_handling_server):
+        from fastmcp.client import Client
+        from fastmcp.exceptions import ToolError
+
+        @error_handling_server.tool
+        def rejecting(value: int) -> int:
+            raise ToolError("value must be even")
+
+        middleware = CircuitBreakerMiddleware(minimum_calls=1)
+        error_handling_server.add_middleware(middleware)
+
+        async with Client(error_handling_server) as client:
+            with pytest.raises(ToolError, match="Unknown tool"):
+                await client.call_tool("missing", {})
+            with pytest.raises(ToolError, match="Input validation error"):
+                await client.call_tool("rejecting", {"value": "one"})
+            with pytest.raises(ToolError, match="value must be even"):
+                await client.call_tool("rejecting", {"value": 1})
+
+            assert middleware.get_circuit_stats() == {}
+
+            # the circuit still opens on backend failures
+            with pytest.raises(ToolError, match="Value error occurred"):
+                await client.call_tool("failing_operation", {})
+            assert middleware.get_circuit_stats()["failing_operation"].state == "open"
+
+    async def test_count_client_errors(self, error_handling_server):
+        from fastmcp.client import Client
+        from fastmcp.exceptions import ToolError
+
+        middleware = CircuitBreakerMiddleware(minimum_calls=1, count_client_errors=True)
+        error_handling_server.add_middleware(middleware)
+
+        async with Client(error_handling_server) as client:
+            with pytest.raises(ToolError, match="Unknown tool"):
+                await client.call_tool("missing", {})
+
+        assert middleware.get_circuit_stats()["missing"].state == "open"
+
+    async def test_key_by_mount(self, error_handling_server):
+        from fastmcp import FastMCP
+        from fastmcp.client import Client
+        from fastmcp.exceptions import ToolError
+
+        parent = FastMCP("Parent")
+        parent.mount(error_handling_server, prefix="backend")
+
+        @parent.tool
+        def local() -> str:
+            return "local"
+
+        middleware = CircuitBreakerMiddleware(minimum_calls=2, key_by_mount=True)
+        parent.add_middleware(middleware)
+
+        async with Client(parent) as client:
+            for _ in range(2):
+                with pytest.raises(ToolError):
+                    await client.call_tool("backend_failing_operation", {})
+            # the whole mounted server is cut off
+            with pytest.raises(ToolError, match="Circuit open for mount:backend"):
+                await client.call_tool("backend_reliable_operation", {"data": "ok"})
+            assert (await client.call_tool("local", {})).data == "local"
@@ -1,5 +1,5 @@
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 import mcp.types
@@ -9,6 +9,7 @@ from fastmcp import Client, FastMCP
 from fastmcp.exceptions import ToolError
 from fastmcp.server.context import Context
 from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from fastmcp.server.middleware.middleware import compile_middleware_hooks
 from fastmcp.tools.tool import ToolResult
 
 
@@ -892,3 +893,107 @@ class TestToolCallDenial:
 
         # Verify both admin tools were denied
         assert denied_tools == {"admin_delete", "admin_config"}
+
+
+class TestCompiledMiddlewareHooks:
+    def test_hooks_that_are_not_overridden_are_skipped(self):
+        class ToolsOnly(Middleware):
+            async def on_call_tool(self, context, call_next):
+                return await call_next(context)
+
+        class MessagesOnly(Middleware):
+            async def on_message(self, context, call_next):
+                return await call_next(context)
+
+        tools_only = ToolsOnly()
+        messages_only = MessagesOnly()
+
+        hooks = compile_middleware_hooks(
+            [tools_only, messages_only], "tools/call", "request"
+        )
+        assert hooks == (tools_only.on_call_tool, messages_only.on_message)
+
+        hooks = compile_middleware_hooks(
+            [tools_only, messages_only], "tools/list", "request"
+        )
+        assert hooks == (messages_only.on_message,)
+
+    def test_hooks_are_ordered_like_dispatch(self):
+        class Everything(Middleware):
+            async def on_message(self, context, call_next):
+                return await call_next(context)
+
+            async def on_request(self, context, call_next):
+                return await call_next(context)
+
+            async def on_get_prompt(self, context, call_next):
+                return await call_next(context)
+
+        first = Everything()
+        second = Everything()
+
+        hooks = compile_middleware_hooks([first, second], "prompts/get", "request")
+        assert hooks == (
+            first.on_message,
+            first.on_request,
+            first.on_get_prompt,
+            second.on_message,
+            second.on_request,
+            second.on_get_prompt,
+        )
+
+    def test_custom_call_is_kept_whole(self):
+        class CustomCall(Middleware):
+            async def __call__(self, context, call_next):
+                return await call_next(context)
+
+        custom = CustomCall()
+        assert compile_middleware_hooks([custom], "tools/call", "request") == (custom,)
+
+    async def test_middleware_added_later_is_applied(self):
+        server = FastMCP("Server")
+
+        @server.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        async with Client(server) as client:
+            result = await client.call_tool("add", {"a": 1, "b": 2})
+            assert result.data == 3
+
+            recording = RecordingMiddleware()
+            server.add_middleware(recording)
+
+            await client.call_tool("add", {"a": 1, "b": 2})
+            assert recording.assert_called(hook="on_call_tool", times=1)
+
+    async def test_value_equal_replacement_is_applied(self):
+        @dataclass
+        class Tagging(Middleware):
+            label: str = "mw"
+            calls: int = field(default=0, compare=False)
+
+            async def on_call_tool(self, context, call_next):
+                self.calls += 1
+                return await call_next(context)
+
+        server = FastMCP("Server")
+
+        @server.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        old = Tagging()
+        server.add_middleware(old)
+
+        async with Client(server) as client:
+            await client.call_tool("add", {"a": 1, "b": 2})
+
+            new = Tagging()
+            assert new == old
+            server.middleware[0] = new
+
+            await client.call_tool("add", {"a": 1, "b": 2})
+
+        assert old.calls == 1
+        assert new.calls == 1
@@ -1,6 +1,10 @@
 """Tests for rate limiting middleware."""
 
 import asyncio
+import os
+import threading
+import time
+import uuid
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -8,12 +12,17 @@ import pytest
 from fastmcp import FastMCP
 from fastmcp.client import Client
 from fastmcp.exceptions import ToolError
+from fastmcp.server.middleware import rate_limiting
+from fastmcp.server.middleware.concurrency import ConcurrencyLimiter
 from fastmcp.server.middleware.middleware import MiddlewareContext
 from fastmcp.server.middleware.rate_limiting import (
+    LimiterTable,
     RateLimitError,
     RateLimitingMiddleware,
+    RedisRateLimiterStorage,
     SlidingWindowRateLimiter,
     SlidingWindowRateLimitingMiddleware,
+    SQLiteRateLimiterStorage,
     TokenBucketRateLimiter,
 )
 
@@ -26,6 +35,21 @@ def mock_context():
     return context
 
 
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Replace the clock the rate limiters read with one the test controls."""
+
+    class FakeClock:
+        now = 0.0
+
+        def monotonic(self) -> float:
+            return self.now
+
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiting, "time", clock)
+    return clock
+
+
 @pytest.fixture
 def mock_call_next():
     """Create a mock call_next function."""
@@ -83,7 +107,8 @@ class TestSlidingWindowRateLimiter:
         limiter = SlidingWindowRateLimiter(max_requests=10, window_seconds=60)
         assert limiter.max_requests == 10
         assert limiter.window_seconds == 60
-        assert len(limiter.requests) == 0
+        assert limiter.current_count == 0
+        assert limiter.previous_count == 0
 
     async def test_is_allowed_success(self):
         """Test allowing requests within limit."""
@@ -120,6 +145,75 @@ class TestSlidingWindowRateLimiter:
         # Should be able to make requests again
         assert await limiter.is_allowed() is True
 
+    async def test_previous_window_is_weighted(self, fake_clock):
+        """Test that requests in the previous window count in proportion to its overlap."""
+        limiter = SlidingWindowRateLimiter(max_requests=10, window_seconds=10)
+
+        fake_clock.now = 105.0
+        for _ in range(10):
+            assert await limiter.is_allowed() is True
+        assert await limiter.is_allowed() is False
+
+        # 30% into the next window, 70% of the previous window still counts
+        fake_clock.now = 113.0
+        assert await limiter.is_allowed() is True
+        assert await limiter.is_allowed() is True
+        assert await limiter.is_allowed() is True
+        assert await limiter.is_allowed() is False
+
+        # a whole idle window later, nothing counts
+        fake_clock.now = 131.0
+        for _ in range(10):
+            assert await limiter.is_allowed() is True
+
+
+class TestLimiterTable:
+    """Test the table of per-client limiters."""
+
+    def test_creates_limiters_on_first_use(self):
+        table = LimiterTable(lambda: TokenBucketRateLimiter(10, 1.0))
+        limiter = table["a"]
+        assert table["a"] is limiter
+        assert table["b"] is not limiter
+        assert len(table) == 2
+
+    def test_evicts_least_recently_used(self):
+        table = LimiterTable(lambda: TokenBucketRateLimiter(10, 1.0), max_clients=2)
+        a = table["a"]
+        table["b"]
+        table["a"]
+        table["c"]
+
+        assert "a" in table
+        assert "b" not in table
+        assert table["a"] is a
+        assert len(table) == 2
+
+    async def test_keeps_limiters_in_use(self, fake_clock):
+        table = LimiterTable(lambda: ConcurrencyLimiter(1), max_clients=1, ttl=10)
+        fake_clock.now = 100.0
+        busy = table["a"]
+        await busy.acquire()
+        fake_clock.now = 111.0
+        table["b"]
+
+        assert table["a"] is busy
+        busy.release()
+        table["b"]
+        assert "a" not in table
+
+    def test_drops_idle_limiters(self, fake_clock):
+        table = LimiterTable(lambda: TokenBucketRateLimiter(10, 1.0), ttl=10)
+        fake_clock.now = 100.0
+        table["a"]
+        fake_clock.now = 105.0
+        table["b"]
+        fake_clock.now = 111.0
+        table["b"]
+
+        assert "a" not in table
+        assert "b" in table
+
 
 class TestRateLimitingMiddleware:
     """Test rate limiting middleware."""
@@ -198,6 +292,164 @@ class TestRateLimitingMiddleware:
         with pytest.raises(RateLimitError, match="Global rate limit exceeded"):
             await middleware.on_request(mock_context, mock_call_next)
 
+    async def test_client_limiters_are_bounded(self, mock_context, mock_call_next):
+        """Test that the limiters of many clients don't accumulate."""
+        client_ids = iter(range(100))
+        middleware = RateLimitingMiddleware(
+            get_client_id=lambda ctx: str(next(client_ids)), max_clients=10
+        )
+
+        for _ in range(100):
+            await middleware.on_request(mock_context, mock_call_next)
+
+        assert len(middleware.limiters) == 10
+
+    async def test_storage_shares_limits(self, tmp_path, mock_context, mock_call_next):
+        """Test that middlewares sharing storage, as workers would, share limits."""
+        workers = [
+            RateLimitingMiddleware(
+                max_requests_per_second=0.001,
+                burst_capacity=3,
+                storage=SQLiteRateLimiterStorage(tmp_path / "limits.db"),
+            )
+            for _ in range(2)
+        ]
+
+        await workers[0].on_request(mock_context, mock_call_next)
+        await workers[1].on_request(mock_context, mock_call_next)
+        await workers[0].on_request(mock_context, mock_call_next)
+        with pytest.raises(RateLimitError, match="Rate limit exceeded"):
+            await workers[1].on_request(mock_context, mock_call_next)
+
+
+class TestSQLiteRateLimiterStorage:
+    """Test SQLite rate limiter storage."""
+
+    async def test_consume(self, tmp_path):
+        storage = SQLiteRateLimiterStorage(tmp_path / "limits.db")
+
+        assert await storage.consume("a", capacity=2, refill_rate=0.001) is True
+        assert await storage.consume("a", capacity=2, refill_rate=0.001) is True
+        assert await storage.consume("a", capacity=2, refill_rate=0.001) is False
+        # buckets are independent
+        assert await storage.consume("b", capacity=2, refill_rate=0.001) is True
+
+    async def test_refill(self, tmp_path):
+        storage = SQLiteRateLimiterStorage(tmp_path / "limits.db")
+
+        assert await storage.consume("a", capacity=2, refill_rate=10.0, tokens=2)
+        assert not await storage.consume("a", capacity=2, refill_rate=10.0)
+        await asyncio.sleep(0.2)
+        assert await storage.consume("a", capacity=2, refill_rate=10.0)
+
+    def test_concurrent_connections(self, tmp_path):
+        """Test that concurrent updates through separate connections are atomic."""
+        path = tmp_path / "limits.db"
+        SQLiteRateLimiterStorage(path)
+        allowed = []
+
+        def worker():
+            storage = SQLiteRateLimiterStorage(path)
+            for _ in range(50):
+                allowed.append(storage._consume("a", 100, 0.001, 1))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert allowed.count(True) == 100
+
+
+class FakeRedis:
+    """A stand-in for an async Redis client that runs the token bucket script
+    in Python."""
+
+    def __init__(self):
+        self.buckets: dict[str, tuple[float, float]] = {}
+        self.calls: list[tuple] = []
+
+    async def eval(self, script: str, numkeys: int, *keys_and_args):
+        self.calls.append((numkeys, *keys_and_args))
+        key = keys_and_args[0]
+        capacity, refill_rate, requested = (float(a) for a in keys_and_args[1:])
+        now = time.monotonic()
+        tokens, updated_at = self.buckets.get(key, (capacity, now))
+        tokens = min(capacity, tokens + max(0, now - updated_at) * refill_rate)
+        allowed = 0
+        if tokens >= requested:
+            tokens -= requested
+            allowed = 1
+        self.buckets[key] = (tokens, now)
+        return allowed
+
+
+class TestRedisRateLimiterStorage:
+    """Test the Redis rate limiter storage adapter."""
+
+    async def test_consume(self):
+        client = FakeRedis()
+        storage = RedisRateLimiterStorage(client, prefix="test:")
+
+        assert await storage.consume("a", capacity=1, refill_rate=0.001) is True
+        assert await storage.consume("a", capacity=1, refill_rate=0.001) is False
+        assert client.calls[0] == (1, "test:a", 1, 0.001, 1)
+
+    async def test_middleware(self, mock_context, mock_call_next):
+        client = FakeRedis()
+        middleware = RateLimitingMiddleware(
+            max_requests_per_second=0.001,
+            burst_capacity=1,
+            global_limit=True,
+            storage=RedisRateLimiterStorage(client),
+        )
+
+        await middleware.on_request(mock_context, mock_call_next)
+        with pytest.raises(RateLimitError, match="Global rate limit exceeded"):
+            await middleware.on_request(mock_context, mock_call_next)
+        assert list(client.buckets) == ["fastmcp:rate_limit:global"]
+
+
+@pytest.fixture
+async def redis_client():
+    """A client of the Redis server at REDIS_URL, or localhost by default."""
+    redis = pytest.importorskip("redis.asyncio")
+    client = redis.Redis.from_url(
+        os.environ.get("REDIS_URL", "redis://localhost:6379/0")
+    )
+    try:
+        await client.ping()
+    except Exception:
+        await client.aclose()
+        pytest.skip("No Redis server available")
+    yield client
+    await client.aclose()
+
+
+class TestRedisServer:
+    """Test the token bucket script on a real Redis server."""
+
+    async def test_consume(self, redis_client):
+        prefix = f"fastmcp:test:{uuid.uuid4().hex}:"
+        storage = RedisRateLimiterStorage(redis_client, prefix=prefix)
+
+        assert await storage.consume("a", capacity=2, refill_rate=0.001) is True
+        assert await storage.consume("a", capacity=2, refill_rate=0.001) is True
+        assert await storage.consume("a", capacity=2, refill_rate=0.001) is False
+        assert await storage.consume("b", capacity=2, refill_rate=0.001) is True
+        # idle buckets expire once they would have refilled
+        assert 0 < await redis_client.pttl(prefix + "a") <= 2_000_000
+
+    async def test_refill(self, redis_client):
+        prefix = f"fastmcp:test:{uuid.uuid4().hex}:"
+        storage = RedisRateLimiterStorage(redis_client, prefix=prefix)
+
+        assert await storage.consume("a", capacity=2, refill_rate=10.0, tokens=2)
+        assert not await storage.consume("a", capacity=2, refill_rate=10.0)
+        await asyncio.sleep(0.2)
+        assert await storage.consume("a", capacity=2, refill_rate=10.0)
+
 
 class TestSlidingWindowRateLimitingMiddleware:
     """Test sliding window rate limiting middleware."""
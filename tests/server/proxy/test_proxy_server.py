@@ -1,6 +1,7 @@
 import inspect
 import json
 from typing import Any, cast
+from unittest.mock import patch
 
 import pytest
 from anyio import create_task_group
@@ -10,6 +11,7 @@ from pydantic import AnyUrl
 
 from fastmcp import FastMCP
 from fastmcp.client import Client
+from fastmcp.client.client import CallToolResult
 from fastmcp.client.transports import FastMCPTransport, StreamableHttpTransport
 from fastmcp.exceptions import ToolError
 from fastmcp.server.proxy import FastMCPProxy, ProxyClient
@@ -250,6 +252,48 @@ class TestTools:
             tools = await client.list_tools()
             assert not any(t.name == "greet" for t in tools)
 
+    async def test_batched_calls_are_forwarded_together(self):
+        server = FastMCP("BatchServer")
+        batches = []
+
+        def double_many(calls: list[dict[str, Any]]) -> list[int]:
+            batches.append(len(calls))
+            return [call["x"] * 2 for call in calls]
+
+        @server.tool(batch_fn=double_many, batch_window=0.1)
+        def double(x: int) -> int:
+            return x * 2
+
+        proxy = FastMCP.as_proxy(ProxyClient(transport=FastMCPTransport(server)))
+        async with Client(proxy) as client:
+            await client.list_tools()
+            results = await client.call_tool_batch(
+                "double", [{"x": x} for x in range(4)]
+            )
+
+        assert [result.data for result in results] == [0, 2, 4, 6]
+        assert batches == [4]
+
+    async def test_batched_error_without_content(self):
+        server = FastMCP("BatchServer")
+
+        @server.tool(batch_fn=lambda calls: [0 for _ in calls])
+        def double(x: int) -> int:
+            return x * 2
+
+        async def failed_batch(self, name, arguments, **kwargs):
+            return [
+                CallToolResult(content=[], structured_content=None, is_error=True)
+                for _ in arguments
+            ]
+
+        proxy = FastMCP.as_proxy(ProxyClient(transport=FastMCPTransport(server)))
+        async with Client(proxy) as client:
+            await client.list_tools()
+            with patch.object(Client, "call_tool_batch", failed_batch):
+                with pytest.raises(ToolError, match="Error calling tool 'double'"):
+                    await client.call_tool("double", {"x": 1})
+
 
 class TestResources:
     async def test_get_resources(self, proxy_server):
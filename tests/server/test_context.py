@@ -1,7 +1,11 @@
+import threading
+import time
 import warnings
 from unittest.mock import MagicMock, patch
 
+import anyio
 import pytest
+from mcp import McpError
 from mcp.types import ModelPreferences
 from starlette.requests import Request
 
@@ -177,3 +181,55 @@ class TestContextState:
 
             assert context1.get_state("key1") == "key1-context1"
             assert context1.get_state("key-context3-only") is None
+
+
+class TestContextCancellation:
+    async def test_sync_tool_sees_client_cancellation(self):
+        from fastmcp import Client
+
+        mcp = FastMCP()
+        request_ids: list[str | int] = []
+        started = threading.Event()
+        stopped = threading.Event()
+
+        @mcp.tool(executor="thread")
+        def wait_for_cancel(ctx: Context) -> str:
+            request_ids.append(ctx.request_context.request_id)
+            started.set()
+            while not ctx.is_cancelled():
+                time.sleep(0.01)
+            stopped.set()
+            return "cancelled"
+
+        async with Client(mcp) as client:
+
+            async def call() -> None:
+                with pytest.raises(McpError, match="Request cancelled"):
+                    await client.call_tool_mcp("wait_for_cancel", {})
+
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(call)
+                assert await anyio.to_thread.run_sync(started.wait, 2)
+                await client.cancel(request_ids[0])
+            assert await anyio.to_thread.run_sync(stopped.wait, 2)
+
+    async def test_sync_tool_sees_timeout(self):
+        from fastmcp import Client
+
+        mcp = FastMCP()
+        stopped = threading.Event()
+
+        @mcp.tool(timeout=0.1, executor="thread")
+        def wait_for_cancel(ctx: Context) -> None:
+            while not ctx.is_cancelled():
+                time.sleep(0.01)
+            stopped.set()
+
+        async with Client(mcp) as client:
+            result = await client.call_tool("wait_for_cancel", {}, raise_on_error=False)
+            assert result.is_error
+            assert await anyio.to_thread.run_sync(stopped.wait, 2)
+
+    async def test_not_cancelled_by_default(self):
+        async with Context(fastmcp=MagicMock()) as context:
+            assert not context.is_cancelled()
@@ -2,15 +2,17 @@ import json
 import sys
 from contextlib import asynccontextmanager
 
+import anyio
 import pytest
 
 from fastmcp import FastMCP
 from fastmcp.client import Client
 from fastmcp.client.transports import FastMCPTransport, SSETransport
+from fastmcp.server.middleware import Middleware
 from fastmcp.server.proxy import FastMCPProxy
 from fastmcp.tools.tool import Tool
 from fastmcp.tools.tool_transform import TransformedTool
-from fastmcp.utilities.tests import caplog_for_fastmcp
+from fastmcp.utilities.tests import caplog_for_fastmcp, temporary_settings
 
 
 class TestBasicMount:
@@ -264,6 +266,42 @@ class TestMultipleServerMount:
         assert "api_first_tool" in tools
         assert "api_second_tool" in tools
 
+    async def test_get_tool_mount_prefix(self):
+        """Test finding the mounted server that calls to a tool go to."""
+        main_app = FastMCP("MainApp")
+        weather_app = FastMCP("WeatherApp")
+        weather_forecast_app = FastMCP("WeatherForecastApp")
+        unprefixed_app = FastMCP("UnprefixedApp")
+
+        @main_app.tool
+        def weather_local() -> str:
+            return "Local"
+
+        @weather_app.tool
+        def get_forecast() -> str:
+            return "Weather forecast"
+
+        @weather_forecast_app.tool
+        def today() -> str:
+            return "Today's forecast"
+
+        @unprefixed_app.tool
+        def shared() -> str:
+            return "Shared"
+
+        main_app.mount(weather_app, "weather")
+        main_app.mount(weather_forecast_app, "weather_forecast")
+        main_app.mount(unprefixed_app)
+
+        assert await main_app.get_tool_mount_prefix("weather_get_forecast") == "weather"
+        assert (
+            await main_app.get_tool_mount_prefix("weather_forecast_today")
+            == "weather_forecast"
+        )
+        assert await main_app.get_tool_mount_prefix("weather_local") is None
+        assert await main_app.get_tool_mount_prefix("shared") is None
+        assert await main_app.get_tool_mount_prefix("weather_missing") is None
+
     @pytest.mark.skipif(
         sys.platform == "win32", reason="Windows asyncio networking timeouts."
     )
@@ -637,13 +675,194 @@ class TestDynamicChanges:
         assert "sub_temp_tool" in tools
 
         # Remove the tool from sub_app
-        sub_app._tool_manager._tools.pop("temp_tool")
+        sub_app.remove_tool("temp_tool")
 
         # The tool should no longer be accessible
         tools = await main_app.get_tools()
         assert "sub_temp_tool" not in tools
 
 
+class TestConcurrentMountLoading:
+    """Test that mounted servers are queried concurrently."""
+
+    async def test_mounts_are_loaded_concurrently(self):
+        """Each mount waits for the other, so this only finishes if they run at the same time."""
+        main_app = FastMCP("MainApp")
+        first_app = FastMCP("FirstApp")
+        second_app = FastMCP("SecondApp")
+        first_listed = anyio.Event()
+        second_listed = anyio.Event()
+
+        class WaitFor(Middleware):
+            def __init__(self, own: anyio.Event, other: anyio.Event):
+                self.own = own
+                self.other = other
+
+            async def on_list_tools(self, context, call_next):
+                self.own.set()
+                await self.other.wait()
+                return await call_next(context)
+
+        first_app.add_middleware(WaitFor(first_listed, second_listed))
+        second_app.add_middleware(WaitFor(second_listed, first_listed))
+
+        @first_app.tool
+        def first_tool() -> str:
+            return "first"
+
+        @second_app.tool
+        def second_tool() -> str:
+            return "second"
+
+        main_app.mount(first_app, "first")
+        main_app.mount(second_app, "second")
+
+        with anyio.fail_after(2):
+            async with Client(main_app) as client:
+                tools = await client.list_tools()
+
+        assert [tool.name for tool in tools] == [
+            "first_first_tool",
+            "second_second_tool",
+        ]
+
+    async def test_later_mount_wins_regardless_of_completion_order(self):
+        main_app = FastMCP("MainApp")
+        slow_app = FastMCP("SlowApp")
+        fast_app = FastMCP("FastApp")
+
+        class Slow(Middleware):
+            async def on_list_tools(self, context, call_next):
+                await anyio.sleep(0.1)
+                return await call_next(context)
+
+        slow_app.add_middleware(Slow())
+
+        @slow_app.tool
+        def shared() -> str:
+            return "slow"
+
+        @fast_app.tool(name="shared")
+        def fast_shared() -> str:
+            return "fast"
+
+        main_app.mount(fast_app, "api")
+        main_app.mount(slow_app, "api")
+
+        async with Client(main_app) as client:
+            tools = await client.list_tools()
+            assert [tool.name for tool in tools] == ["api_shared"]
+            result = await client.call_tool("api_shared", {})
+            assert result.data == "slow"
+
+    async def test_slow_mount_is_skipped_after_timeout(self, caplog):
+        main_app = FastMCP("MainApp")
+        slow_app = FastMCP("SlowApp")
+        fast_app = FastMCP("FastApp")
+
+        class Hang(Middleware):
+            async def on_list_tools(self, context, call_next):
+                await anyio.sleep_forever()
+
+        slow_app.add_middleware(Hang())
+
+        @slow_app.tool
+        def slow_tool() -> str:
+            return "slow"
+
+        @fast_app.tool
+        def fast_tool() -> str:
+            return "fast"
+
+        main_app.mount(slow_app, "slow")
+        main_app.mount(fast_app, "fast")
+
+        with temporary_settings(mounted_components_load_timeout=0.1):
+            with caplog_for_fastmcp(caplog):
+                async with Client(main_app) as client:
+                    tools = await client.list_tools()
+
+        assert [tool.name for tool in tools] == ["fast_fast_tool"]
+        assert "Timed out after 0.1s" in caplog.text
+
+    async def test_slow_mount_raises_when_configured(self):
+        main_app = FastMCP("MainApp")
+        slow_app = FastMCP("SlowApp")
+
+        class Hang(Middleware):
+            async def on_list_tools(self, context, call_next):
+                await anyio.sleep_forever()
+
+        slow_app.add_middleware(Hang())
+        main_app.mount(slow_app, "slow")
+        main_app.mount(FastMCP("OtherApp"), "other")
+
+        with temporary_settings(
+            mounted_components_load_timeout=0.1,
+            mounted_components_raise_on_load_error=True,
+        ):
+            with pytest.raises(TimeoutError):
+                await main_app._list_tools()
+
+
+class TestMountedToolRouting:
+    """Test that tool calls are routed directly to the mount that owns the tool."""
+
+    async def test_unrelated_mounts_are_not_called(self):
+        main_app = FastMCP("MainApp")
+        other_app = FastMCP("OtherApp")
+        target_app = FastMCP("TargetApp")
+        calls: list[str] = []
+
+        class RecordCalls(Middleware):
+            async def on_call_tool(self, context, call_next):
+                calls.append(context.message.name)
+                return await call_next(context)
+
+        other_app.add_middleware(RecordCalls())
+
+        @other_app.tool
+        def other_tool() -> str:
+            return "other"
+
+        @target_app.tool
+        def target_tool() -> str:
+            return "target"
+
+        # Both mounts share the prefix; the later mount is tried first
+        main_app.mount(target_app, "api")
+        main_app.mount(other_app, "api")
+
+        async with Client(main_app) as client:
+            result = await client.call_tool("api_target_tool", {})
+            assert result.data == "target"
+            assert calls == []
+
+            result = await client.call_tool("api_other_tool", {})
+            assert result.data == "other"
+            assert calls == ["other_tool"]
+
+    async def test_filtered_tool_falls_back_to_earlier_mount(self):
+        main_app = FastMCP("MainApp")
+        first_app = FastMCP("FirstApp")
+        second_app = FastMCP("SecondApp", exclude_tags={"hidden"})
+
+        @first_app.tool
+        def shared() -> str:
+            return "first"
+
+        @second_app.tool(name="shared", tags={"hidden"})
+        def shared_hidden() -> str:
+            return "second"
+
+        main_app.mount(first_app, "api")
+        main_app.mount(second_app, "api")
+
+        async with Client(main_app) as client:
+            result = await client.call_tool("api_shared", {})
+            assert result.data == "first"
+
+
 class TestResourcesAndTemplates:
     """Test mounting with resources and resource templates."""
 
@@ -1,6 +1,11 @@
+import datetime
 import logging
+import threading
+import time
 from typing import Annotated, Any
+from unittest.mock import patch
 
+import anyio
 import httpx
 import pytest
 from fastapi import FastAPI
@@ -8,8 +13,8 @@ from mcp import McpError
 from pydantic import Field
 from pytest import LogCaptureFixture
 
-from fastmcp import Client, FastMCP
-from fastmcp.exceptions import NotFoundError
+from fastmcp import Client, Context, FastMCP
+from fastmcp.exceptions import NotFoundError, ToolError
 from fastmcp.experimental.server.openapi import (
     FastMCPOpenAPI as ExperimentalFastMCPOpenAPI,
 )
@@ -1438,6 +1443,509 @@ class TestShouldIncludeComponent:
         assert result is True
 
 
+class TestListingTagFiltering:
+    async def test_listing_filters_match_per_component_rules(self):
+        """Tag filtering of listings agrees with _should_enable_component."""
+        from fastmcp.server.middleware import Middleware
+
+        class PassThrough(Middleware):
+            async def on_list_tools(self, context, call_next):
+                return await call_next(context)
+
+        child = FastMCP()
+        mcp = FastMCP(include_tags={"public"}, exclude_tags={"admin"})
+        # middleware keeps the listing out of the listing cache
+        mcp.add_middleware(PassThrough())
+        mcp.mount(child, prefix="child")
+
+        @mcp.tool(tags={"public"})
+        def visible() -> str:
+            return "visible"
+
+        @mcp.tool(tags={"public", "admin"})
+        def admin() -> str:
+            return "admin"
+
+        @mcp.tool
+        def untagged() -> str:
+            return "untagged"
+
+        @child.tool(tags={"public"})
+        def child_visible() -> str:
+            return "child"
+
+        @child.tool(tags={"public"}, enabled=False)
+        def child_disabled() -> str:
+            return "disabled"
+
+        tools = await mcp._list_tools()
+        assert {tool.key for tool in tools} == {"visible", "child_child_visible"}
+
+        visible.tags = {"public", "admin"}
+        tools = await mcp._list_tools()
+        assert {tool.key for tool in tools} == {"child_child_visible"}
+
+    async def test_in_place_tag_edits_are_filtered(self):
+        """Tags edited in place are seen by the next listing."""
+        from fastmcp.server.middleware import Middleware
+
+        class PassThrough(Middleware):
+            async def on_message(self, context, call_next):
+                return await call_next(context)
+
+        mcp = FastMCP(include_tags={"pub"})
+        mcp.add_middleware(PassThrough())
+
+        @mcp.tool(tags={"pub"})
+        def a() -> str:
+            return "a"
+
+        @mcp.tool
+        def b() -> str:
+            return "b"
+
+        assert [tool.name for tool in await mcp._list_tools()] == ["a"]
+
+        (await mcp.get_tool("b")).tags.add("pub")
+        assert [tool.name for tool in await mcp._list_tools()] == ["a", "b"]
+
+
+class TestListingCache:
+    """Test that converted list responses are cached and invalidated on change."""
+
+    async def test_tool_listing_is_cached(self):
+        mcp = FastMCP()
+
+        @mcp.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        first = await mcp._mcp_list_tools()
+        second = await mcp._mcp_list_tools()
+        assert first == second
+        assert first[0] is second[0]
+
+    async def test_adding_tool_to_mounted_server_invalidates(self):
+        mcp = FastMCP()
+        child = FastMCP()
+        mcp.mount(child, prefix="child")
+        assert await mcp._mcp_list_tools() == []
+
+        @child.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        assert [tool.name for tool in await mcp._mcp_list_tools()] == ["child_add"]
+
+    async def test_component_changes_invalidate(self):
+        mcp = FastMCP()
+
+        @mcp.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        @mcp.prompt
+        def greet() -> str:
+            return "Hello"
+
+        assert len(await mcp._mcp_list_tools()) == 1
+        add.disable()
+        assert await mcp._mcp_list_tools() == []
+        add.enabled = True
+        assert len(await mcp._mcp_list_tools()) == 1
+
+        add.description = "Adds numbers"
+        tools = await mcp._mcp_list_tools()
+        assert tools[0].description == "Adds numbers"
+
+        assert len(await mcp._mcp_list_prompts()) == 1
+        greet.disable()
+        assert await mcp._mcp_list_prompts() == []
+
+    async def test_in_place_tag_and_meta_edits_invalidate(self):
+        mcp = FastMCP(include_tags={"pub"})
+
+        @mcp.tool(tags={"pub"})
+        def a() -> str:
+            return "a"
+
+        @mcp.tool
+        def b() -> str:
+            return "b"
+
+        assert [tool.name for tool in await mcp._mcp_list_tools()] == ["a"]
+
+        (await mcp.get_tool("b")).tags.add("pub")
+        assert [tool.name for tool in await mcp._mcp_list_tools()] == ["a", "b"]
+
+        (await mcp.get_tool("a")).meta = {}
+        first = await mcp._mcp_list_tools()
+        assert await mcp._mcp_list_tools() == first
+        assert (await mcp._mcp_list_tools())[0] is first[0]
+
+        (await mcp.get_tool("a")).meta["version"] = 2  # type: ignore[index]
+        assert (await mcp._mcp_list_tools())[0].meta["version"] == 2  # type: ignore[index]
+
+    async def test_in_place_edits_of_mounted_components_invalidate(self):
+        mcp = FastMCP(exclude_tags={"hidden"})
+        child = FastMCP()
+        mcp.mount(child, prefix="child")
+
+        @child.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        assert [tool.name for tool in await mcp._mcp_list_tools()] == ["child_add"]
+        add.tags.add("hidden")
+        assert await mcp._mcp_list_tools() == []
+
+    async def test_filter_changes_invalidate(self):
+        mcp = FastMCP()
+
+        @mcp.tool(tags={"math"})
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        @mcp.resource("resource://data", tags={"data"})
+        def data() -> str:
+            return "data"
+
+        assert len(await mcp._mcp_list_tools()) == 1
+        assert len(await mcp._mcp_list_resources()) == 1
+
+        mcp.exclude_tags = {"math", "data"}
+        assert await mcp._mcp_list_tools() == []
+        assert await mcp._mcp_list_resources() == []
+
+    async def test_listing_with_middleware_is_not_cached(self):
+        from fastmcp.server.middleware import Middleware
+
+        mcp = FastMCP()
+        calls = 0
+
+        class CountLists(Middleware):
+            async def on_list_tools(self, context, call_next):
+                nonlocal calls
+                calls += 1
+                return await call_next(context)
+
+        @mcp.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        await mcp._mcp_list_tools()
+        mcp.add_middleware(CountLists())
+        await mcp._mcp_list_tools()
+        await mcp._mcp_list_tools()
+        assert calls == 2
+
+
+class TestListPagination:
+    def make_server(self, page_size: int | None) -> FastMCP:
+        mcp = FastMCP(list_page_size=page_size)
+        for i in range(5):
+            mcp.add_tool(Tool.from_function(lambda x: x, name=f"tool_{i}"))
+            mcp.add_prompt(Prompt.from_function(lambda: "hi", name=f"prompt_{i}"))
+            mcp.add_resource(
+                Resource.from_function(
+                    lambda: "data", uri=f"resource://r{i}", name=f"resource_{i}"
+                )
+            )
+            mcp.add_template(
+                ResourceTemplate.from_function(
+                    lambda x: x,
+                    uri_template=f"resource://t{i}/{{x}}",
+                    name=f"template_{i}",
+                )
+            )
+        return mcp
+
+    async def test_unpaginated_by_default(self):
+        mcp = self.make_server(page_size=None)
+        async with Client(mcp) as client:
+            result = await client.list_tools_mcp()
+        assert len(result.tools) == 5
+        assert result.nextCursor is None
+
+    async def test_page_size_from_settings(self):
+        with temporary_settings(list_page_size=3):
+            mcp = self.make_server(page_size=None)
+        assert mcp.list_page_size == 3
+
+    def test_invalid_page_size(self):
+        with pytest.raises(ValueError, match="list_page_size"):
+            FastMCP(list_page_size=0)
+
+    async def test_pages(self):
+        mcp = self.make_server(page_size=2)
+        async with Client(mcp) as client:
+            first = await client.list_tools_mcp()
+            assert [t.name for t in first.tools] == ["tool_0", "tool_1"]
+            assert first.nextCursor is not None
+
+            second = await client.list_tools_mcp(cursor=first.nextCursor)
+            assert [t.name for t in second.tools] == ["tool_2", "tool_3"]
+
+            third = await client.list_tools_mcp(cursor=second.nextCursor)
+            assert [t.name for t in third.tools] == ["tool_4"]
+            assert third.nextCursor is None
+
+    async def test_all_listings_paginated(self):
+        mcp = self.make_server(page_size=2)
+        async with Client(mcp) as client:
+            assert len((await client.list_prompts_mcp()).prompts) == 2
+            assert len((await client.list_resources_mcp()).resources) == 2
+            assert (
+                len((await client.list_resource_templates_mcp()).resourceTemplates) == 2
+            )
+
+            assert len(await client.list_tools()) == 5
+            assert len(await client.list_prompts()) == 5
+            assert len(await client.list_resources()) == 5
+            assert len(await client.list_resource_templates()) == 5
+
+    async def test_cursor_invalidated_by_changes(self):
+        mcp = self.make_server(page_size=2)
+        async with Client(mcp) as client:
+            first = await client.list_tools_mcp()
+            mcp.add_tool(Tool.from_function(lambda x: x, name="tool_new"))
+            with pytest.raises(McpError, match="listing has changed"):
+                await client.list_tools_mcp(cursor=first.nextCursor)
+
+    async def test_malformed_cursor(self):
+        mcp = self.make_server(page_size=2)
+        async with Client(mcp) as client:
+            with pytest.raises(McpError, match="Invalid cursor"):
+                await client.list_prompts_mcp(cursor="not-a-cursor")
+
+    async def test_call_tool_from_later_page(self):
+        """Tools past the first page can be called and have their output validated."""
+        mcp = FastMCP(list_page_size=1)
+
+        @mcp.tool
+        def first() -> int:
+            return 1
+
+        @mcp.tool
+        def second() -> int:
+            return 2
+
+        async with Client(mcp) as client:
+            assert len(await client.list_tools()) == 2
+            result = await client.call_tool("second", {})
+        assert result.data == 2
+
+
+class TestSyncExecutor:
+    async def test_sync_components_run_in_worker_threads(self):
+        mcp = FastMCP(sync_executor="thread")
+        main_thread = threading.get_ident()
+
+        @mcp.tool
+        def tool_thread() -> bool:
+            return threading.get_ident() != main_thread
+
+        @mcp.resource("resource://thread")
+        def resource_thread() -> str:
+            return str(threading.get_ident() != main_thread)
+
+        @mcp.resource("resource://{x}/thread")
+        def template_thread(x: str) -> str:
+            return str(threading.get_ident() != main_thread)
+
+        @mcp.prompt
+        def prompt_thread() -> str:
+            return str(threading.get_ident() != main_thread)
+
+        async with Client(mcp) as client:
+            assert (await client.call_tool("tool_thread")).data is True
+            resource = await client.read_resource("resource://thread")
+            assert resource[0].text == "True"  # type: ignore[attr-defined]
+            template = await client.read_resource("resource://a/thread")
+            assert template[0].text == "True"  # type: ignore[attr-defined]
+            prompt = await client.get_prompt("prompt_thread")
+            assert prompt.messages[0].content.text == "True"  # type: ignore[attr-defined]
+
+        assert mcp.worker_pool.stats().completed == 4
+
+    async def test_inline_by_default(self):
+        mcp = FastMCP()
+        main_thread = threading.get_ident()
+
+        @mcp.tool
+        def tool_inline() -> bool:
+            return threading.get_ident() == main_thread
+
+        @mcp.tool(executor="thread")
+        def tool_thread() -> bool:
+            return threading.get_ident() != main_thread
+
+        async with Client(mcp) as client:
+            assert (await client.call_tool("tool_inline")).data is True
+            assert (await client.call_tool("tool_thread")).data is True
+
+    async def test_inline_tool(self):
+        mcp = FastMCP(sync_executor="thread")
+        main_thread = threading.get_ident()
+
+        @mcp.tool(executor="inline")
+        def tool_inline() -> bool:
+            return threading.get_ident() == main_thread
+
+        async with Client(mcp) as client:
+            assert (await client.call_tool("tool_inline")).data is True
+        assert mcp.worker_pool.stats().completed == 0
+
+    async def test_context_available_in_worker_thread(self):
+        mcp = FastMCP(sync_executor="thread")
+
+        @mcp.tool
+        def tool_with_context(ctx: Context) -> str:
+            return ctx.fastmcp.name
+
+        async with Client(mcp) as client:
+            result = await client.call_tool("tool_with_context")
+        assert result.data == mcp.name
+
+    async def test_worker_threads_are_bounded(self):
+        mcp = FastMCP(sync_executor="thread", sync_worker_threads=1)
+        running = 0
+        max_running = 0
+        lock = threading.Lock()
+
+        @mcp.tool
+        def slow() -> None:
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+
+        async with Client(mcp) as client:
+            async with anyio.create_task_group() as tg:
+                for _ in range(3):
+                    tg.start_soon(client.call_tool, "slow")
+
+        assert max_running == 1
+        assert mcp.worker_pool.stats().completed == 3
+
+    def test_settings(self):
+        with temporary_settings(sync_executor="thread", sync_worker_threads=7):
+            mcp = FastMCP()
+        assert mcp.sync_executor == "thread"
+        assert mcp.worker_pool.max_workers == 7
+
+    def test_invalid_worker_threads(self):
+        with pytest.raises(ValueError, match="sync_worker_threads"):
+            FastMCP(sync_worker_threads=0)
+
+    def test_process_workers(self):
+        with temporary_settings(process_workers=3):
+            assert FastMCP().process_pool.max_workers == 3
+        assert FastMCP(process_workers=2).process_pool.max_workers == 2
+        with pytest.raises(ValueError, match="process_workers"):
+            FastMCP(process_workers=0)
+
+
+class TestStrictInputValidation:
+    async def test_schema_checked_in_both_modes(self):
+        for strict in (False, True):
+            mcp = FastMCP(strict_input_validation=strict)
+
+            @mcp.tool
+            def double(x: int, ctx: Context) -> int:
+                return x * 2
+
+            async with Client(mcp) as client:
+                assert (await client.call_tool("double", {"x": 2})).data == 4
+                with pytest.raises(
+                    ToolError,
+                    match="Input validation error: '2' is not of type 'integer'",
+                ):
+                    await client.call_tool("double", {"x": "2"})
+
+    async def test_lax_by_default(self):
+        mcp = FastMCP()
+
+        @mcp.tool
+        def double(x: int) -> int:
+            return x * 2
+
+        async with Client(mcp) as client:
+            assert (await client.call_tool("double", {"x": 2.0})).data == 4
+
+    async def test_strict_rejects_conversions(self):
+        mcp = FastMCP(strict_input_validation=True)
+
+        @mcp.tool
+        def double(x: int) -> int:
+            return x * 2
+
+        async with Client(mcp) as client:
+            with pytest.raises(ToolError, match="valid integer"):
+                await client.call_tool("double", {"x": 2.0})
+
+    async def test_strict_accepts_json_representations(self):
+        mcp = FastMCP(strict_input_validation=True)
+
+        @mcp.tool
+        def describe(when: datetime.date, pair: tuple[int, int]) -> str:
+            return f"{when.year} {pair[0] + pair[1]}"
+
+        async with Client(mcp) as client:
+            result = await client.call_tool(
+                "describe", {"when": "2024-01-02", "pair": [1, 2]}
+            )
+        assert result.data == "2024 3"
+
+    async def test_validator_compiled_once(self):
+        mcp = FastMCP()
+
+        @mcp.tool
+        def double(x: int) -> int:
+            return x * 2
+
+        async with Client(mcp) as client:
+            await client.call_tool("double", {"x": 1})
+            validator = double._input_validator
+            await client.call_tool("double", {"x": 2})
+        assert validator is not None
+        assert double._input_validator is validator
+
+    async def test_disabled_tool_is_not_validated(self):
+        mcp = FastMCP()
+
+        @mcp.tool(enabled=False)
+        def double(x: int) -> int:
+            return x * 2
+
+        async with Client(mcp) as client:
+            with pytest.raises(ToolError, match="Unknown tool"):
+                await client.call_tool("double", {"x": "2"})
+
+    async def test_tools_are_fetched_once_per_call(self):
+        mcp = FastMCP()
+
+        @mcp.tool
+        def double(x: int) -> int:
+            return x * 2
+
+        async with Client(mcp) as client:
+            with patch.object(
+                mcp._tool_manager, "get_tool", wraps=mcp._tool_manager.get_tool
+            ) as get_tool:
+                await client.call_tool("double", {"x": 1})
+        assert get_tool.call_count == 2
+
+    def test_settings(self):
+        with temporary_settings(strict_input_validation=True):
+            assert FastMCP().strict_input_validation is True
+        assert FastMCP().strict_input_validation is False
+        assert FastMCP(strict_input_validation=True).strict_input_validation is True
+
+
 class TestOpenAPIExperimentalFeatureFlag:
     """Test experimental OpenAPI parser feature flag behavior."""
 
@@ -1,7 +1,11 @@
 import json
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from typing import Annotated, Any
+from unittest.mock import patch
 
+import anyio
+import pydantic_core
 import pytest
 from dirty_equals import HasName
 from inline_snapshot import snapshot
@@ -12,13 +16,19 @@ from mcp.types import (
     TextContent,
     TextResourceContents,
 )
-from pydantic import AnyUrl, BaseModel, Field, TypeAdapter
+from pydantic import AnyUrl, BaseModel, Field, TypeAdapter, ValidationError
 from typing_extensions import TypedDict
 
-from fastmcp.tools.tool import Tool, ToolResult, _convert_to_content
+from fastmcp.tools.tool import (
+    Tool,
+    ToolResult,
+    _convert_to_content,
+    default_serializer,
+)
+from fastmcp.tools.tool_transform import forward
 from fastmcp.utilities.json_schema import compress_schema
-from fastmcp.utilities.tests import caplog_for_fastmcp
-from fastmcp.utilities.types import Audio, File, Image
+from fastmcp.utilities.tests import caplog_for_fastmcp, temporary_settings
+from fastmcp.utilities.types import Audio, File, Image, NotSet
 
 
 class TestToolFromFunction:
@@ -1459,6 +1469,354 @@ class TestAutomaticStructuredContent:
             assert result.data.verified is True
 
 
+class TestSinglePassSerialization:
+    """Results are converted to JSON-compatible data once per call."""
+
+    @pytest.mark.parametrize("output_schema", [NotSet, None])
+    async def test_dict_result_is_serialized_once(self, output_schema):
+        def get_data() -> dict[str, Any]:
+            return {"items": list(range(3)), "name": "data"}
+
+        tool = Tool.from_function(get_data, output_schema=output_schema)
+        with (
+            patch(
+                "fastmcp.tools.tool.pydantic_core.to_jsonable_python",
+                wraps=pydantic_core.to_jsonable_python,
+            ) as to_jsonable_python,
+            patch("fastmcp.tools.tool.default_serializer") as default_serializer,
+        ):
+            result = await tool.run({})
+
+        assert to_jsonable_python.call_count == 1
+        default_serializer.assert_not_called()
+        assert result.structured_content == {"items": [0, 1, 2], "name": "data"}
+        assert result.content == [
+            TextContent(type="text", text='{"items":[0,1,2],"name":"data"}')
+        ]
+
+    async def test_wrapped_result_is_serialized_once(self):
+        def get_numbers() -> list[int]:
+            return [1, 2, 3]
+
+        tool = Tool.from_function(get_numbers)
+        with patch(
+            "fastmcp.tools.tool.pydantic_core.to_jsonable_python",
+            wraps=pydantic_core.to_jsonable_python,
+        ) as to_jsonable_python:
+            result = await tool.run({})
+
+        assert to_jsonable_python.call_count == 1
+        assert result.structured_content == {"result": [1, 2, 3]}
+        assert result.content == [TextContent(type="text", text="[1,2,3]")]
+
+    @pytest.mark.parametrize("empty", [[], ()])
+    async def test_empty_sequence_has_no_content(self, empty):
+        def get_items() -> Any:
+            return empty
+
+        tool = Tool.from_function(get_items, output_schema=None)
+        result = await tool.run({})
+        assert result.content == []
+
+        def get_numbers() -> list[int]:
+            return list(empty)
+
+        result = await Tool.from_function(get_numbers).run({})
+        assert result.content == []
+        assert result.structured_content == {"result": []}
+
+    async def test_transformed_tool_result_is_serialized_once(self):
+        def get_data() -> dict[str, Any]:
+            return {"name": "data"}
+
+        async def transform_fn() -> dict[str, Any]:
+            return await forward()
+
+        tool = Tool.from_tool(Tool.from_function(get_data), transform_fn=transform_fn)
+        with patch(
+            "fastmcp.tools.tool.pydantic_core.to_jsonable_python",
+            wraps=pydantic_core.to_jsonable_python,
+        ) as to_jsonable_python:
+            result = await tool.run({})
+
+        assert to_jsonable_python.call_count == 1
+        assert result.structured_content == {"name": "data"}
+
+    async def test_text_matches_default_serializer(self):
+        @dataclass
+        class Point:
+            x: float
+            y: float
+
+        def get_values() -> Any:
+            return {
+                "point": Point(1.5, 2.0),
+                "tuple": (1, 2),
+                "bytes": b"abc",
+                1: "int key",
+            }
+
+        tool = Tool.from_function(get_values)
+        result = await tool.run({})
+        assert result.content == [
+            TextContent(type="text", text=default_serializer(get_values()))
+        ]
+
+    async def test_unserializable_result_falls_back_to_text(self):
+        class Opaque:
+            def __str__(self) -> str:
+                return "opaque"
+
+        def get_opaque() -> Any:
+            return {"value": Opaque()}
+
+        tool = Tool.from_function(get_opaque, output_schema=None)
+        result = await tool.run({})
+        assert result.structured_content is None
+        assert result.content == [TextContent(type="text", text='{"value":"opaque"}')]
+
+    async def test_custom_serializer_is_used_for_text(self):
+        def get_data() -> dict[str, Any]:
+            return {"name": "data"}
+
+        tool = Tool.from_function(get_data, serializer=lambda data: "custom")
+        result = await tool.run({})
+        assert result.content == [TextContent(type="text", text="custom")]
+        assert result.structured_content == {"name": "data"}
+
+
+class TestStreamingTools:
+    """Tools that are async generators stream their content blocks."""
+
+    async def test_yielded_content_is_collected(self):
+        async def stream(count: int):
+            for i in range(count):
+                yield f"chunk {i}"
+            yield Image(data=b"fake", format="png")
+            yield {"done": True}
+
+        tool = Tool.from_function(stream)
+        result = await tool.run({"count": 2})
+
+        assert result.content == [
+            TextContent(type="text", text="chunk 0"),
+            TextContent(type="text", text="chunk 1"),
+            ImageContent(type="image", data="ZmFrZQ==", mimeType="image/png"),
+            TextContent(type="text", text='{"done":true}'),
+        ]
+        assert result.structured_content is None
+
+    def test_no_output_schema(self):
+        async def stream() -> AsyncIterator[str]:
+            yield "chunk"
+
+        tool = Tool.from_function(stream)
+        assert tool.output_schema is None
+        assert tool._get_call_plan().is_async_generator is True
+
+    async def test_memory_cap(self):
+        async def stream():
+            for i in range(5):
+                yield f"chunk {i}"
+
+        tool = Tool.from_function(stream)
+        with temporary_settings(tool_stream_max_bytes=16):
+            result = await tool.run({})
+
+        assert result.content == [
+            TextContent(type="text", text="chunk 0"),
+            TextContent(type="text", text="chunk 1"),
+            TextContent(
+                type="text",
+                text="[3 more content blocks were omitted because the result "
+                "exceeded 16 bytes]",
+            ),
+        ]
+
+    async def test_generator_is_closed_on_error(self):
+        closed = False
+
+        async def stream():
+            nonlocal closed
+            try:
+                yield "chunk"
+                raise ValueError("boom")
+            finally:
+                closed = True
+
+        tool = Tool.from_function(stream)
+        with pytest.raises(ValueError, match="boom"):
+            await tool.run({})
+        assert closed
+
+
+class TestBatchTools:
+    """Concurrent calls to tools with a batch function are run as one batch."""
+
+    async def test_concurrent_calls_are_batched(self):
+        batches = []
+
+        def square(x: int) -> int:
+            raise AssertionError("the batch function should be called instead")
+
+        def square_many(calls: list[dict[str, Any]]) -> list[int]:
+            batches.append(calls)
+            return [call["x"] ** 2 for call in calls]
+
+        tool = Tool.from_function(square, batch_fn=square_many, batch_window=0.05)
+        results: dict[int, Any] = {}
+
+        async def call(x: int) -> None:
+            results[x] = (await tool.run({"x": x})).structured_content
+
+        async with anyio.create_task_group() as tg:
+            for x in range(4):
+                tg.start_soon(call, x)
+
+        assert batches == [[{"x": 0}, {"x": 1}, {"x": 2}, {"x": 3}]]
+        assert results == {x: {"result": x**2} for x in range(4)}
+
+    async def test_single_call(self):
+        def double(x: int) -> int:
+            return x * 2
+
+        async def double_many(calls: list[dict[str, Any]]) -> list[int]:
+            return [call["x"] * 2 for call in calls]
+
+        tool = Tool.from_function(double, batch_fn=double_many)
+        result = await tool.run({"x": "2"})
+        assert result.structured_content == {"result": 4}
+
+    async def test_max_batch_size(self):
+        sizes = []
+
+        def echo(x: int) -> int:
+            return x
+
+        def echo_many(calls: list[dict[str, Any]]) -> list[int]:
+            sizes.append(len(calls))
+            return [call["x"] for call in calls]
+
+        tool = Tool.from_function(
+            echo, batch_fn=echo_many, max_batch_size=2, batch_window=0.05
+        )
+        async with anyio.create_task_group() as tg:
+            for x in range(5):
+                tg.start_soon(tool.run, {"x": x})
+
+        assert sizes == [2, 2, 1]
+
+    async def test_invalid_arguments_fail_only_their_call(self):
+        batches = []
+
+        def echo(x: int) -> int:
+            return x
+
+        def echo_many(calls: list[dict[str, Any]]) -> list[int]:
+            batches.append(calls)
+            return [call["x"] for call in calls]
+
+        tool = Tool.from_function(echo, batch_fn=echo_many, batch_window=0.05)
+
+        async def invalid_call() -> None:
+            with pytest.raises(ValidationError):
+                await tool.run({"x": "not a number"})
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(tool.run, {"x": 1})
+            tg.start_soon(invalid_call)
+
+        assert batches == [[{"x": 1}]]
+
+    async def test_errors(self):
+        def check(x: int) -> int:
+            return x
+
+        def check_many(calls: list[dict[str, Any]]) -> list[Any]:
+            if len(calls) == 3:
+                raise RuntimeError("batch failed")
+            return [
+                ValueError(f"bad {call['x']}") if call["x"] < 0 else call["x"]
+                for call in calls
+            ]
+
+        tool = Tool.from_function(check, batch_fn=check_many, batch_window=0.05)
+
+        async def expect_error(x: int, match: str) -> None:
+            with pytest.raises(Exception, match=match):
+                await tool.run({"x": x})
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(tool.run, {"x": 1})
+            tg.start_soon(expect_error, -1, "bad -1")
+
+        async with anyio.create_task_group() as tg:
+            for x in range(3):
+                tg.start_soon(expect_error, x, "batch failed")
+
+    async def test_wrong_number_of_results(self):
+        def echo(x: int) -> int:
+            return x
+
+        def echo_many(calls: list[dict[str, Any]]) -> list[int]:
+            return []
+
+        tool = Tool.from_function(echo, batch_fn=echo_many)
+        with pytest.raises(ValueError, match="returned 0 results for 1 calls"):
+            await tool.run({"x": 1})
+
+    async def test_cancelled_first_call_still_runs_batch(self):
+        def echo(x: int) -> int:
+            return x
+
+        def echo_many(calls: list[dict[str, Any]]) -> list[int]:
+            return [call["x"] for call in calls]
+
+        tool = Tool.from_function(echo, batch_fn=echo_many, batch_window=0.05)
+        results = []
+
+        async def first_call(scope: anyio.CancelScope) -> None:
+            with scope:
+                await tool.run({"x": 1})
+
+        async def second_call() -> None:
+            results.append(await tool.run({"x": 2}))
+
+        scope = anyio.CancelScope()
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(first_call, scope)
+            tg.start_soon(second_call)
+            await anyio.sleep(0.01)
+            scope.cancel()
+
+        assert results[0].structured_content == {"result": 2}
+
+    def test_batch_function_signature(self):
+        def echo(x: int) -> int:
+            return x
+
+        def no_parameters() -> list[int]:
+            return []
+
+        with pytest.raises(ValueError, match="exactly one parameter"):
+            Tool.from_function(echo, batch_fn=no_parameters)
+
+    def test_streaming_tools_cant_batch(self):
+        async def stream():
+            yield "chunk"
+
+        with pytest.raises(ValueError, match="Streaming tools"):
+            Tool.from_function(stream, batch_fn=lambda calls: [])
+
+    def test_batch_advertised_in_meta(self):
+        def echo(x: int) -> int:
+            return x
+
+        tool = Tool.from_function(echo, batch_fn=lambda calls: calls)
+        assert tool.to_mcp_tool().meta == {"_fastmcp": {"tags": [], "batch": True}}
+        assert Tool.from_function(echo).to_mcp_tool().meta == {"_fastmcp": {"tags": []}}
+
+
 class TestUnionReturnTypes:
     """Tests for tools with union return types."""
 
@@ -1,17 +1,20 @@
 import json
 import logging
+import time
 import uuid
 from typing import Annotated, Any
 
+import anyio
 import pydantic_core
 import pytest
 from mcp.types import ImageContent
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
-from fastmcp import Context, FastMCP
+from fastmcp import Client, Context, FastMCP
 from fastmcp.exceptions import NotFoundError, ToolError
 from fastmcp.tools import FunctionTool, ToolManager
 from fastmcp.tools.tool import Tool
+from fastmcp.tools.tool_limits import ToolCallStats
 from fastmcp.tools.tool_transform import ArgTransformConfig, ToolTransformConfig
 from fastmcp.utilities.tests import caplog_for_fastmcp, temporary_settings
 from fastmcp.utilities.types import Image
@@ -1037,3 +1040,493 @@ class TestMountedComponentsRaiseOnLoadError:
                 AttributeError, match="'str' object has no attribute 'server'"
             ):
                 await parent_mcp._tool_manager.list_tools()
+
+
+class TestInventoryCache:
+    """Test that the merged tool inventory is cached and invalidated on change."""
+
+    async def test_inventory_is_cached(self):
+        parent_mcp = FastMCP("ParentServer")
+        child_mcp = FastMCP("ChildServer")
+
+        @child_mcp.tool
+        def child_tool() -> str:
+            return "child"
+
+        parent_mcp.mount(child_mcp, prefix="child")
+
+        first = await parent_mcp._tool_manager._get_inventory()
+        second = await parent_mcp._tool_manager._get_inventory()
+        assert first is second
+        assert "child_child_tool" in first
+
+    async def test_get_tools_returns_copy(self):
+        mcp = FastMCP()
+
+        @mcp.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        tools = await mcp.get_tools()
+        tools.pop("add")
+        assert "add" in await mcp.get_tools()
+
+    async def test_add_tool_in_mounted_server_invalidates(self):
+        parent_mcp = FastMCP("ParentServer")
+        child_mcp = FastMCP("ChildServer")
+        grandchild_mcp = FastMCP("GrandchildServer")
+        child_mcp.mount(grandchild_mcp, prefix="grandchild")
+        parent_mcp.mount(child_mcp, prefix="child")
+
+        assert await parent_mcp.get_tools() == {}
+
+        @grandchild_mcp.tool
+        def deep_tool() -> str:
+            return "deep"
+
+        tools = await parent_mcp.get_tools()
+        assert "child_grandchild_deep_tool" in tools
+
+        grandchild_mcp.remove_tool("deep_tool")
+        assert await parent_mcp.get_tools() == {}
+
+    async def test_mount_invalidates(self):
+        parent_mcp = FastMCP("ParentServer")
+        child_mcp = FastMCP("ChildServer")
+
+        @child_mcp.tool
+        def child_tool() -> str:
+            return "child"
+
+        assert await parent_mcp.get_tools() == {}
+        parent_mcp.mount(child_mcp, prefix="child")
+        assert "child_child_tool" in await parent_mcp.get_tools()
+
+    async def test_transformation_invalidates(self):
+        mcp = FastMCP()
+
+        @mcp.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        assert "add" in await mcp.get_tools()
+
+        mcp.add_tool_transformation("add", ToolTransformConfig(name="plus"))
+        tools = await mcp.get_tools()
+        assert "plus" in tools
+        assert "add" not in tools
+
+        mcp.remove_tool_transformation("add")
+        tools = await mcp.get_tools()
+        assert "add" in tools
+        assert "plus" not in tools
+
+    async def test_disable_in_mounted_server_invalidates(self):
+        parent_mcp = FastMCP("ParentServer")
+        child_mcp = FastMCP("ChildServer")
+
+        @child_mcp.tool
+        def child_tool() -> str:
+            return "child"
+
+        parent_mcp.mount(child_mcp, prefix="child")
+
+        tool = await parent_mcp.get_tool("child_child_tool")
+        assert tool.enabled
+
+        child_tool.disable()
+        tool = await parent_mcp.get_tool("child_child_tool")
+        assert not tool.enabled
+
+        child_tool.enable()
+        tool = await parent_mcp.get_tool("child_child_tool")
+        assert tool.enabled
+
+    async def test_non_listing_field_keeps_cache(self):
+        mcp = FastMCP()
+
+        @mcp.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        first = await mcp._tool_manager._get_inventory()
+        add.timeout = 5
+        assert await mcp._tool_manager._get_inventory() is first
+
+        add.description = "Adds numbers"
+        assert await mcp._tool_manager._get_inventory() is not first
+
+    async def test_changes_are_scoped_to_the_owning_server(self):
+        mcp = FastMCP()
+        other_mcp = FastMCP()
+
+        @mcp.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        @other_mcp.tool
+        def subtract(a: int, b: int) -> int:
+            return a - b
+
+        other_inventory = await other_mcp._tool_manager._get_inventory()
+        add.disable()
+        assert await other_mcp._tool_manager._get_inventory() is other_inventory
+
+
+class TestToolCallLimits:
+    async def test_max_concurrency(self):
+        running = 0
+        max_running = 0
+
+        async def slow() -> None:
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await anyio.sleep(0.02)
+            running -= 1
+
+        manager = ToolManager()
+        manager.add_tool(Tool.from_function(slow, max_concurrency=2))
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(5):
+                tg.start_soon(manager.call_tool, "slow", {})
+
+        assert max_running == 2
+        assert manager.get_call_stats() == {
+            "slow": ToolCallStats(
+                in_flight=0, queued=0, completed=5, timed_out=0, queue_timed_out=0
+            )
+        }
+
+    async def test_queued_calls_run_in_order(self):
+        order = []
+        release = anyio.Event()
+
+        async def ordered(i: int) -> None:
+            order.append(i)
+            await release.wait()
+
+        manager = ToolManager()
+        manager.add_tool(Tool.from_function(ordered, max_concurrency=1))
+
+        async with anyio.create_task_group() as tg:
+            for i in range(4):
+                tg.start_soon(manager.call_tool, "ordered", {"i": i})
+                await anyio.sleep(0)
+            with anyio.fail_after(1):
+                while manager.get_call_stats()["ordered"].queued < 3:
+                    await anyio.sleep(0.01)
+            assert manager.get_call_stats()["ordered"].in_flight == 1
+            release.set()
+
+        assert order == [0, 1, 2, 3]
+
+    async def test_timeout(self):
+        async def hang() -> None:
+            await anyio.sleep(10)
+
+        manager = ToolManager()
+        manager.add_tool(Tool.from_function(hang, timeout=0.05))
+
+        with pytest.raises(ToolError, match="timed out after 0.05 seconds"):
+            await manager.call_tool("hang", {})
+        assert manager.get_call_stats()["hang"].timed_out == 1
+
+    async def test_timeout_of_sync_tool(self):
+        def block() -> None:
+            time.sleep(0.5)
+
+        manager = ToolManager()
+        manager.add_tool(Tool.from_function(block, timeout=0.05, executor="thread"))
+
+        with anyio.fail_after(0.4):
+            with pytest.raises(ToolError, match="timed out"):
+                await manager.call_tool("block", {})
+
+    async def test_queue_timeout(self):
+        release = anyio.Event()
+
+        async def busy() -> None:
+            await release.wait()
+
+        manager = ToolManager()
+        manager.add_tool(Tool.from_function(busy, max_concurrency=1, queue_timeout=0))
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(manager.call_tool, "busy", {})
+            await anyio.sleep(0.01)
+            with pytest.raises(ToolError, match="is busy"):
+                await manager.call_tool("busy", {})
+            release.set()
+
+        assert manager.get_call_stats()["busy"] == ToolCallStats(
+            in_flight=0, queued=0, completed=1, timed_out=0, queue_timed_out=1
+        )
+
+    async def test_tools_without_limits_are_not_tracked(self):
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        manager = ToolManager()
+        manager.add_tool(Tool.from_function(add))
+        assert (await manager.call_tool("add", {"a": 1, "b": 2})).structured_content
+        assert manager.get_call_stats() == {}
+
+    async def test_changed_limits_replace_limiter(self):
+        async def tool() -> None:
+            pass
+
+        manager = ToolManager()
+        limited = Tool.from_function(tool, max_concurrency=1)
+        manager.add_tool(limited)
+        await manager.call_tool("tool", {})
+        limiter = manager._limiters["tool"]
+
+        limited.max_concurrency = 2
+        await manager.call_tool("tool", {})
+        assert manager._limiters["tool"] is not limiter
+        assert manager._limiters["tool"].max_concurrency == 2
+
+        limited.max_concurrency = None
+        await manager.call_tool("tool", {})
+        assert "tool" not in manager._limiters
+
+    async def test_decorator_and_server_stats(self):
+        mcp = FastMCP()
+
+        @mcp.tool(max_concurrency=2, timeout=5)
+        def limited() -> str:
+            return "ok"
+
+        assert limited.max_concurrency == 2
+        assert limited.timeout == 5
+
+        async with Client(mcp) as client:
+            await client.call_tool("limited")
+        assert mcp.get_tool_call_stats()["limited"].completed == 1
+
+    def test_invalid_limits(self):
+        def tool() -> None:
+            pass
+
+        with pytest.raises(ValidationError):
+            Tool.from_function(tool, max_concurrency=0)
+        with pytest.raises(ValidationError):
+            Tool.from_function(tool, timeout=-1)
+
+
+class TestToolResultCache:
+    async def test_caches_by_arguments(self):
+        calls = []
+
+        def square(x: int, label: str = "") -> int:
+            calls.append(x)
+            return x * x
+
+        manager = ToolManager()
+        manager.add_tool(Tool.from_function(square, cache_ttl=60))
+
+        first = await manager.call_tool("square", {"x": 3, "label": "a"})
+        second = await manager.call_tool("square", {"label": "a", "x": 3})
+        await manager.call_tool("square", {"x": 4, "label": "a"})
+
+        assert first.structured_content == second.structured_content == {"result": 9}
+        assert calls == [3, 4]
+        stats = manager.get_cache_stats()
+        assert (stats.entries, stats.hits, stats.misses) == (2, 1, 2)
+
+    async def test_tools_without_ttl_are_not_cached(self):
+        calls = 0
+
+        def count() -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+        manager = ToolManager()
+        manager.add_tool(Tool.from_function(count))
+        await manager.call_tool("count", {})
+        await manager.call_tool("count", {})
+        assert calls == 2
+        assert manager.get_cache_stats().entries == 0
+
+    async def test_results_expire(self):
+        calls = 0
+
+        def count() -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+        manager = ToolManager()
+        manager.add_tool(Tool.from_function(count, cache_ttl=0.05))
+        await manager.call_tool("count", {})
+        await manager.call_tool("count", {})
+        assert calls == 1
+        await anyio.sleep(0.06)
+        await manager.call_tool("count", {})
+        assert calls == 2
+
+    async def test_errors_are_not_cached(self):
+        calls = 0
+
+        def flaky() -> int:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise ValueError("first call fails")
+            return calls
+
+        manager = ToolManager()
+        manager.add_tool(Tool.from_function(flaky, cache_ttl=60))
+        with pytest.raises(ToolError):
+            await manager.call_tool("flaky", {})
+        assert (await manager.call_tool("flaky", {})).structured_content == {
+            "result": 2
+        }
+
+    async def test_identical_calls_in_flight_run_once(self):
+        calls = 0
+        release = anyio.Event()
+        results = []
+
+        async def slow(x: int) -> int:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return x
+
+        manager = ToolManager()
+        manager.add_tool(Tool.from_function(slow, cache_ttl=60))
+
+        async def call() -> None:
+            results.append(await manager.call_tool("slow", {"x": 1}))
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(3):
+                tg.start_soon(call)
+            await anyio.sleep(0.01)
+            release.set()
+
+        assert calls == 1
+        assert [r.structured_content for r in results] == [{"result": 1}] * 3
+
+    async def test_waiters_retry_when_call_is_cancelled(self):
+        calls = 0
+
+        async def slow() -> int:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await anyio.sleep(10)
+            return calls
+
+        manager = ToolManager()
+        manager.add_tool(Tool.from_function(slow, cache_ttl=60))
+        results = []
+
+        async def first_call(scope: anyio.CancelScope) -> None:
+            with scope:
+                await manager.call_tool("slow", {})
+
+        async def waiting_call() -> None:
+            results.append(await manager.call_tool("slow", {}))
+
+        scope = anyio.CancelScope()
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(first_call, scope)
+            await anyio.sleep(0.01)
+            tg.start_soon(waiting_call)
+            await anyio.sleep(0.01)
+            scope.cancel()
+
+        assert calls == 2
+        assert results[0].structured_content == {"result": 2}
+
+    async def test_lru_eviction_by_entries(self):
+        manager = ToolManager()
+        manager._result_cache.max_entries = 2
+
+        def echo(x: int) -> int:
+            return x
+
+        manager.add_tool(Tool.from_function(echo, cache_ttl=60))
+        await manager.call_tool("echo", {"x": 1})
+        await manager.call_tool("echo", {"x": 2})
+        await manager.call_tool("echo", {"x": 1})
+        await manager.call_tool("echo", {"x": 3})
+
+        stats = manager.get_cache_stats()
+        assert (stats.entries, stats.evictions) == (2, 1)
+        await manager.call_tool("echo", {"x": 1})
+        assert manager.get_cache_stats().hits == 2
+
+    async def test_byte_bound(self):
+        manager = ToolManager()
+        manager._result_cache.max_bytes = 100
+
+        def text(n: int) -> str:
+            return "x" * n
+
+        manager.add_tool(Tool.from_function(text, cache_ttl=60))
+        await manager.call_tool("text", {"n": 500})
+        assert manager.get_cache_stats().entries == 0
+
+        await manager.call_tool("text", {"n": 40})
+        await manager.call_tool("text", {"n": 41})
+        await manager.call_tool("text", {"n": 42})
+        stats = manager.get_cache_stats()
+        assert stats.bytes <= 100
+        assert stats.evictions >= 1
+
+    async def test_invalidate_from_context(self):
+        mcp = FastMCP()
+        value = 1
+
+        @mcp.tool(cache_ttl=60)
+        def get_value() -> int:
+            return value
+
+        @mcp.tool
+        def set_value(new: int, ctx: Context) -> None:
+            nonlocal value
+            value = new
+            ctx.invalidate_tool_cache("get_value")
+
+        async with Client(mcp) as client:
+            assert (await client.call_tool("get_value")).data == 1
+            value = 2
+            assert (await client.call_tool("get_value")).data == 1
+            await client.call_tool("set_value", {"new": 3})
+            assert (await client.call_tool("get_value")).data == 3
+        assert mcp.get_tool_cache_stats().hits == 1
+
+    async def test_invalidate_mounted_tool(self):
+        parent = FastMCP("Parent")
+        child = FastMCP("Child")
+        value = 1
+
+        @child.tool(cache_ttl=60)
+        def get_value() -> int:
+            return value
+
+        @parent.tool
+        def reset(ctx: Context) -> None:
+            ctx.invalidate_tool_cache("child_get_value")
+
+        parent.mount(child, prefix="child")
+
+        async with Client(parent) as client:
+            assert (await client.call_tool("child_get_value")).data == 1
+            value = 2
+            assert (await client.call_tool("child_get_value")).data == 1
+            await client.call_tool("reset")
+            assert (await client.call_tool("child_get_value")).data == 2
+
+    def test_invalid_ttl(self):
+        def tool() -> None:
+            pass
+
+        with pytest.raises(ValidationError):
+            Tool.from_function(tool, cache_ttl=0)
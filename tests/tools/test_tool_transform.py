@@ -18,6 +18,8 @@ from fastmcp.tools.tool_transform import (
     ArgTransform,
     ToolTransformConfig,
     TransformedTool,
+    TransformedToolCache,
+    apply_transformations_to_tools,
 )
 
 
@@ -1473,6 +1475,126 @@ def test_tool_transform_config_removes_meta(sample_tool):
     assert transformed.meta is None
 
 
+def test_apply_transformations_reuses_transformed_tool(sample_tool):
+    """Test that repeated loads reuse the transformed tool for the same source."""
+    transformations = {sample_tool.name: ToolTransformConfig(name="config_tool")}
+    cache = TransformedToolCache()
+
+    first = apply_transformations_to_tools(
+        {sample_tool.name: sample_tool}, transformations, cache
+    )
+    second = apply_transformations_to_tools(
+        {sample_tool.name: sample_tool}, transformations, cache
+    )
+    assert first["config_tool"] is second["config_tool"]
+
+
+def test_apply_transformations_rebuilds_for_new_source(sample_tool):
+    """Test that a different source tool or a toggled source is re-transformed."""
+    transformations = {sample_tool.name: ToolTransformConfig(name="config_tool")}
+    cache = TransformedToolCache()
+
+    first = apply_transformations_to_tools(
+        {sample_tool.name: sample_tool}, transformations, cache
+    )["config_tool"]
+
+    sample_tool.disable()
+    disabled = apply_transformations_to_tools(
+        {sample_tool.name: sample_tool}, transformations, cache
+    )["config_tool"]
+    assert disabled is not first
+    assert not disabled.enabled
+
+    changed_tool = sample_tool.model_copy(update={"description": "changed"})
+    changed = apply_transformations_to_tools(
+        {sample_tool.name: changed_tool}, transformations, cache
+    )["config_tool"]
+    assert changed is not disabled
+    assert changed.parent_tool is changed_tool
+
+    sample_tool.tags.add("new")
+    retagged = apply_transformations_to_tools(
+        {sample_tool.name: sample_tool}, transformations, cache
+    )["config_tool"]
+    assert retagged is not disabled
+
+
+def test_apply_transformations_reuses_for_shallow_copies(sample_tool):
+    """Test that copies with the same key and fields share a transformed tool."""
+    transformations = {sample_tool.name: ToolTransformConfig(name="config_tool")}
+    cache = TransformedToolCache()
+
+    first = apply_transformations_to_tools(
+        {sample_tool.name: sample_tool.model_copy()}, transformations, cache
+    )["config_tool"]
+    second = apply_transformations_to_tools(
+        {sample_tool.name: sample_tool.model_copy()}, transformations, cache
+    )["config_tool"]
+    assert first is second
+
+    prefixed = apply_transformations_to_tools(
+        {sample_tool.name: sample_tool.model_copy(key="prefix_tool")},
+        transformations,
+        cache,
+    )["config_tool"]
+    assert prefixed is not first
+
+
+def test_apply_transformations_reuses_only_for_the_same_config(sample_tool):
+    """Test that a replaced config re-transforms, and that configs stay plain data."""
+    config = ToolTransformConfig(name="config_tool")
+    cache = TransformedToolCache()
+
+    first = apply_transformations_to_tools(
+        {sample_tool.name: sample_tool}, {sample_tool.name: config}, cache
+    )["config_tool"]
+    replaced = apply_transformations_to_tools(
+        {sample_tool.name: sample_tool},
+        {sample_tool.name: ToolTransformConfig(name="config_tool")},
+        cache,
+    )["config_tool"]
+    assert replaced is not first
+
+    assert config == ToolTransformConfig(name="config_tool")
+    assert config.model_copy() == config
+
+
+async def test_mounted_prefixed_tool_transformation_is_memoized():
+    """Test that listing a transformed, mounted tool doesn't re-transform it."""
+    from unittest.mock import patch
+
+    from fastmcp import FastMCP
+    from fastmcp.server.middleware import Middleware
+
+    class PassThrough(Middleware):
+        async def on_message(self, context, call_next):
+            return await call_next(context)
+
+    child = FastMCP()
+
+    @child.tool
+    def add(a: int, b: int) -> int:
+        return a + b
+
+    parent = FastMCP(
+        tool_transformations={"child_add": ToolTransformConfig(name="plus")}
+    )
+    parent.add_middleware(PassThrough())
+    parent.mount(child, prefix="child")
+
+    with patch.object(
+        ToolTransformConfig,
+        "apply",
+        autospec=True,
+        side_effect=ToolTransformConfig.apply,
+    ) as apply:
+        for _ in range(5):
+            tools = await parent._list_tools()
+            assert [tool.name for tool in tools] == ["plus"]
+        assert (await parent.get_tool("plus")).name == "plus"
+    assert apply.call_count == 1
+
+
 class TestInputSchema:
     """Test schema definition handling and reference finding."""
 
@@ -0,0 +1,194 @@
+from dataclasses import replace
+from unittest.mock import Mock, patch
+
+import pytest
+from pydantic import ValidationError
+
+from fastmcp import FastMCP
+from fastmcp.prompts.prompt import Prompt
+from fastmcp.resources.resource import FunctionResource
+from fastmcp.resources.template import ResourceTemplate
+from fastmcp.server.context import Context
+from fastmcp.tools.tool import Tool
+from fastmcp.utilities.call_plan import CallPlan
+
+
+@pytest.fixture
+async def context():
+    async with Context(fastmcp=FastMCP()) as context:
+        yield context
+
+
+class TestCallPlan:
+    def test_from_function(self):
+        async def fn(x: int, ctx: Context) -> int:
+            return x
+
+        plan = CallPlan.from_function(fn)
+        assert plan.fn is fn
+        assert plan.context_kwarg == "ctx"
+        assert plan.is_async is True
+        assert plan.validator is not None
+        assert list(plan.parameters) == ["x", "ctx"]
+
+    def test_from_function_without_validation(self):
+        def fn(x: int) -> int:
+            return x
+
+        plan = CallPlan.from_function(fn, validate=False)
+        assert plan.context_kwarg is None
+        assert plan.is_async is False
+        assert plan.validator is None
+
+    def test_inject_does_not_copy_without_context_kwarg(self):
+        def fn(x: int) -> int:
+            return x
+
+        arguments = {"x": 1}
+        assert CallPlan.from_function(fn).inject(arguments) is arguments
+
+    def test_inject_does_not_copy_when_context_provided(self, context):
+        def fn(x: int, ctx: Context) -> int:
+            return x
+
+        arguments = {"x": 1, "ctx": context}
+        assert CallPlan.from_function(fn).inject(arguments) is arguments
+
+    def test_inject_copies_when_adding_context(self, context):
+        def fn(x: int, ctx: Context) -> int:
+            return x
+
+        arguments = {"x": 1}
+        injected = CallPlan.from_function(fn).inject(arguments)
+        assert injected == {"x": 1, "ctx": context}
+        assert arguments == {"x": 1}
+
+    async def test_call_validates_arguments(self):
+        def fn(x: int) -> int:
+            return x * 2
+
+        assert await CallPlan.from_function(fn).call({"x": "2"}) == 4
+
+    async def test_call_validates_strictly(self, context):
+        def fn(x: int, ctx: Context) -> Context:
+            return ctx
+
+        plan = CallPlan.from_function(fn)
+        assert await plan.call({"x": 2}, strict=True) is context
+        with pytest.raises(ValidationError, match="valid integer"):
+            await plan.call({"x": "2"}, strict=True)
+
+    async def test_call_awaits_sync_function_returning_awaitable(self):
+        async def inner() -> int:
+            return 1
+
+        plan = CallPlan.from_function(lambda: inner(), validate=False)
+        assert await plan.call({}) == 1
+
+
+class TestComponentCallPlans:
+    def test_plan_built_once_in_from_function(self):
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        with patch.object(
+            CallPlan, "from_function", wraps=CallPlan.from_function
+        ) as from_function:
+            tool = Tool.from_function(add)
+            assert from_function.call_count == 1
+
+            plan = tool._get_call_plan()
+            assert tool._get_call_plan() is plan
+            assert from_function.call_count == 1
+
+    async def test_plan_reused_across_runs(self):
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        tool = Tool.from_function(add)
+        plan = tool._get_call_plan()
+
+        with patch.object(CallPlan, "from_function") as from_function:
+            await tool.run({"a": 1, "b": 2})
+            await tool.run({"a": 3, "b": 4})
+            from_function.assert_not_called()
+        assert tool._get_call_plan() is plan
+
+    async def test_plan_rebuilt_when_fn_replaced(self):
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        def multiply(a: int, b: int) -> int:
+            return a * b
+
+        tool = Tool.from_function(add)
+        old_plan = tool._get_call_plan()
+
+        tool.fn = multiply
+        assert tool._get_call_plan() is not old_plan
+        assert tool._get_call_plan().fn is multiply
+        result = await tool.run({"a": 2, "b": 3})
+        assert result.structured_content == {"result": 6}
+
+    def test_plan_rebuilt_when_executor_replaced(self):
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        tool = Tool.from_function(add)
+        assert tool._get_call_plan().executor is None
+
+        tool.executor = "inline"
+        assert tool._get_call_plan().executor == "inline"
+
+    async def test_tool_does_not_copy_arguments_without_context(self):
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        tool = Tool.from_function(add)
+        arguments = {"a": 1, "b": 2}
+        plan = tool._get_call_plan()
+
+        validator = Mock(validate_python=Mock(return_value=3))
+        tool._call_plan = replace(plan, validator=validator)
+
+        await tool.run(arguments)
+        assert validator.validate_python.call_args.args[0] is arguments
+
+
+class TestContextInjection:
+    async def test_tool(self, context):
+        def tool_fn(x: int, ctx: Context) -> str:
+            assert ctx is context
+            return str(x)
+
+        tool = Tool.from_function(tool_fn)
+        result = await tool.run({"x": 1})
+        assert result.structured_content == {"result": "1"}
+
+    async def test_prompt(self, context):
+        def prompt_fn(x: int, ctx: Context) -> str:
+            assert ctx is context
+            return f"x is {x}"
+
+        prompt = Prompt.from_function(prompt_fn)
+        messages = await prompt.render({"x": "1"})
+        assert messages[0].content.text == "x is 1"  # type: ignore[attr-defined]
+
+    async def test_resource(self, context):
+        def resource_fn(ctx: Context) -> str:
+            assert ctx is context
+            return "data"
+
+        resource = FunctionResource.from_function(resource_fn, uri="test://data")
+        assert await resource.read() == "data"
+
+    async def test_template(self, context):
+        def template_fn(x: int, ctx: Context) -> str:
+            assert ctx is context
+            return str(x)
+
+        template = ResourceTemplate.from_function(
+            template_fn, uri_template="test://{x}", name="test"
+        )
+        resource = await template.create_resource("test://42", {"x": "42"})
+        assert await resource.read() == "42"
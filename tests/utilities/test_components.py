@@ -4,6 +4,7 @@ import pytest
 from pydantic import ValidationError
 
 from fastmcp.utilities.components import (
+    ComponentStateSnapshot,
     FastMCPComponent,
     FastMCPMeta,
     MirroredComponent,
@@ -436,3 +437,33 @@ class TestEdgeCasesAndIntegration:
         assert deep_copy.meta is not None
         deep_copy.meta["nested"]["value"] = 3
         assert component.meta["nested"]["value"] == 1  # Original unaffected
+
+
+class TestComponentStateSnapshot:
+    """Tests for the ComponentStateSnapshot class."""
+
+    def test_matches_unchanged_components(self):
+        components = [
+            FastMCPComponent(name="a", tags={"x"}, meta={"k": {"v": 1}}),
+            FastMCPComponent(name="b"),
+        ]
+        assert ComponentStateSnapshot(components).matches(components)
+
+    def test_detects_in_place_edits(self):
+        component = FastMCPComponent(name="a", tags={"x"}, meta={"k": {"v": 1}})
+        snapshot = ComponentStateSnapshot([component])
+
+        component.tags.add("y")
+        assert not snapshot.matches([component])
+        component.tags.discard("y")
+        assert snapshot.matches([component])
+
+        component.meta["k"]["v"] = 2  # type: ignore[index]
+        assert not snapshot.matches([component])
+
+    def test_detects_added_and_removed_components(self):
+        a = FastMCPComponent(name="a")
+        b = FastMCPComponent(name="b")
+        snapshot = ComponentStateSnapshot([a])
+        assert not snapshot.matches([a, b])
+        assert not snapshot.matches([])
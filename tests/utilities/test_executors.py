@@ -0,0 +1,208 @@
+import os
+import threading
+
+import anyio
+import pytest
+from pydantic import ValidationError
+
+from fastmcp import Client, FastMCP
+from fastmcp.server.context import Context
+from fastmcp.tools.tool import Tool
+from fastmcp.utilities.executors import (
+    WorkerPoolStats,
+    WorkerProcessPool,
+    WorkerThreadPool,
+    get_import_path,
+    get_worker_pool,
+)
+from fastmcp.utilities.tests import temporary_settings
+
+# functions run by worker processes must be importable, so they are defined at
+# the top level of this module
+
+process_server = FastMCP("ProcessServer")
+
+
+def get_pid() -> int:
+    return os.getpid()
+
+
+def add(a: int, b: int) -> int:
+    return a + b
+
+
+def uses_context(ctx: Context) -> int:
+    return 1
+
+
+@process_server.tool(executor="process")
+def decorated_get_pid() -> int:
+    return os.getpid()
+
+
+@pytest.fixture
+def process_pool():
+    pool = WorkerProcessPool(1)
+    yield pool
+    pool.shutdown()
+
+
+class TestWorkerThreadPool:
+    async def test_runs_in_worker_thread(self):
+        pool = WorkerThreadPool(2)
+        assert await pool.run(threading.get_ident) != threading.get_ident()
+
+    async def test_returns_result_and_raises_errors(self):
+        pool = WorkerThreadPool(2)
+        assert await pool.run(pow, 2, 3) == 8
+        with pytest.raises(ZeroDivisionError):
+            await pool.run(divmod, 1, 0)
+        assert pool.stats().completed == 2
+
+    async def test_stats_report_running_and_queued(self):
+        pool = WorkerThreadPool(1)
+        assert pool.stats() == WorkerPoolStats(
+            max_workers=1, running=0, queued=0, completed=0
+        )
+
+        release = threading.Event()
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(pool.run, release.wait)
+            tg.start_soon(pool.run, release.wait)
+            with anyio.fail_after(1):
+                while pool.stats().queued < 1:
+                    await anyio.sleep(0.01)
+            assert pool.stats() == WorkerPoolStats(
+                max_workers=1, running=1, queued=1, completed=0
+            )
+            release.set()
+
+        assert pool.stats() == WorkerPoolStats(
+            max_workers=1, running=0, queued=0, completed=2
+        )
+
+    async def test_cancelled_call_keeps_its_worker_until_it_finishes(self):
+        pool = WorkerThreadPool(1)
+        release = threading.Event()
+
+        with anyio.move_on_after(0.05):
+            await pool.run(release.wait)
+        assert pool.stats() == WorkerPoolStats(
+            max_workers=1, running=1, queued=0, completed=1
+        )
+
+        # the abandoned thread still occupies the only worker
+        with anyio.move_on_after(0.05) as scope:
+            await pool.run(threading.get_ident)
+        assert scope.cancelled_caught
+
+        release.set()
+        with anyio.fail_after(1):
+            await pool.run(threading.get_ident)
+        assert pool.stats() == WorkerPoolStats(
+            max_workers=1, running=0, queued=0, completed=2
+        )
+
+    async def test_call_cancelled_while_queued_never_runs(self):
+        pool = WorkerThreadPool(1)
+        release = threading.Event()
+        ran = threading.Event()
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(pool.run, release.wait)
+            with anyio.fail_after(1):
+                while pool.stats().running < 1:
+                    await anyio.sleep(0.01)
+            with anyio.move_on_after(0.05):
+                await pool.run(ran.set)
+            release.set()
+
+        assert not ran.is_set()
+        assert pool.stats().running == 0
+
+
+class TestGetWorkerPool:
+    async def test_uses_server_pool_and_executor(self):
+        server = FastMCP(sync_executor="thread", sync_worker_threads=3)
+        async with Context(fastmcp=server):
+            assert get_worker_pool(None) is server.worker_pool
+            assert get_worker_pool("inline") is None
+
+        server = FastMCP()
+        async with Context(fastmcp=server):
+            assert get_worker_pool(None) is None
+            assert get_worker_pool("thread") is server.worker_pool
+
+    def test_falls_back_to_settings_outside_a_request(self):
+        assert get_worker_pool(None) is None
+        assert get_worker_pool("thread") is not None
+        with temporary_settings(sync_executor="thread"):
+            assert get_worker_pool(None) is not None
+            assert get_worker_pool("inline") is None
+
+
+@pytest.mark.timeout(15)
+class TestWorkerProcessPool:
+    async def test_runs_in_worker_process(self, process_pool: WorkerProcessPool):
+        assert await process_pool.run(get_pid, {}) != os.getpid()
+
+    async def test_workers_stay_warm(self, process_pool: WorkerProcessPool):
+        first = await process_pool.run(get_pid, {})
+        assert await process_pool.run(get_pid, {}) == first
+        assert process_pool.stats() == WorkerPoolStats(
+            max_workers=1, running=0, queued=0, completed=2
+        )
+
+    async def test_validates_arguments(self, process_pool: WorkerProcessPool):
+        assert await process_pool.run(add, {"a": "1", "b": 2}) == 3
+        with pytest.raises(ValidationError):
+            await process_pool.run(add, {"a": "one", "b": 2})
+
+    async def test_without_validation(self, process_pool: WorkerProcessPool):
+        assert await process_pool.run(add, {"a": "1", "b": "2"}, validate=False) == "12"
+
+    async def test_decorated_tool(self):
+        try:
+            async with Client(process_server) as client:
+                result = await client.call_tool("decorated_get_pid")
+            assert result.data != os.getpid()
+            assert process_server.process_pool.stats().completed == 1
+        finally:
+            process_server.process_pool.shutdown()
+
+    async def test_tool_from_function(self):
+        mcp = FastMCP(process_workers=1)
+        mcp.add_tool(Tool.from_function(add, executor="process"))
+        try:
+            async with Client(mcp) as client:
+                result = await client.call_tool("add", {"a": 1, "b": 2})
+            assert result.data == 3
+        finally:
+            mcp.process_pool.shutdown()
+
+
+class TestProcessExecutorValidation:
+    def test_import_path(self):
+        assert get_import_path(add) == (__name__, "add")
+
+    def test_rejects_lambda(self):
+        with pytest.raises(ValueError, match="can't be imported by name"):
+            Tool.from_function(lambda x: x, name="double", executor="process")
+
+    def test_rejects_nested_function(self):
+        def nested() -> int:
+            return 1
+
+        with pytest.raises(ValueError, match="can't be imported by name"):
+            Tool.from_function(nested, executor="process")
+
+    def test_rejects_context(self):
+        with pytest.raises(ValueError, match="takes a Context"):
+            Tool.from_function(uses_context, executor="process")
+
+    def test_rejects_async(self):
+        async def async_fn() -> int:
+            return 1
+
+        with pytest.raises(ValueError, match="is async"):
+            Tool.from_function(async_fn, executor="process")
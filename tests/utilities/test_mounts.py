@@ -0,0 +1,53 @@
+"""Tests for fastmcp.utilities.mounts module."""
+
+from fastmcp import FastMCP
+from fastmcp.server.server import MountedServer
+from fastmcp.utilities.mounts import MountRouter
+
+
+def make_mount(prefix: str | None) -> MountedServer:
+    return MountedServer(prefix=prefix, server=FastMCP(f"Server-{prefix}"))
+
+
+class TestMountRouter:
+    """Tests for the MountRouter prefix index."""
+
+    def test_resolve_prefixed_key(self):
+        router = MountRouter()
+        weather = make_mount("weather")
+        news = make_mount("news")
+        router.add(weather)
+        router.add(news)
+
+        assert router.resolve("weather_forecast") == [(weather, "forecast")]
+        assert router.resolve("news_get_headlines") == [(news, "get_headlines")]
+
+    def test_resolve_unknown_prefix(self):
+        router = MountRouter()
+        router.add(make_mount("weather"))
+
+        assert router.resolve("sports_scores") == []
+        assert router.resolve("weather") == []
+
+    def test_unprefixed_mounts_always_match(self):
+        router = MountRouter()
+        plain = make_mount(None)
+        router.add(plain)
+
+        assert router.resolve("anything") == [(plain, "anything")]
+
+    def test_later_mounts_come_first(self):
+        router = MountRouter()
+        plain = make_mount(None)
+        outer = make_mount("a")
+        inner = make_mount("a_b")
+        same = make_mount("a")
+        for mounted in (plain, outer, inner, same):
+            router.add(mounted)
+
+        assert router.resolve("a_b_tool") == [
+            (same, "b_tool"),
+            (inner, "tool"),
+            (outer, "b_tool"),
+            (plain, "a_b_tool"),
+        ]
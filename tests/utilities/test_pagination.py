@@ -0,0 +1,104 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from fastmcp.utilities import pagination
+from fastmcp.utilities.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    listing_fingerprint,
+    paginate,
+)
+
+
+def identity(item: str) -> str:
+    return item
+
+
+class TestPaginate:
+    def test_without_page_size_returns_everything(self):
+        page, next_cursor = paginate(["a", "b", "c"], None, None, key=identity)
+        assert page == ["a", "b", "c"]
+        assert next_cursor is None
+
+    def test_without_page_size_rejects_cursor(self):
+        with pytest.raises(InvalidCursorError):
+            paginate(["a"], "abc", None, key=identity)
+
+    def test_follows_cursors_to_the_end(self):
+        items = [str(i) for i in range(7)]
+        pages = []
+        cursor = None
+        while True:
+            page, cursor = paginate(items, cursor, 3, key=identity)
+            pages.append(page)
+            if cursor is None:
+                break
+        assert pages == [["0", "1", "2"], ["3", "4", "5"], ["6"]]
+
+    def test_exact_multiple_has_no_trailing_empty_page(self):
+        page, cursor = paginate(["a", "b"], None, 2, key=identity)
+        assert page == ["a", "b"]
+        assert cursor is None
+
+    def test_empty_listing(self):
+        assert paginate([], None, 2, key=identity) == ([], None)
+
+    def test_cursor_rejected_after_listing_changes(self):
+        _, cursor = paginate(["a", "b", "c"], None, 2, key=identity)
+        assert cursor is not None
+        with pytest.raises(InvalidCursorError, match="listing has changed"):
+            paginate(["a", "b", "c", "d"], cursor, 2, key=identity)
+
+    def test_cursor_rejected_after_reordering(self):
+        _, cursor = paginate(["a", "b", "c"], None, 2, key=identity)
+        assert cursor is not None
+        with pytest.raises(InvalidCursorError):
+            paginate(["c", "b", "a"], cursor, 2, key=identity)
+
+    @pytest.mark.parametrize("cursor", ["", "not base64!", "Zm9v", "YTpi"])
+    def test_malformed_cursor(self, cursor):
+        with pytest.raises(InvalidCursorError, match="Invalid cursor"):
+            paginate(["a", "b", "c"], cursor, 2, key=identity)
+
+
+class TestCursorEncoding:
+    def test_round_trip(self):
+        fingerprint = listing_fingerprint(["a", "b"], key=identity)
+        assert decode_cursor(encode_cursor(fingerprint, 5), fingerprint) == 5
+
+    def test_negative_offset_rejected(self):
+        fingerprint = listing_fingerprint(["a"], key=identity)
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(encode_cursor(fingerprint, -1), fingerprint)
+
+    def test_fingerprint_is_stable(self):
+        """Cursors must survive restarts, so the fingerprint can't use hash()."""
+        assert listing_fingerprint(["a", "b", "c"], key=identity) == "0101b449ad84cde8"
+
+    def test_fingerprint_is_the_same_across_processes(self):
+        # run the module standalone so the subprocesses don't import fastmcp
+        code = (
+            Path(pagination.__file__).read_text()
+            + "\nprint(listing_fingerprint(['a', 'b', 'c'], key=str))"
+        )
+        fingerprints = {
+            subprocess.run(
+                [sys.executable, "-c", code],
+                capture_output=True,
+                text=True,
+                check=True,
+                env=os.environ | {"PYTHONHASHSEED": seed},
+            ).stdout.strip()
+            for seed in ("1", "2")
+        }
+        assert fingerprints == {listing_fingerprint(["a", "b", "c"], key=identity)}
+
+    def test_fingerprint_separates_keys(self):
+        assert listing_fingerprint(["ab"], key=identity) != listing_fingerprint(
+            ["a", "b"], key=identity
+        )
@@ -1,4 +1,5 @@
 import base64
+import mmap
 import os
 import tempfile
 from pathlib import Path
@@ -216,6 +217,26 @@ class TestImage:
         assert content.mimeType == "image/jpeg"
         assert content.data == base64.b64encode(test_data).decode()
 
+    def test_to_image_content_with_buffer_data(self, tmp_path):
+        """Test conversion to ImageContent from buffers that aren't bytes."""
+        test_data = b"fake image data"
+        img = Image(data=memoryview(test_data))
+        assert img.to_image_content().data == base64.b64encode(test_data).decode()
+
+        img_path = tmp_path / "test.png"
+        img_path.write_bytes(test_data)
+        with open(img_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                content = Image(data=mapped).to_image_content()
+        assert content.data == base64.b64encode(test_data).decode()
+
+    def test_to_image_content_with_empty_file(self, tmp_path):
+        """Test conversion to ImageContent from an empty file."""
+        img_path = tmp_path / "empty.png"
+        img_path.write_bytes(b"")
+
+        assert Image(path=img_path).to_image_content().data == ""
+
     def test_to_image_content_error(self, monkeypatch):
         """Test error case in to_image_content."""
         # Create an Image with neither path nor data (shouldn't happen due to __init__ checks,
@@ -450,6 +471,30 @@ class TestFile:
         assert resource.resource.mimeType == "text/plain"
         assert resource.resource.text == "hello world"
 
+    def test_to_resource_content_with_buffer_data(self):
+        """Test conversion to ResourceContent from a memoryview."""
+        test_data = "héllo".encode()
+        resource = File(
+            data=memoryview(test_data), format="plain"
+        ).to_resource_content()
+        assert isinstance(resource.resource, TextResourceContents)
+        assert resource.resource.text == "héllo"
+
+        resource = File(data=memoryview(test_data), format="pdf").to_resource_content()
+        assert isinstance(resource.resource, BlobResourceContents)
+        assert resource.resource.blob == base64.b64encode(test_data).decode()
+
+    def test_to_resource_content_with_binary_path(self, tmp_path):
+        """Test conversion to a blob ResourceContent from a file."""
+        file_path = tmp_path / "test.bin"
+        test_data = bytes(range(256))
+        file_path.write_bytes(test_data)
+
+        resource = File(path=file_path).to_resource_content()
+
+        assert isinstance(resource.resource, BlobResourceContents)
+        assert resource.resource.blob == base64.b64encode(test_data).decode()
+
     def test_to_resource_content_error(self, monkeypatch):
         """Test error case in to_resource_content."""
         file = File(data=b"test")